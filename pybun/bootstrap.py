@@ -33,7 +33,21 @@ def cache_root() -> str:
     return os.environ.get("PYBUN_HOME") or os.path.join(os.path.expanduser("~"), ".cache", "pybun")
 
 
+def _confstr_glibc_version() -> Optional[str]:
+    """Return the running glibc version from confstr, without spawning ldd."""
+    try:
+        value = os.confstr("CS_GNU_LIBC_VERSION")
+    except (AttributeError, ValueError, OSError):
+        return None
+    # e.g. "glibc 2.36"
+    if value and value.lower().startswith("glibc "):
+        return value.split(None, 1)[1]
+    return None
+
+
 def detect_musl() -> bool:
+    if _confstr_glibc_version():
+        return False
     libc, _ = platform.libc_ver()
     if libc and "musl" in libc.lower():
         return True
@@ -49,6 +63,9 @@ def detect_musl() -> bool:
 
 
 def detect_glibc_version() -> Optional[str]:
+    version = _confstr_glibc_version()
+    if version:
+        return version
     libc, version = platform.libc_ver()
     if (libc or "").lower().startswith("glibc") and version:
         return version
@@ -152,11 +169,19 @@ def load_manifest(source: str) -> Dict[str, Any]:
     raise BootstrapError(f"manifest not found: {source}")
 
 
-def select_asset(manifest: Dict[str, Any], target: str) -> Dict[str, Any]:
+def _asset_index(manifest: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Map target -> asset; the first asset listed for a target wins."""
+    index: Dict[str, Dict[str, Any]] = {}
     for asset in manifest.get("assets", []):
-        if asset.get("target") == target:
-            return asset
-    raise BootstrapError(f"no asset for target: {target}")
+        index.setdefault(asset.get("target"), asset)
+    return index
+
+
+def select_asset(manifest: Dict[str, Any], target: str) -> Dict[str, Any]:
+    asset = _asset_index(manifest).get(target)
+    if asset is None:
+        raise BootstrapError(f"no asset for target: {target}")
+    return asset
 
 
 def _parse_semver_like(value: str) -> Tuple[int, int, int]:
@@ -178,11 +203,10 @@ def select_asset_with_fallback(manifest: Dict[str, Any], target: str) -> Dict[st
       - PYBUN_PYPI_PREFER_MUSL=1 (prefer musl on x86_64)
       - PYBUN_PYPI_NO_FALLBACK=1 (disable automatic musl fallback)
     """
+    index = _asset_index(manifest)
+
     # Direct selection
-    try:
-        asset = select_asset(manifest, target)
-    except BootstrapError:
-        asset = None
+    asset = index.get(target)
 
     # Non-Linux or non-gnu targets: return whatever we found (or raise)
     if not (target.endswith("-unknown-linux-gnu") or target.endswith("-pc-windows-msvc") or target.endswith("-apple-darwin")):
@@ -193,11 +217,9 @@ def select_asset_with_fallback(manifest: Dict[str, Any], target: str) -> Dict[st
     # If target is linux-gnu and prefer musl explicitly
     if target.endswith("-unknown-linux-gnu") and _bool_env("PYBUN_PYPI_PREFER_MUSL"):
         musl_target = target.replace("-unknown-linux-gnu", "-unknown-linux-musl")
-        try:
-            return select_asset(manifest, musl_target)
-        except BootstrapError:
-            # fallthrough to gnu
-            pass
+        if musl_target in index:
+            return index[musl_target]
+        # fallthrough to gnu
 
     # If we have an asset and it's OK, return it; else try fallback based on min_glibc
     if asset and target.endswith("-unknown-linux-gnu"):
@@ -209,10 +231,8 @@ def select_asset_with_fallback(manifest: Dict[str, Any], target: str) -> Dict[st
                     # try musl fallback (x86_64 only for now)
                     if target.startswith("x86_64-"):
                         musl_target = target.replace("-unknown-linux-gnu", "-unknown-linux-musl")
-                        try:
-                            return select_asset(manifest, musl_target)
-                        except BootstrapError:
-                            pass
+                        if musl_target in index:
+                            return index[musl_target]
     if asset:
         return asset
     raise BootstrapError(f"no asset for target: {target}")
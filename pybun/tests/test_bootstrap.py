@@ -5,6 +5,7 @@ import os
 import tarfile
 import tempfile
 import unittest
+from unittest import mock
 
 from pybun import bootstrap
 
@@ -23,6 +24,20 @@ class DetectTargetTests(unittest.TestCase):
         self.assertEqual(target, "x86_64-unknown-linux-gnu")
 
 
+class DetectLibcTests(unittest.TestCase):
+    def test_glibc_version_from_confstr_skips_ldd(self):
+        with mock.patch.object(bootstrap.os, "confstr", return_value="glibc 2.36", create=True), \
+                mock.patch.object(bootstrap.subprocess, "check_output") as check_output:
+            self.assertEqual(bootstrap.detect_glibc_version(), "2.36")
+            self.assertFalse(bootstrap.detect_musl())
+        check_output.assert_not_called()
+
+    def test_non_glibc_confstr_falls_back(self):
+        with mock.patch.object(bootstrap.os, "confstr", side_effect=ValueError, create=True), \
+                mock.patch.object(bootstrap.platform, "libc_ver", return_value=("glibc", "2.31")):
+            self.assertEqual(bootstrap.detect_glibc_version(), "2.31")
+
+
 class SelectAssetTests(unittest.TestCase):
     def test_select_asset_by_target(self):
         manifest = {
@@ -43,6 +58,16 @@ class SelectAssetTests(unittest.TestCase):
         with self.assertRaises(bootstrap.BootstrapError):
             bootstrap.select_asset(manifest, "aarch64-apple-darwin")
 
+    def test_select_asset_first_listed_target_wins(self):
+        manifest = {
+            "assets": [
+                {"name": "first.tgz", "target": "aarch64-apple-darwin"},
+                {"name": "second.tgz", "target": "aarch64-apple-darwin"},
+            ]
+        }
+        asset = bootstrap.select_asset(manifest, "aarch64-apple-darwin")
+        self.assertEqual(asset["name"], "first.tgz")
+
 
 class FallbackSelectionTests(unittest.TestCase):
     def setUp(self):
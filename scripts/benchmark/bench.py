@@ -9,37 +9,39 @@ Usage:
     python bench.py --list              # List available scenarios
     python bench.py -o results/         # Specify output directory
     python bench.py --format markdown   # Output format (json, markdown, csv)
+    python bench.py -j 4                # Run up to 4 scenarios in parallel
 """
 
 from __future__ import annotations
 
 import argparse
+import contextlib
+import functools
 import json
 import os
-import platform
-import shutil
+import select
+import signal
 import subprocess
 import sys
 import time
+from collections import defaultdict
 from dataclasses import dataclass, field, asdict
-from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Sequence
 
-# Try to import tomllib (Python 3.11+) or fall back to toml
-try:
-    import tomllib
-except ImportError:
-    try:
-        import toml as tomllib  # type: ignore
-    except ImportError:
-        print("Error: Please install toml package: pip install toml")
-        sys.exit(1)
+# platform, shutil, datetime and tomllib are imported inside the functions that
+# use them so `--list` / `--help` don't pay for them.
+if TYPE_CHECKING:
+    from datetime import datetime
 
 
 # === Data Classes ===
 
-@dataclass
+# __slots__ via dataclass requires Python 3.10; 3.9 gets plain dataclasses.
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class SystemInfo:
     """System information for benchmark context."""
     os: str
@@ -52,44 +54,28 @@ class SystemInfo:
     timestamp: str
 
     @classmethod
-    def collect(cls) -> "SystemInfo":
-        """Collect current system information."""
+    def collect(cls, now: datetime | None = None) -> "SystemInfo":
+        """Collect current system information, timestamped with `now` (UTC)."""
         import platform
+        from datetime import datetime, timezone
         
         # Try to get CPU info
         cpu = platform.processor() or "Unknown"
         if sys.platform == "darwin":
-            try:
-                result = subprocess.run(
-                    ["sysctl", "-n", "machdep.cpu.brand_string"],
-                    capture_output=True, text=True, timeout=5
-                )
-                if result.returncode == 0:
-                    cpu = result.stdout.strip()
-            except Exception:
-                pass
+            brand = _darwin_sysctl("machdep.cpu.brand_string")
+            if brand:
+                cpu = brand.split(b"\0", 1)[0].decode("utf-8", errors="replace").strip()
         
-        # Get memory (platform-specific)
+        # Get memory (platform-specific), in-process rather than via sysctl(8)
         memory_gb = 0.0
         if sys.platform == "darwin":
-            try:
-                result = subprocess.run(
-                    ["sysctl", "-n", "hw.memsize"],
-                    capture_output=True, text=True, timeout=5
-                )
-                if result.returncode == 0:
-                    memory_gb = int(result.stdout.strip()) / (1024**3)
-            except Exception:
-                pass
+            memsize = _darwin_sysctl("hw.memsize")
+            if memsize:
+                memory_gb = int.from_bytes(memsize, sys.byteorder) / (1024**3)
         elif sys.platform == "linux":
             try:
-                with open("/proc/meminfo") as f:
-                    for line in f:
-                        if line.startswith("MemTotal:"):
-                            kb = int(line.split()[1])
-                            memory_gb = kb / (1024**2)
-                            break
-            except Exception:
+                memory_gb = os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") / (1024**3)
+            except (ValueError, OSError):
                 pass
         
         return cls(
@@ -100,11 +86,29 @@ class SystemInfo:
             cpu_count=os.cpu_count() or 1,
             memory_gb=round(memory_gb, 1),
             python_version=platform.python_version(),
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=(now or datetime.now(timezone.utc)).isoformat(),
         )
 
 
-@dataclass
+def _darwin_sysctl(name: str) -> bytes | None:
+    """Read a raw sysctl value via sysctlbyname(3), or None if unavailable."""
+    import ctypes
+
+    try:
+        libc = ctypes.CDLL(None)
+        key = name.encode()
+        size = ctypes.c_size_t(0)
+        if libc.sysctlbyname(key, None, ctypes.byref(size), None, 0) != 0:
+            return None
+        buf = ctypes.create_string_buffer(size.value)
+        if libc.sysctlbyname(key, buf, ctypes.byref(size), None, 0) != 0:
+            return None
+        return buf.raw[: size.value]
+    except Exception:
+        return None
+
+
+@dataclass(**_SLOTS)
 class BenchResult:
     """Single benchmark result."""
     scenario: str
@@ -121,10 +125,23 @@ class BenchResult:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        # Explicit literal rather than asdict(), which deep-copies metadata.
+        return {
+            "scenario": self.scenario,
+            "tool": self.tool,
+            "duration_ms": self.duration_ms,
+            "memory_mb": self.memory_mb,
+            "success": self.success,
+            "iterations": self.iterations,
+            "min_ms": self.min_ms,
+            "max_ms": self.max_ms,
+            "stddev_ms": self.stddev_ms,
+            "metadata": self.metadata,
+            "error": self.error,
+        }
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class BenchReport:
     """Complete benchmark report."""
     meta: dict
@@ -145,21 +162,34 @@ class BenchReport:
 def find_tool(name: str, config: dict) -> str | None:
     """Find tool path from config or PATH."""
     # Check config first
-    paths = config.get("paths", {})
-    if name in paths and paths[name]:
-        path = paths[name]
-        # Resolve relative paths against _base_dir so the result is independent
-        # of the caller's cwd (fixes Issue #157 Problem 1).
-        if not os.path.isabs(path):
-            base_dir = config.get("_base_dir")
-            if base_dir:
-                path = str(Path(base_dir) / path)
-        if os.path.exists(path):
-            return path
-
-    # Check PATH
-    path = shutil.which(name)
-    return path
+    path = config.get("paths", {}).get(name) or None
+    # Resolve relative paths against _base_dir so the result is independent
+    # of the caller's cwd (fixes Issue #157 Problem 1).
+    if path and not os.path.isabs(path):
+        base_dir = config.get("_base_dir")
+        if base_dir:
+            path = str(Path(base_dir) / path)
+    return _resolve_tool(name, path)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_tool(name: str, configured_path: str | None) -> str | None:
+    """Return configured_path if it exists, else the PATH lookup for name.
+
+    Memoized: scenarios look up the same handful of tools repeatedly and
+    neither the configured paths nor PATH change during a run.
+    """
+    if configured_path and os.path.exists(configured_path):
+        return configured_path
+    return _which(name)
+
+
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> str | None:
+    """Memoized shutil.which."""
+    import shutil
+
+    return shutil.which(name)
 
 
 def is_tool_enabled(name: str, config: dict) -> bool:
@@ -168,33 +198,130 @@ def is_tool_enabled(name: str, config: dict) -> bool:
     return tools.get(name, False)
 
 
+def _trim_count(n: int, trim_ratio: float) -> int:
+    """Number of samples to drop from each tail, or 0 if trimming is a no-op."""
+    if trim_ratio <= 0 or not n:
+        return 0
+    trim_n = int(n * trim_ratio)
+    if (trim_n * 2) >= n:
+        return 0
+    return trim_n
+
+
 def trim_samples(samples: list[float], trim_ratio: float) -> list[float]:
     """Trim outliers from samples by removing a ratio from each tail."""
-    if trim_ratio <= 0 or not samples:
-        return samples
-    trim_n = int(len(samples) * trim_ratio)
-    if trim_n == 0 or (trim_n * 2) >= len(samples):
+    trim_n = _trim_count(len(samples), trim_ratio)
+    if trim_n == 0:
         return samples
     sorted_samples = sorted(samples)
     return sorted_samples[trim_n:-trim_n]
 
 
-def compute_stats(samples: list[float], trim_ratio: float = 0.0) -> tuple[float, float, float, float, int]:
+def compute_stats(samples: Sequence[float], trim_ratio: float = 0.0) -> tuple[float, float, float, float, int]:
     """Compute mean/min/max/stddev with optional trimming."""
-    import statistics
+    from math import fsum, sqrt
+    from statistics import fmean
 
     if not samples:
         return 0.0, 0.0, 0.0, 0.0, 0
 
-    trimmed = trim_samples(samples, trim_ratio)
-    if not trimmed:
-        trimmed = samples
+    # Sort once: the trim is a slice and min/max are its endpoints.
+    trim_n = _trim_count(len(samples), trim_ratio)
+    trimmed = sorted(samples)
+    if trim_n:
+        trimmed = trimmed[trim_n:-trim_n]
+
+    n = len(trimmed)
+    avg = fmean(trimmed)
+    stddev = sqrt(fsum((x - avg) ** 2 for x in trimmed) / (n - 1)) if n > 1 else 0.0
+    return avg, trimmed[0], trimmed[-1], stddev, n
+
+
+# posix_spawn + pidfd lets the timed loop skip Popen construction and pipe
+# setup entirely. posix_spawn has no chdir action, so calls with a cwd (and
+# platforms without pidfd_open) go through subprocess.run instead.
+_HAS_SPAWN = hasattr(os, "posix_spawnp") and hasattr(os, "pidfd_open")
+
+
+def _spawn_quiet(cmd: list[str], env: dict | None, timeout: float, stderr_fd: int | None) -> int:
+    """Spawn cmd with stdout on /dev/null and return its exit code."""
+    file_actions = [
+        (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+        (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0)
+        if stderr_fd is None
+        else (os.POSIX_SPAWN_DUP2, stderr_fd, 2),
+    ]
+    pid = os.posix_spawnp(cmd[0], cmd, os.environ if env is None else env, file_actions=file_actions)
+    try:
+        pidfd = os.pidfd_open(pid)
+    except OSError:
+        # Kernel without pidfd support: wait without a timeout.
+        pidfd = None
+    if pidfd is not None:
+        try:
+            ready, _, _ = select.select([pidfd], [], [], timeout)
+        finally:
+            os.close(pidfd)
+        if not ready:
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+            raise subprocess.TimeoutExpired(cmd, timeout)
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status)
+
+
+def _run_quiet(
+    cmd: list[str],
+    env: dict | None,
+    cwd: str | None,
+    timeout: float,
+    stderr_fd: int | None = None,
+) -> int:
+    """Run cmd once with stdout discarded and return its exit code.
+
+    stderr goes to stderr_fd if given, else /dev/null.
+    """
+    if _HAS_SPAWN and cwd is None:
+        return _spawn_quiet(cmd, env, timeout, stderr_fd)
+    return subprocess.run(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL if stderr_fd is None else stderr_fd,
+        timeout=timeout,
+        env=env,
+        cwd=cwd,
+    ).returncode
+
+
+def _read_failure(stderr_fd: int, returncode: int) -> str:
+    """Read the captured stderr of a failed run for diagnostics."""
+    os.lseek(stderr_fd, 0, os.SEEK_SET)
+    stderr = os.read(stderr_fd, 4096).decode("utf-8", errors="replace")[:500]
+    return stderr or f"Exited with code {returncode}"
 
-    avg = statistics.mean(trimmed)
-    min_t = min(trimmed)
-    max_t = max(trimmed)
-    stddev = statistics.stdev(trimmed) if len(trimmed) > 1 else 0.0
-    return avg, min_t, max_t, stddev, len(trimmed)
+
+@contextlib.contextmanager
+def _pinned(cpu: int | None):
+    """
+    Restrict the calling thread, and so every process it spawns, to one CPU.
+
+    Yields the CPU, or None when pinning is off or not possible here.
+    """
+    if cpu is None or not hasattr(os, "sched_setaffinity"):
+        yield None
+        return
+    # On Linux pid 0 is the calling thread, so parallel measurements on other
+    # threads keep their own masks.
+    previous = os.sched_getaffinity(0)
+    try:
+        os.sched_setaffinity(0, {cpu})
+    except OSError:  # not a CPU this process may use
+        previous = None
+    try:
+        yield cpu if previous is not None else None
+    finally:
+        if previous is not None:
+            os.sched_setaffinity(0, previous)
 
 
 def measure_command(
@@ -205,61 +332,65 @@ def measure_command(
     env: dict | None = None,
     cwd: str | None = None,
     trim_ratio: float = 0.0,
+    pin_cpu: int | None = None,
+    pre_iter_hook: Callable[[], None] | None = None,
 ) -> BenchResult:
     """
     Execute command multiple times and measure performance.
     
+    stdout is discarded. During timed runs stderr goes to a reusable temp
+    file (no pipe, no reader) that is only read when a run fails.
+    With pin_cpu, every run is restricted to that CPU (Linux only).
+    pre_iter_hook, if given, is called before each timed run, outside the
+    timer (e.g. to drop the FS cache so every iteration starts cold).
+
     Returns BenchResult with timing statistics.
     """
-    # Prepare environment
-    run_env = os.environ.copy()
-    if env:
-        run_env.update(env)
-    
-    # Warmup runs
-    for _ in range(warmup):
-        try:
-            subprocess.run(
-                cmd,
-                capture_output=True,
-                timeout=timeout,
-                env=run_env,
-                cwd=cwd,
-            )
-        except Exception:
-            pass
+    import tempfile
+
+    # Only build a merged environment when there are overrides; None inherits.
+    run_env = {**os.environ, **env} if env else None
     
-    # Timed runs
-    times: list[float] = []
+    # Timed runs (integer ns; converted to ms once after the loop)
+    times_ns: list[int] = []
     success = True
     last_error = None
     
-    for _ in range(iterations):
-        start = time.perf_counter()
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                timeout=timeout,
-                env=run_env,
-                cwd=cwd,
-            )
-            end = time.perf_counter()
-            
-            if result.returncode != 0:
+    with _pinned(pin_cpu) as pinned_cpu, tempfile.TemporaryFile() as stderr_file:
+        # Warmup runs
+        for _ in range(warmup):
+            try:
+                _run_quiet(cmd, run_env, cwd, timeout)
+            except Exception:
+                pass
+        
+        stderr_fd = stderr_file.fileno()
+        for _ in range(iterations):
+            if pre_iter_hook is not None:
+                pre_iter_hook()
+            os.lseek(stderr_fd, 0, os.SEEK_SET)
+            os.ftruncate(stderr_fd, 0)
+            start = time.perf_counter_ns()
+            try:
+                returncode = _run_quiet(cmd, run_env, cwd, timeout, stderr_fd)
+                end = time.perf_counter_ns()
+                
+                if returncode != 0:
+                    success = False
+                    last_error = _read_failure(stderr_fd, returncode)
+                
+                times_ns.append(end - start)
+                
+            except subprocess.TimeoutExpired:
                 success = False
-                last_error = result.stderr.decode("utf-8", errors="replace")[:500]
-            
-            times.append((end - start) * 1000)  # Convert to ms
-            
-        except subprocess.TimeoutExpired:
-            success = False
-            last_error = f"Timeout after {timeout}s"
-            times.append(timeout * 1000)
-        except Exception as e:
-            success = False
-            last_error = str(e)
+                last_error = f"Timeout after {timeout}s"
+                times_ns.append(timeout * 1_000_000_000)
+            except Exception as e:
+                success = False
+                last_error = str(e)
     
+    times = [t / 1e6 for t in times_ns]
+
     # Calculate statistics
     avg, min_t, max_t, stddev, trimmed_count = compute_stats(times, trim_ratio)
 
@@ -277,6 +408,10 @@ def measure_command(
     if trim_ratio > 0 and trimmed_count:
         result.metadata["trim_ratio"] = trim_ratio
         result.metadata["trimmed_iterations"] = trimmed_count
+    if pinned_cpu is not None:
+        result.metadata["pinned_cpu"] = pinned_cpu
+    # Spawn cost is part of every sample, so record which launcher paid it
+    result.metadata["launcher"] = "posix_spawn" if _HAS_SPAWN and cwd is None else "subprocess"
     return result
 
 
@@ -290,27 +425,33 @@ def measure_with_hyperfine(
     Use hyperfine for more accurate benchmarking.
     Returns None if hyperfine is not available.
     """
-    hp = hyperfine_path or shutil.which("hyperfine")
+    import tempfile
+
+    hp = hyperfine_path or _which("hyperfine")
     if not hp:
         return None
     
+    # Export to a temp file rather than /dev/stdout: stdout also carries
+    # hyperfine's progress output, and /dev/stdout doesn't exist on Windows.
+    fd, json_path = tempfile.mkstemp(prefix="pybun_hyperfine_", suffix=".json")
+    os.close(fd)
     try:
         result = subprocess.run(
             [
                 hp,
                 "--warmup", str(warmup),
                 "--runs", str(iterations),
-                "--export-json", "/dev/stdout",
+                "--export-json", json_path,
                 "--",
                 *cmd,
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=300,
         )
         
         if result.returncode == 0:
-            data = json.loads(result.stdout)
+            data = json.loads(Path(json_path).read_bytes())
             bench = data["results"][0]
             return BenchResult(
                 scenario="",
@@ -324,6 +465,11 @@ def measure_with_hyperfine(
             )
     except Exception:
         pass
+    finally:
+        try:
+            os.unlink(json_path)
+        except OSError:
+            pass
     
     return None
 
@@ -359,58 +505,176 @@ def run_scenario(name: str, config: dict, base_dir: Path) -> list[BenchResult]:
     return SCENARIOS[name](config, scenario_config, base_dir)
 
 
+# CPU this process was pinned to as a -j worker (None outside the pool)
+_WORKER_CPU: int | None = None
+
+
+def _init_scenario_worker(base_dir: Path, cpu_queue) -> None:
+    """Process-pool initializer: register scenarios and pin to one CPU."""
+    global _WORKER_CPU
+    if not SCENARIOS:
+        load_scenarios(base_dir)
+    if cpu_queue is not None:
+        cpu = cpu_queue.get()
+        try:
+            os.sched_setaffinity(0, {cpu})
+            _WORKER_CPU = cpu
+        except OSError:
+            pass
+
+
+def _parse_cpu_list(text: str) -> set[int]:
+    """Parse a Linux CPU list such as "0-3,8" into a set of CPU numbers."""
+    cpus: set[int] = set()
+    for part in text.strip().split(","):
+        if part:
+            first, _, last = part.partition("-")
+            cpus.update(range(int(first), int(last or first) + 1))
+    return cpus
+
+
+def _one_cpu_per_core(cpus: list[int], sysfs: Path = Path("/sys/devices/system/cpu")) -> list[int]:
+    """
+    Keep the first of cpus on each physical core, per sysfs thread siblings.
+
+    Sibling numbering varies (0/1 on some layouts, 0/N on others), so it is
+    read rather than assumed. Returns cpus unchanged if the topology is not
+    readable.
+    """
+    picked: list[int] = []
+    taken: set[int] = set()
+    for cpu in cpus:
+        try:
+            siblings = (sysfs / f"cpu{cpu}" / "topology" / "thread_siblings_list").read_text()
+        except OSError:
+            return cpus
+        if cpu not in taken:
+            picked.append(cpu)
+            taken.update(_parse_cpu_list(siblings))
+    return picked
+
+
+def run_scenarios_parallel(
+    names: list[str],
+    config: dict,
+    base_dir: Path,
+    jobs: int,
+    verbose: bool = False,
+    jsonl=None,
+) -> list[BenchResult]:
+    """
+    Run scenarios across a process pool, one scenario per worker at a time.
+
+    On Linux each worker is pinned to its own CPU (one per physical core when
+    there are enough cores) so the measured subprocesses it spawns don't
+    migrate onto another worker's core. Results are returned in the order of
+    `names`, regardless of completion order. If jsonl (a binary file) is
+    given, each scenario's results are also appended to it as soon as that
+    scenario completes, so they survive a crash or Ctrl-C in a later one.
+    """
+    import multiprocessing
+    import traceback
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    workers = max(1, min(jobs, len(names)))
+    cpu_queue = None
+    if hasattr(os, "sched_setaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+        cores = _one_cpu_per_core(cpus)
+        cpus = cores if len(cores) >= workers else cpus
+        workers = min(workers, len(cpus))
+        cpu_queue = multiprocessing.SimpleQueue()
+        for cpu in cpus[:workers]:
+            cpu_queue.put(cpu)
+
+    results_by_name: dict[str, list[BenchResult]] = {}
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_scenario_worker,
+        initargs=(base_dir, cpu_queue),
+    ) as executor:
+        futures = {
+            executor.submit(run_scenario, name, config, base_dir): name
+            for name in names
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                results_by_name[name] = future.result()
+            except Exception as e:
+                print(f"Error running scenario '{name}': {e}")
+                if verbose:
+                    # Chained to the worker's traceback, so this shows where it failed
+                    print("".join(traceback.format_exception(type(e), e, e.__traceback__)), end="")
+                results_by_name[name] = []
+            if jsonl is not None:
+                append_jsonl_results(jsonl, results_by_name[name])
+
+    results: list[BenchResult] = []
+    for name in names:
+        results.extend(results_by_name.get(name, []))
+    return results
+
+
 # === Import Scenarios ===
 
+# Scenario module name -> benchmark function name
+SCENARIO_FUNC_NAMES = {
+    "run": "run_benchmark",
+    "adhoc": "adhoc_benchmark",
+    "module_find": "module_find_benchmark",
+    "resolution": "resolution_benchmark",
+    "install": "install_benchmark",
+    "lazy_import": "lazy_import_benchmark",
+    "test": "test_benchmark",
+    "mcp": "mcp_benchmark",
+    "uv_comparison": "uv_comparison_benchmark",
+}
+
+
 def load_scenarios(base_dir: Path):
-    """Dynamically load scenario modules and register their benchmark functions."""
-    import importlib.util
+    """Import scenario modules and register their benchmark functions."""
+    import importlib
     
     scenarios_dir = base_dir / "scenarios"
     if not scenarios_dir.exists():
         return
     
-    # Scenario name mapping (file name -> scenario function name)
-    scenario_func_names = {
-        "run": "run_benchmark",
-        "adhoc": "adhoc_benchmark",
-        "module_find": "module_find_benchmark",
-        "resolution": "resolution_benchmark",
-        "install": "install_benchmark",
-        "lazy_import": "lazy_import_benchmark",
-        "test": "test_benchmark",
-        "mcp": "mcp_benchmark",
-        "uv_comparison": "uv_comparison_benchmark",
+    # Import scenarios as a regular package so their bytecode is cached.
+    if str(base_dir) not in sys.path:
+        sys.path.insert(0, str(base_dir))
+    
+    # Names scenario modules expect bench.py to provide. They are injected
+    # rather than imported because `import bench` from a scenario would load
+    # a second copy of this module when it runs as __main__.
+    api = {
+        "scenario": scenario,
+        "BenchResult": BenchResult,
+        "compute_stats": compute_stats,
+        "find_tool": find_tool,
+        "is_tool_enabled": is_tool_enabled,
+        "measure_command": measure_command,
+        "measure_with_hyperfine": measure_with_hyperfine,
+        "pin_cpu_for": pin_cpu_for,
+        "result_sink": result_sink,
+        "run_phase": run_phase,
+        "submit_parallel": submit_parallel,
     }
     
-    for py_file in scenarios_dir.glob("*.py"):
+    for py_file in sorted(scenarios_dir.glob("*.py")):
         if py_file.name.startswith("_") or py_file.name.startswith("."):
             continue
         
         scenario_name = py_file.stem
         
         try:
-            # Load module using importlib.util to avoid import path issues
-            spec = importlib.util.spec_from_file_location(
-                f"scenarios.{scenario_name}",
-                py_file,
-            )
-            if spec is None or spec.loader is None:
-                continue
-            
-            module = importlib.util.module_from_spec(spec)
-            
-            # Inject bench module's exports into the scenario module
-            module.scenario = scenario
-            module.BenchResult = BenchResult
-            module.find_tool = find_tool
-            module.is_tool_enabled = is_tool_enabled
-            module.measure_command = measure_command
-            module.measure_with_hyperfine = measure_with_hyperfine
-            
-            spec.loader.exec_module(module)
+            module = importlib.import_module(f"scenarios.{scenario_name}")
+            # Scenario modules only use the injected names at call time, so
+            # injecting after import is sufficient.
+            vars(module).update(api)
             
             # Get the benchmark function
-            func_name = scenario_func_names.get(scenario_name, f"{scenario_name}_benchmark")
+            func_name = SCENARIO_FUNC_NAMES.get(scenario_name, f"{scenario_name}_benchmark")
             if hasattr(module, func_name):
                 SCENARIOS[scenario_name] = getattr(module, func_name)
             
@@ -425,121 +689,238 @@ def generate_summary(results: list[BenchResult]) -> dict:
     if not results:
         return {}
     
-    # Group by scenario
-    by_scenario: dict[str, list[BenchResult]] = {}
+    # One pass: the (first) pybun result per scenario, the other tools'
+    # successful results per scenario, and the success count.
+    pybun_by_scenario: dict[str, BenchResult] = {}
+    others_by_scenario: dict[str, list[BenchResult]] = defaultdict(list)
+    successful = 0
     for r in results:
-        by_scenario.setdefault(r.scenario, []).append(r)
+        others = others_by_scenario[r.scenario]
+        if r.success:
+            successful += 1
+        if r.tool == "pybun":
+            pybun_by_scenario.setdefault(r.scenario, r)
+        elif r.success:
+            others.append(r)
     
     # Calculate wins/losses for pybun
     pybun_wins = 0
     pybun_losses = 0
     speedups: list[float] = []
     
-    for scenario, scenario_results in by_scenario.items():
-        pybun_result = next((r for r in scenario_results if r.tool == "pybun"), None)
-        if not pybun_result:
-            continue
-        
-        for r in scenario_results:
-            if r.tool == "pybun" or not r.success:
-                continue
-            
-            if pybun_result.duration_ms < r.duration_ms:
+    for scenario, pybun_result in pybun_by_scenario.items():
+        pybun_ms = pybun_result.duration_ms
+        for r in others_by_scenario[scenario]:
+            if pybun_ms < r.duration_ms:
                 pybun_wins += 1
-                if r.duration_ms > 0:
-                    speedups.append(r.duration_ms / pybun_result.duration_ms)
             else:
                 pybun_losses += 1
-                if pybun_result.duration_ms > 0:
-                    speedups.append(r.duration_ms / pybun_result.duration_ms)
+            if pybun_ms > 0:
+                speedups.append(r.duration_ms / pybun_ms)
     
     avg_speedup = sum(speedups) / len(speedups) if speedups else 1.0
     
     return {
-        "total_scenarios": len(by_scenario),
+        "total_scenarios": len(others_by_scenario),
         "total_benchmarks": len(results),
         "pybun_wins": pybun_wins,
         "pybun_losses": pybun_losses,
         "average_speedup": round(avg_speedup, 2),
-        "successful": sum(1 for r in results if r.success),
-        "failed": sum(1 for r in results if not r.success),
+        "successful": successful,
+        "failed": len(results) - successful,
     }
 
 
+def append_jsonl_results(f, results: list[BenchResult]) -> None:
+    """Append results to a binary JSONL file, one object per line, and flush."""
+    try:
+        import orjson
+        dumps = orjson.dumps
+    except ImportError:
+        def dumps(obj: Any) -> bytes:
+            return json.dumps(obj).encode()
+
+    f.writelines(dumps(r.to_dict()) + b"\n" for r in results)
+    f.flush()
+
+
+def iter_jsonl_results(path: Path):
+    """Yield BenchResults back from a file written by append_jsonl_results."""
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield BenchResult(**json.loads(line))
+
+
+def run_phase(
+    emit: Callable[[BenchResult], None],
+    runs: list[tuple[str, Callable[[], BenchResult | None]]],
+    *,
+    parallel: bool,
+    indent: str = "  ",
+) -> None:
+    """
+    Call each (label, measure) in runs and emit the results in list order.
+
+    A measure returns None when there is nothing to record (e.g. --dry-run).
+    With `parallel`, the tools run at the same time on a thread pool, one
+    worker per run. They then compete for CPU, disk and network, so this is
+    for quick local iteration only, not for publishable numbers.
+    """
+    if parallel and len(runs) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=len(runs)) as executor:
+            futures = [(label, executor.submit(measure)) for label, measure in runs]
+            outcomes = [(label, future.result()) for label, future in futures]
+    else:
+        # Lazy, so each result is printed before the next tool starts.
+        outcomes = ((label, measure()) for label, measure in runs)
+
+    for label, result in outcomes:
+        if result is not None:
+            emit(result)
+            print(f"{indent}{label}: {result.duration_ms:.2f}ms")
+
+
+def submit_parallel(
+    stack: contextlib.ExitStack,
+    calls: Sequence[Callable[[], Any] | None],
+    *,
+    parallel: bool,
+) -> list | None:
+    """
+    Start calls on a thread pool owned by stack; return their futures in order.
+
+    A None call gets None in its slot. Without `parallel`, or with fewer than
+    two calls, nothing starts and None is returned, so callers run each call
+    in order themselves. Opt-in: concurrent runs compete for cores and caches,
+    which inflates variance. Half the CPUs keeps each run on a core.
+    """
+    if not parallel or sum(call is not None for call in calls) < 2:
+        return None
+    from concurrent.futures import ThreadPoolExecutor
+
+    executor = stack.enter_context(ThreadPoolExecutor(max_workers=max(1, (os.cpu_count() or 2) // 2)))
+    return [executor.submit(call) if call is not None else None for call in calls]
+
+
+def pin_cpu_for(config: dict, scenario_config: dict, *, parallel: bool) -> int | None:
+    """
+    The pin_cpu setting for a scenario, or None where pinning would backfire.
+
+    pin_cpu puts every measurement on one CPU, so concurrent runs would fight
+    over that core, and under -j it would replace the CPU this worker was
+    given. In both cases a warning is printed and runs stay unpinned.
+    """
+    cpu = scenario_config.get("pin_cpu", config.get("general", {}).get("pin_cpu"))
+    if cpu is None:
+        return None
+    if parallel:
+        print(f"  Warning: pin_cpu = {cpu} ignored; runs execute in parallel")
+        return None
+    if _WORKER_CPU is not None:
+        print(f"  Warning: pin_cpu = {cpu} ignored under -j; this worker stays on CPU {_WORKER_CPU}")
+        return None
+    return cpu
+
+
+@contextlib.contextmanager
+def result_sink(results: list[BenchResult], out_jsonl: str | None, base_dir: Path):
+    """
+    Yield a function that appends a result to results.
+
+    With out_jsonl (relative to base_dir), each result is also appended to
+    that JSONL file as soon as it is recorded, so a scenario that crashes or
+    is killed halfway still leaves the results it had.
+    """
+    if not out_jsonl:
+        yield results.append
+        return
+    with open(base_dir / out_jsonl, "ab") as f:
+        def emit(result: BenchResult) -> None:
+            results.append(result)
+            append_jsonl_results(f, [result])
+        yield emit
+
+
 def save_json_report(report: BenchReport, output_path: Path):
-    """Save report as JSON."""
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(report.to_dict(), f, indent=2)
+    """Save report as JSON, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
+    if orjson is not None:
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(report.to_dict(), option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, "w") as f:
+            json.dump(report.to_dict(), f, indent=2)
     print(f"JSON report saved to: {output_path}")
 
 
-def save_markdown_report(report: BenchReport, output_path: Path):
-    """Save report as Markdown."""
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    lines = [
+_MD_RESULT_ROW = "| {0.tool} | {0.duration_ms:.2f} | {0.min_ms:.2f} | {0.max_ms:.2f} | {0.stddev_ms:.2f} | {1} |".format
+
+
+def _markdown_report_lines(report: BenchReport):
+    """Yield the lines of the Markdown report, without line terminators."""
+    yield from (
         "# PyBun Benchmark Report",
         "",
         f"Generated: {report.meta.get('timestamp', 'unknown')}",
         "",
         "## System Information",
         "",
-    ]
+    )
     
     sys_info = report.meta.get("system", {})
     if sys_info:
-        lines.extend([
+        yield from (
             f"- **OS**: {sys_info.get('os', 'unknown')} {sys_info.get('os_version', '')}",
             f"- **CPU**: {sys_info.get('cpu', 'unknown')} ({sys_info.get('cpu_count', 0)} cores)",
             f"- **Memory**: {sys_info.get('memory_gb', 0)} GB",
             f"- **Python**: {sys_info.get('python_version', 'unknown')}",
             "",
-        ])
+        )
     
-    lines.extend([
+    summary = report.summary
+    yield from (
         "## Summary",
         "",
         "| Metric | Value |",
         "|--------|-------|",
-    ])
-    
-    summary = report.summary
-    lines.extend([
         f"| Total Scenarios | {summary.get('total_scenarios', 0)} |",
         f"| Total Benchmarks | {summary.get('total_benchmarks', 0)} |",
         f"| PyBun Wins | {summary.get('pybun_wins', 0)} |",
         f"| PyBun Losses | {summary.get('pybun_losses', 0)} |",
         f"| Average Speedup | {summary.get('average_speedup', 1.0)}x |",
         "",
-    ])
+    )
     
     # Group results by scenario
-    by_scenario: dict[str, list[BenchResult]] = {}
+    by_scenario: dict[str, list[BenchResult]] = defaultdict(list)
     for r in report.results:
-        by_scenario.setdefault(r.scenario, []).append(r)
+        by_scenario[r.scenario].append(r)
     
-    lines.append("## Detailed Results")
-    lines.append("")
+    yield "## Detailed Results"
     
     for scenario, results in sorted(by_scenario.items()):
-        lines.extend([
+        yield from (
+            "",
             f"### {scenario}",
             "",
             "| Tool | Duration (ms) | Min | Max | StdDev | Status |",
             "|------|--------------|-----|-----|--------|--------|",
-        ])
-        
+        )
         for r in sorted(results, key=lambda x: x.duration_ms):
-            status = "✅" if r.success else "❌"
-            lines.append(
-                f"| {r.tool} | {r.duration_ms:.2f} | {r.min_ms:.2f} | {r.max_ms:.2f} | {r.stddev_ms:.2f} | {status} |"
-            )
-        
-        lines.append("")
-    
+            yield _MD_RESULT_ROW(r, "✅" if r.success else "❌")
+
+
+def save_markdown_report(report: BenchReport, output_path: Path):
+    """Save report as Markdown, streaming lines to the file."""
     with open(output_path, "w") as f:
-        f.write("\n".join(lines))
+        f.writelines(f"{line}\n" for line in _markdown_report_lines(report))
     
     print(f"Markdown report saved to: {output_path}")
 
@@ -548,33 +929,47 @@ def save_csv_report(report: BenchReport, output_path: Path):
     """Save report as CSV."""
     import csv
     
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    fieldnames = [
+    fieldnames = (
         "scenario", "tool", "duration_ms", "min_ms", "max_ms",
-        "stddev_ms", "iterations", "success", "error"
-    ]
+        "stddev_ms", "iterations", "success", "error",
+    )
     
     with open(output_path, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        for r in report.results:
-            writer.writerow({
-                "scenario": r.scenario,
-                "tool": r.tool,
-                "duration_ms": r.duration_ms,
-                "min_ms": r.min_ms,
-                "max_ms": r.max_ms,
-                "stddev_ms": r.stddev_ms,
-                "iterations": r.iterations,
-                "success": r.success,
-                "error": r.error or "",
-            })
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(
+            (
+                r.scenario, r.tool, r.duration_ms, r.min_ms, r.max_ms,
+                r.stddev_ms, r.iterations, r.success, r.error or "",
+            )
+            for r in report.results
+        )
     
     print(f"CSV report saved to: {output_path}")
 
 
+# Output format -> (save function, file suffix)
+REPORT_SAVERS: dict[str, tuple[Callable[[BenchReport, Path], None], str]] = {
+    "json": (save_json_report, ".json"),
+    "markdown": (save_markdown_report, ".md"),
+    "csv": (save_csv_report, ".csv"),
+}
+
+
+def load_toml(path: Path) -> dict:
+    """Load a TOML file with tomllib (Python 3.11+) or the `toml` package."""
+    try:
+        import tomllib
+    except ImportError:
+        try:
+            import toml as tomllib  # type: ignore
+        except ImportError:
+            print("Error: Please install toml package: pip install toml")
+            sys.exit(1)
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
 # === Main Entry Point ===
 
 def main():
@@ -594,7 +989,7 @@ def main():
     )
     parser.add_argument(
         "--format",
-        choices=["json", "markdown", "csv", "all"],
+        choices=[*REPORT_SAVERS, "all"],
         default="json",
         help="Output format (default: json)",
     )
@@ -618,6 +1013,13 @@ def main():
         type=int,
         help="Override number of warmup runs",
     )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="Run up to N scenarios in parallel, 0 = half the CPUs (default: 1). "
+             "Concurrent scenarios share the machine, so keep 1 for publishable numbers",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -647,8 +1049,7 @@ def main():
     # Load config
     config_path = base_dir / args.config
     if config_path.exists():
-        with open(config_path, "rb") as f:
-            config = tomllib.load(f)
+        config = load_toml(config_path)
     else:
         print(f"Warning: Config file not found: {config_path}")
         config = {}
@@ -674,8 +1075,12 @@ def main():
     else:
         scenario_names = list(SCENARIOS.keys())
     
-    # Collect system info
-    sys_info = SystemInfo.collect()
+    # Collect system info. The clock is read once so meta.timestamp and the
+    # output file names agree.
+    from datetime import datetime, timezone
+
+    now = datetime.now(timezone.utc)
+    sys_info = SystemInfo.collect(now=now)
     
     print("=" * 60)
     print("PyBun Benchmark Runner")
@@ -683,23 +1088,41 @@ def main():
     print(f"System: {sys_info.os} {sys_info.os_version} ({sys_info.architecture})")
     print(f"CPU: {sys_info.cpu}")
     print(f"Python: {sys_info.python_version}")
+    if not _HAS_SPAWN:
+        print("Note: posix_spawn/pidfd_open unavailable; measured commands launch via subprocess")
     print(f"Scenarios: {', '.join(scenario_names)}")
     print("=" * 60)
     
-    # Run scenarios
-    all_results: list[BenchResult] = []
+    # Created once here; the save_*_report functions expect it to exist.
+    output_dir = base_dir / args.output
+    output_dir.mkdir(parents=True, exist_ok=True)
+    timestamp = now.astimezone().strftime("%Y%m%d_%H%M%S")
+    output_stem = output_dir / f"benchmark_{timestamp}"
     
-    for name in scenario_names:
-        try:
-            results = run_scenario(name, config, base_dir)
-            all_results.extend(results)
-        except Exception as e:
-            print(f"Error running scenario '{name}': {e}")
-            if args.verbose:
-                import traceback
-                traceback.print_exc()
+    # Run scenarios. Results are appended to a JSONL file as each scenario
+    # finishes, so a crashed or interrupted run still leaves what it measured.
+    # With -j that is completion order; the report keeps the requested order.
+    jsonl_path = output_stem.with_suffix(".jsonl")
+    jobs = args.jobs if args.jobs > 0 else max(1, (os.cpu_count() or 1) // 2)
+    all_results: list[BenchResult] | None = None
+    
+    with open(jsonl_path, "wb") as jsonl:
+        if jobs > 1 and len(scenario_names) > 1:
+            all_results = run_scenarios_parallel(scenario_names, config, base_dir, jobs, args.verbose, jsonl)
+        else:
+            for name in scenario_names:
+                try:
+                    append_jsonl_results(jsonl, run_scenario(name, config, base_dir))
+                except Exception as e:
+                    print(f"Error running scenario '{name}': {e}")
+                    if args.verbose:
+                        import traceback
+                        traceback.print_exc()
+    print(f"Raw results saved to: {jsonl_path}")
     
     # Generate report
+    if all_results is None:
+        all_results = list(iter_jsonl_results(jsonl_path))
     summary = generate_summary(all_results)
     report = BenchReport(
         meta={
@@ -712,18 +1135,11 @@ def main():
     )
     
     # Save reports
-    output_dir = base_dir / args.output
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    formats = ["json", "markdown", "csv"] if args.format == "all" else [args.format]
+    formats = list(REPORT_SAVERS) if args.format == "all" else [args.format]
     
     for fmt in formats:
-        if fmt == "json":
-            save_json_report(report, output_dir / f"benchmark_{timestamp}.json")
-        elif fmt == "markdown":
-            save_markdown_report(report, output_dir / f"benchmark_{timestamp}.md")
-        elif fmt == "csv":
-            save_csv_report(report, output_dir / f"benchmark_{timestamp}.csv")
+        saver, suffix = REPORT_SAVERS[fmt]
+        saver(report, output_stem.with_suffix(suffix))
     
     # Print summary
     print("\n" + "=" * 60)
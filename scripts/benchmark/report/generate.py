@@ -13,12 +13,70 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import functools
 import html
 import json
+import os
 import sys
+from collections import ChainMap
 from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used when it isn't installed
+    orjson = None
+
+
+def _read_bytes(path: Path) -> bytes:
+    """
+    Read a whole file with a single read() sized from fstat.
+
+    Path.read_bytes() goes through a buffered reader and issues a second
+    read() to find EOF; for a directory of small result files that doubles
+    the syscalls. Falls back to it if the file changed size under us.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+    finally:
+        os.close(fd)
+    return data if len(data) == size else path.read_bytes()
+
+
+def _load_json(path: Path) -> Any:
+    """Parse a JSON file, using orjson when it is installed."""
+    raw = _read_bytes(path)
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _dumps_indented(obj: Any) -> str:
+    """Serialize to 2-space indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _load_one(path: Path) -> dict:
+    data = _load_json(path)
+    data["_source_file"] = path.name
+    return data
+
+
+def _result_files(path: Path) -> list[Path]:
+    """The benchmark_*.json files in a directory, sorted by name."""
+    # scandir + a prefix/suffix test instead of Path.glob: rejected entries
+    # never become Path objects, and is_file() is answered from d_type.
+    with os.scandir(path) as it:
+        names = sorted(
+            entry.name for entry in it
+            if entry.name.startswith("benchmark_") and entry.name.endswith(".json") and entry.is_file()
+        )
+    return [path / name for name in names]
 
 
 def load_results(path: Path) -> list[dict]:
@@ -26,25 +84,103 @@ def load_results(path: Path) -> list[dict]:
     results = []
     
     if path.is_file():
-        with open(path) as f:
-            data = json.load(f)
-            results.append(data)
+        results.append(_load_json(path))
     elif path.is_dir():
-        for json_file in sorted(path.glob("benchmark_*.json")):
-            with open(json_file) as f:
-                data = json.load(f)
-                data["_source_file"] = json_file.name
-                results.append(data)
+        json_files = _result_files(path)
+        if len(json_files) > 1:
+            # Files are independent; read and parse them concurrently.
+            # map() keeps the sorted order.
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+                results.extend(executor.map(_load_one, json_files))
+        else:
+            results.extend(map(_load_one, json_files))
     
     return results
 
 
+def load_latest_result(path: Path) -> dict | None:
+    """
+    Load the result load_results(path)[-1] would return, parsing only that file.
+
+    A directory contributes just its last benchmark_*.json by name.
+    """
+    if path.is_dir():
+        json_files = _result_files(path)
+        return _load_one(json_files[-1]) if json_files else None
+    if path.is_file():
+        return _load_json(path)
+    return None
+
+
+def _scenario_duration_key(r: dict) -> tuple:
+    return r["scenario"], r.get("duration_ms", 0)
+
+
+def _group_by_scenario(bench_results: list[dict]):
+    """
+    Yield (scenario, results) in scenario order, each group fastest first.
+
+    One stable sort on (scenario, duration) replaces a grouping dict plus a
+    sort per scenario; ties keep their input order as before.
+    """
+    ordered = sorted(bench_results, key=_scenario_duration_key)
+    return groupby(ordered, key=itemgetter("scenario"))
+
+
+# Per-row templates, parsed once. Rows are rendered with format_map over a
+# ChainMap of (derived fields, result dict, defaults for missing stats).
+_ROW_DEFAULTS = {"duration_ms": 0, "min_ms": 0, "max_ms": 0, "stddev_ms": 0}
+
+_MD_ROW = (
+    "| {tool} | {duration_ms:.2f} | {min_ms:.2f} | {max_ms:.2f} | {stddev_ms:.2f} | {status}{error_note} |"
+).format_map
+
+_HTML_ROW = """
+        <tr>
+            <td>{tool}</td>
+            <td>{duration_ms:.2f}</td>
+            <td>{min_ms:.2f}</td>
+            <td>{max_ms:.2f}</td>
+            <td>{stddev_ms:.2f}</td>
+            <td class="{status_class}">{status_icon}</td>
+        </tr>
+""".format_map
+
+
+def _markdown_result_row(r: dict) -> str:
+    error = r.get("error")
+    derived = {
+        "status": "✅" if r.get("success", True) else "❌",
+        "error_note": f" ({error[:30]}...)" if error else "",
+    }
+    return _MD_ROW(ChainMap(derived, r, _ROW_DEFAULTS))
+
+
+# The same few tool names recur in every scenario's table, so escape each once.
+_escape_tool = functools.lru_cache(maxsize=256)(html.escape)
+
+
+def _html_result_row(r: dict) -> str:
+    ok = r.get("success", True)
+    derived = {
+        "tool": _escape_tool(r["tool"]),
+        "status_class": "success" if ok else "error",
+        "status_icon": "✅" if ok else "❌",
+    }
+    return _HTML_ROW(ChainMap(derived, r, _ROW_DEFAULTS))
+
+
 def calculate_comparison(current: dict, baseline: dict) -> dict:
     """Calculate comparison metrics between current and baseline results."""
+    improvements: list[dict] = []
+    regressions: list[dict] = []
+    unchanged: list[dict] = []
     comparison = {
-        "improvements": [],
-        "regressions": [],
-        "unchanged": [],
+        "improvements": improvements,
+        "regressions": regressions,
+        "unchanged": unchanged,
     }
     
     current_by_key = {
@@ -52,22 +188,18 @@ def calculate_comparison(current: dict, baseline: dict) -> dict:
         for r in current.get("results", [])
     }
     
-    baseline_by_key = {
-        (r["scenario"], r["tool"]): r
+    # Only the baseline duration is ever read, so index just that.
+    baseline_ms_by_key = {
+        (r["scenario"], r["tool"]): r.get("duration_ms", 0)
         for r in baseline.get("results", [])
     }
     
     for key, curr in current_by_key.items():
-        if key not in baseline_by_key:
+        base_ms = baseline_ms_by_key.get(key)
+        if not base_ms:  # not in the baseline, or zero
             continue
         
-        base = baseline_by_key[key]
         curr_ms = curr.get("duration_ms", 0)
-        base_ms = base.get("duration_ms", 0)
-        
-        if base_ms == 0:
-            continue
-        
         change_pct = ((curr_ms - base_ms) / base_ms) * 100
         
         item = {
@@ -79,11 +211,11 @@ def calculate_comparison(current: dict, baseline: dict) -> dict:
         }
         
         if change_pct < -5:  # 5% faster
-            comparison["improvements"].append(item)
+            improvements.append(item)
         elif change_pct > 10:  # 10% slower (regression threshold)
-            comparison["regressions"].append(item)
+            regressions.append(item)
         else:
-            comparison["unchanged"].append(item)
+            unchanged.append(item)
     
     return comparison
 
@@ -92,8 +224,12 @@ def generate_markdown_report(
     results: list[dict],
     baseline: dict | None = None,
     title: str = "PyBun Benchmark Report",
+    generated_at: str | None = None,
 ) -> str:
-    """Generate a Markdown report from benchmark results."""
+    """Generate a Markdown report from benchmark results.
+
+    `generated_at` is the footer timestamp; it defaults to now.
+    """
     lines = [
         f"# {title}",
         "",
@@ -184,19 +320,12 @@ def generate_markdown_report(
             lines.append("")
     
     # Detailed results by scenario
-    bench_results = latest.get("results", [])
-    by_scenario: dict[str, list[dict]] = {}
-    for r in bench_results:
-        by_scenario.setdefault(r["scenario"], []).append(r)
-    
     lines.extend([
         "## Detailed Results",
         "",
     ])
     
-    for scenario in sorted(by_scenario.keys()):
-        scenario_results = by_scenario[scenario]
-        
+    for scenario, scenario_results in _group_by_scenario(latest.get("results", [])):
         lines.extend([
             f"### {scenario}",
             "",
@@ -204,12 +333,7 @@ def generate_markdown_report(
             "|------|--------------|-----|-----|--------|--------|",
         ])
         
-        for r in sorted(scenario_results, key=lambda x: x.get("duration_ms", 0)):
-            status = "✅" if r.get("success", True) else "❌"
-            error = f" ({r.get('error', '')[:30]}...)" if r.get("error") else ""
-            lines.append(
-                f"| {r['tool']} | {r.get('duration_ms', 0):.2f} | {r.get('min_ms', 0):.2f} | {r.get('max_ms', 0):.2f} | {r.get('stddev_ms', 0):.2f} | {status}{error} |"
-            )
+        lines.extend(map(_markdown_result_row, scenario_results))
         
         lines.append("")
     
@@ -217,7 +341,7 @@ def generate_markdown_report(
     lines.extend([
         "---",
         "",
-        f"*Report generated at {datetime.now().isoformat()}*",
+        f"*Report generated at {generated_at or datetime.now().isoformat()}*",
     ])
     
     return "\n".join(lines)
@@ -227,8 +351,22 @@ def generate_html_report(
     results: list[dict],
     baseline: dict | None = None,
     title: str = "PyBun Benchmark Report",
+    generated_at: str | None = None,
 ) -> str:
     """Generate an HTML report from benchmark results."""
+    return "".join(iter_html_report(results, baseline, title, generated_at))
+
+
+def iter_html_report(
+    results: list[dict],
+    baseline: dict | None = None,
+    title: str = "PyBun Benchmark Report",
+    generated_at: str | None = None,
+) -> Iterator[str]:
+    """Yield an HTML report in chunks, so it can be written without joining.
+
+    `generated_at` is the footer timestamp; it defaults to now.
+    """
     latest = results[-1] if results else {}
     meta = latest.get("meta", {})
     summary = latest.get("summary", {})
@@ -243,7 +381,7 @@ def generate_html_report(
     safe_memory_gb = html.escape(str(sys_info.get("memory_gb", "Unknown")))
     safe_python_version = html.escape(str(sys_info.get("python_version", "Unknown")))
 
-    html_out = f"""\
+    yield f"""\
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -373,17 +511,10 @@ def generate_html_report(
     <h2>Detailed Results</h2>
 """
     
-    # Group by scenario
-    bench_results = latest.get("results", [])
-    by_scenario: dict[str, list[dict]] = {}
-    for r in bench_results:
-        by_scenario.setdefault(r["scenario"], []).append(r)
-    
-    for scenario in sorted(by_scenario.keys()):
-        scenario_results = by_scenario[scenario]
+    for scenario, scenario_results in _group_by_scenario(latest.get("results", [])):
         safe_scenario = html.escape(scenario)
 
-        html_out += f"""
+        yield f"""
     <h3>{safe_scenario}</h3>
     <table>
         <tr>
@@ -395,33 +526,38 @@ def generate_html_report(
             <th>Status</th>
         </tr>
 """
+        yield from map(_html_result_row, scenario_results)
+        yield "    </table>\n"
 
-        for r in sorted(scenario_results, key=lambda x: x.get("duration_ms", 0)):
-            status_class = "success" if r.get("success", True) else "error"
-            status_icon = "✅" if r.get("success", True) else "❌"
-            safe_tool = html.escape(r["tool"])
-
-            html_out += f"""
-        <tr>
-            <td>{safe_tool}</td>
-            <td>{r.get('duration_ms', 0):.2f}</td>
-            <td>{r.get('min_ms', 0):.2f}</td>
-            <td>{r.get('max_ms', 0):.2f}</td>
-            <td>{r.get('stddev_ms', 0):.2f}</td>
-            <td class="{status_class}">{status_icon}</td>
-        </tr>
-"""
-
-        html_out += "    </table>\n"
-
-    html_out += f"""
+    yield f"""
     <hr>
-    <p><em>Report generated at {datetime.now().isoformat()}</em></p>
+    <p><em>Report generated at {html.escape(generated_at or datetime.now().isoformat())}</em></p>
 </body>
 </html>
 """
 
-    return html_out
+
+def _report_cache_key(inputs: list[Path | None], title: str, fmt: str) -> str:
+    """
+    Hash what a report is rendered from: the input files' paths, sizes and
+    mtimes, this generator's own source, the title and the format.
+    """
+    import hashlib
+
+    files = [Path(__file__)]
+    for path in inputs:
+        if path is None:
+            continue
+        files.extend(_result_files(path) if path.is_dir() else [path])
+    stats = []
+    for f in files:
+        try:
+            st = f.stat()
+        except FileNotFoundError:
+            stats.append((str(f), None))
+        else:
+            stats.append((str(f), st.st_size, st.st_mtime_ns))
+    return hashlib.blake2b(repr((stats, title, fmt)).encode(), digest_size=16).hexdigest()
 
 
 def main():
@@ -448,16 +584,37 @@ def main():
     parser.add_argument(
         "--compare",
         type=Path,
-        help="Baseline results file for comparison",
+        help="Baseline results file (or directory, whose latest benchmark_*.json is used) for comparison",
     )
     parser.add_argument(
         "--title",
         default="PyBun Benchmark Report",
         help="Report title",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate the output file even if its inputs are unchanged",
+    )
     
     args = parser.parse_args()
     
+    ext = {"markdown": ".md", "html": ".html", "json": ".json"}[args.format]
+    output_path = None
+    cache_key = None
+    if args.output:
+        output_path = args.output
+        if output_path.suffix == "":
+            output_path = output_path.with_suffix(ext)
+        # Skip rendering when the same inputs were already rendered to this
+        # output; the key is stored next to it.
+        key_path = output_path.with_name(output_path.name + ".cachekey")
+        cache_key = _report_cache_key([args.input, args.compare], args.title, args.format)
+        if not args.force and output_path.exists() and key_path.exists() \
+                and key_path.read_text() == cache_key:
+            print(f"Report unchanged: {output_path}")
+            return 0
+    
     # Load results
     results = load_results(args.input)
     if not results:
@@ -465,32 +622,28 @@ def main():
         return 1
     
     # Load baseline if specified
-    baseline = None
-    if args.compare and args.compare.exists():
-        with open(args.compare) as f:
-            baseline = json.load(f)
+    baseline = load_latest_result(args.compare) if args.compare else None
     
-    # Generate report
+    # Generate report. HTML is streamed chunk by chunk rather than joined.
+    generated_at = datetime.now().isoformat()
+    chunks: Iterable[str]
     if args.format == "markdown":
-        report = generate_markdown_report(results, baseline, args.title)
-        ext = ".md"
+        chunks = [generate_markdown_report(results, baseline, args.title, generated_at)]
     elif args.format == "html":
-        report = generate_html_report(results, baseline, args.title)
-        ext = ".html"
+        chunks = iter_html_report(results, baseline, args.title, generated_at)
     else:
-        report = json.dumps(results[-1], indent=2)
-        ext = ".json"
+        chunks = [_dumps_indented(results[-1])]
     
     # Output
-    if args.output:
-        output_path = args.output
-        if output_path.suffix == "":
-            output_path = output_path.with_suffix(ext)
+    if output_path is not None:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(report)
+        with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            f.writelines(chunks)
+        key_path.write_text(cache_key)
         print(f"Report saved to {output_path}")
     else:
-        print(report)
+        sys.stdout.writelines(chunks)
+        print()
     
     return 0
 
@@ -11,11 +11,38 @@ Scenarios:
 
 from __future__ import annotations
 
+import functools
+import os
+import subprocess
 import tempfile
 from pathlib import Path
 
 # These are injected by bench.py when loading this module
-# scenario, BenchResult, find_tool, is_tool_enabled, measure_command
+# scenario, BenchResult, find_tool, is_tool_enabled, measure_command, run_phase
+
+
+def _measure_adhoc(
+    cmd: list[str],
+    *,
+    scenario: str,
+    tool: str,
+    metadata: dict,
+    indent: str,
+    dry_run: bool,
+    verbose: bool,
+    **measure_kwargs,
+):
+    """Measure one tool invocation, or print it for --dry-run and return None."""
+    if dry_run:
+        print(f"{indent}Would run: {' '.join(cmd)}")
+        return None
+    if verbose:
+        print(f"{indent}Running: {' '.join(cmd)}")
+    result = measure_command(cmd, **measure_kwargs)
+    result.scenario = scenario
+    result.tool = tool
+    result.metadata.update(metadata)
+    return result
 
 
 def adhoc_benchmark(config: dict, scenario_config: dict, base_dir: Path) -> list:
@@ -28,17 +55,52 @@ def adhoc_benchmark(config: dict, scenario_config: dict, base_dir: Path) -> list
     trim_ratio = scenario_config.get("trim_ratio", general.get("trim_ratio", 0.0))
     dry_run = config.get("dry_run", False)
     verbose = config.get("verbose", False)
+    parallel_tools = scenario_config.get("parallel_tools", False)
     
-    # Find tools
+    # Find tools. All lookups happen here, once; the loops below only use
+    # the resolved paths.
     pybun_path = find_tool("pybun", config)
     pipx_path = find_tool("pipx", config) if is_tool_enabled("pipx", config) else None
-    uvx_path = find_tool("uvx", config) if is_tool_enabled("uv", config) else None
-    # uvx is often just `uv tool run` or standalone `uvx`
-    if not uvx_path and is_tool_enabled("uv", config):
-        uv_path = find_tool("uv", config)
-        if uv_path:
-            uvx_path = uv_path  # Will use `uv tool run`
+    uvx_path = None
+    if is_tool_enabled("uv", config):
+        # uvx is often just `uv tool run` or standalone `uvx`
+        uvx_path = find_tool("uvx", config) or find_tool("uv", config)
+    
+    # Decided once: plain `uv` needs `tool run`, a standalone `uvx` does not.
+    uvx_prefix: list[str] = []
+    if uvx_path:
+        uvx_str = str(uvx_path)
+        if "uv" in uvx_str and "uvx" not in uvx_str:
+            uvx_prefix = [uvx_path, "tool", "run"]
+        else:
+            uvx_prefix = [uvx_path]
+    
+    # (tool, label, command prefix, env var that points its cache at a temp dir)
+    tools: list[tuple[str, str, list[str], str]] = []
+    if pybun_path:
+        tools.append(("pybun", "pybun x", [pybun_path, "x"], "PYBUN_X_CACHE"))
+    if pipx_path:
+        tools.append(("pipx", "pipx run", [pipx_path, "run"], "PIPX_HOME"))
+    if uvx_prefix:
+        tools.append(("uvx", "uvx", uvx_prefix, "UV_TOOL_DIR"))
+    
+    # With general.warmup_shared, each tool binary is primed once here and
+    # B4.2 runs against the cache its B4.1 cold run just filled, so that cold
+    # run is B4.2's warmup and B4.2 needs none of its own. B4.3 keeps one
+    # warmup: that run is what puts the pinned version into the cache.
+    warmup_shared = general.get("warmup_shared", False)
+    versioned_warmup = warmup
+    if warmup_shared:
+        if not dry_run:
+            for _, _, prefix, _ in tools:
+                try:
+                    subprocess.run([prefix[0], "--version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=60)
+                except (OSError, subprocess.SubprocessError):
+                    pass
+        versioned_warmup = min(warmup, 1)
     
+    measure = functools.partial(_measure_adhoc, dry_run=dry_run, verbose=verbose, trim_ratio=trim_ratio)
+    phase = functools.partial(run_phase, results.append, parallel=parallel_tools)
     packages = scenario_config.get("packages", ["cowsay", "black", "ruff"])
     
     for package in packages:
@@ -47,148 +109,45 @@ def adhoc_benchmark(config: dict, scenario_config: dict, base_dir: Path) -> list
         # === B4.1: Cold Run (first execution) ===
         print(f"\n  B4.1: Cold Run ({package})")
         
-        # For cold run, we need to ensure cache is cleared or use unique temp
+        # For cold run, we need to ensure cache is cleared or use unique temp.
+        # Each tool gets its own subdirectory so none sees another's files.
         with tempfile.TemporaryDirectory(prefix=f"pybun_x_bench_{package}_") as tmpdir:
-            # PyBun
-            if pybun_path:
-                cmd = [pybun_path, "x", package, "--help"]
-                if dry_run:
-                    print(f"    Would run: {' '.join(cmd)}")
-                else:
-                    if verbose:
-                        print(f"    Running: {' '.join(cmd)}")
-                    result = measure_command(
-                        cmd,
-                        warmup=0,  # No warmup for cold run
-                        iterations=1,
-                        env={"PYBUN_X_CACHE": tmpdir},  # Use temp cache
-                        trim_ratio=trim_ratio,
-                    )
-                    result.scenario = f"B4.1_cold_{package}"
-                    result.tool = "pybun"
-                    result.metadata["package"] = package
-                    result.metadata["type"] = "cold"
-                    results.append(result)
-                    print(f"    pybun x: {result.duration_ms:.2f}ms")
+            cold_envs: dict[str, dict[str, str]] = {}
+            cold_runs = []
+            for tool, label, prefix, cache_env in tools:
+                cache_dir = os.path.join(tmpdir, tool)
+                os.mkdir(cache_dir)
+                cold_envs[tool] = {cache_env: cache_dir}  # Use temp cache
+                cold_runs.append((label, functools.partial(
+                    measure,
+                    [*prefix, package, "--help"],
+                    scenario=f"B4.1_cold_{package}",
+                    tool=tool,
+                    metadata={"package": package, "type": "cold"},
+                    indent="    ",
+                    warmup=0,  # No warmup for cold run
+                    iterations=1,
+                    env=cold_envs[tool],
+                )))
+            phase(cold_runs, indent="    ")
             
-            # pipx
-            if pipx_path:
-                cmd = [pipx_path, "run", package, "--help"]
-                if dry_run:
-                    print(f"    Would run: {' '.join(cmd)}")
-                else:
-                    if verbose:
-                        print(f"    Running: {' '.join(cmd)}")
-                    result = measure_command(
-                        cmd,
-                        warmup=0,
-                        iterations=1,
-                        env={"PIPX_HOME": tmpdir},
-                        trim_ratio=trim_ratio,
-                    )
-                    result.scenario = f"B4.1_cold_{package}"
-                    result.tool = "pipx"
-                    result.metadata["package"] = package
-                    result.metadata["type"] = "cold"
-                    results.append(result)
-                    print(f"    pipx run: {result.duration_ms:.2f}ms")
+            # === B4.2: Warm Run (cached) ===
+            print(f"\n  B4.2: Warm Run ({package})")
             
-            # uvx
-            if uvx_path:
-                # uvx or uv tool run
-                if "uv" in str(uvx_path) and "uvx" not in str(uvx_path):
-                    cmd = [uvx_path, "tool", "run", package, "--help"]
-                else:
-                    cmd = [uvx_path, package, "--help"]
-                
-                if dry_run:
-                    print(f"    Would run: {' '.join(cmd)}")
-                else:
-                    if verbose:
-                        print(f"    Running: {' '.join(cmd)}")
-                    result = measure_command(
-                        cmd,
-                        warmup=0,
-                        iterations=1,
-                        env={"UV_TOOL_DIR": tmpdir},
-                        trim_ratio=trim_ratio,
-                    )
-                    result.scenario = f"B4.1_cold_{package}"
-                    result.tool = "uvx"
-                    result.metadata["package"] = package
-                    result.metadata["type"] = "cold"
-                    results.append(result)
-                    print(f"    uvx: {result.duration_ms:.2f}ms")
-        
-        # === B4.2: Warm Run (cached) ===
-        print(f"\n  B4.2: Warm Run ({package})")
-        
-        # PyBun
-        if pybun_path:
-            cmd = [pybun_path, "x", package, "--help"]
-            if dry_run:
-                print(f"    Would run: {' '.join(cmd)}")
-            else:
-                if verbose:
-                    print(f"    Running: {' '.join(cmd)}")
-                result = measure_command(
-                    cmd,
-                    warmup=warmup,
+            phase([
+                (label, functools.partial(
+                    measure,
+                    [*prefix, package, "--help"],
+                    scenario=f"B4.2_warm_{package}",
+                    tool=tool,
+                    metadata={"package": package, "type": "warm"},
+                    indent="    ",
+                    warmup=0 if warmup_shared else warmup,
                     iterations=iterations,
-                    trim_ratio=trim_ratio,
-                )
-                result.scenario = f"B4.2_warm_{package}"
-                result.tool = "pybun"
-                result.metadata["package"] = package
-                result.metadata["type"] = "warm"
-                results.append(result)
-                print(f"    pybun x: {result.duration_ms:.2f}ms")
-        
-        # pipx
-        if pipx_path:
-            cmd = [pipx_path, "run", package, "--help"]
-            if dry_run:
-                print(f"    Would run: {' '.join(cmd)}")
-            else:
-                if verbose:
-                    print(f"    Running: {' '.join(cmd)}")
-                result = measure_command(
-                    cmd,
-                    warmup=warmup,
-                    iterations=iterations,
-                    trim_ratio=trim_ratio,
-                )
-                result.scenario = f"B4.2_warm_{package}"
-                result.tool = "pipx"
-                result.metadata["package"] = package
-                result.metadata["type"] = "warm"
-                results.append(result)
-                print(f"    pipx run: {result.duration_ms:.2f}ms")
-        
-        # uvx
-        if uvx_path:
-            if "uv" in str(uvx_path) and "uvx" not in str(uvx_path):
-                cmd = [uvx_path, "tool", "run", package, "--help"]
-            else:
-                cmd = [uvx_path, package, "--help"]
-            
-            if dry_run:
-                print(f"    Would run: {' '.join(cmd)}")
-            else:
-                if verbose:
-                    print(f"    Running: {' '.join(cmd)}")
-                result = measure_command(
-                    cmd,
-                    warmup=warmup,
-                    iterations=iterations,
-                    trim_ratio=trim_ratio,
-                )
-                result.scenario = f"B4.2_warm_{package}"
-                result.tool = "uvx"
-                result.metadata["package"] = package
-                result.metadata["type"] = "warm"
-                results.append(result)
-                print(f"    uvx: {result.duration_ms:.2f}ms")
+                    env=cold_envs[tool] if warmup_shared else None,
+                ))
+                for tool, label, prefix, _ in tools
+            ], indent="    ")
     
     # === B4.3: Version-specified Run ===
     print("\n--- B4.3: Version-specified Run ---")
@@ -196,65 +155,18 @@ def adhoc_benchmark(config: dict, scenario_config: dict, base_dir: Path) -> list
     # Test with a specific version of black
     versioned_package = "black==23.12.1"
     
-    if pybun_path:
-        cmd = [pybun_path, "x", versioned_package, "--help"]
-        if dry_run:
-            print(f"  Would run: {' '.join(cmd)}")
-        else:
-            if verbose:
-                print(f"  Running: {' '.join(cmd)}")
-                result = measure_command(
-                    cmd,
-                    warmup=warmup,
-                    iterations=iterations,
-                    trim_ratio=trim_ratio,
-                )
-            result.scenario = "B4.3_versioned"
-            result.tool = "pybun"
-            result.metadata["package"] = versioned_package
-            results.append(result)
-            print(f"  pybun x {versioned_package}: {result.duration_ms:.2f}ms")
-    
-    if pipx_path:
-        cmd = [pipx_path, "run", versioned_package, "--help"]
-        if dry_run:
-            print(f"  Would run: {' '.join(cmd)}")
-        else:
-            if verbose:
-                print(f"  Running: {' '.join(cmd)}")
-            result = measure_command(
-                cmd,
-                warmup=warmup,
-                iterations=iterations,
-                trim_ratio=trim_ratio,
-            )
-            result.scenario = "B4.3_versioned"
-            result.tool = "pipx"
-            result.metadata["package"] = versioned_package
-            results.append(result)
-            print(f"  pipx run {versioned_package}: {result.duration_ms:.2f}ms")
-    
-    if uvx_path:
-        if "uv" in str(uvx_path) and "uvx" not in str(uvx_path):
-            cmd = [uvx_path, "tool", "run", versioned_package, "--help"]
-        else:
-            cmd = [uvx_path, versioned_package, "--help"]
-        
-        if dry_run:
-            print(f"  Would run: {' '.join(cmd)}")
-        else:
-            if verbose:
-                print(f"  Running: {' '.join(cmd)}")
-            result = measure_command(
-                cmd,
-                warmup=warmup,
-                iterations=iterations,
-                trim_ratio=trim_ratio,
-            )
-            result.scenario = "B4.3_versioned"
-            result.tool = "uvx"
-            result.metadata["package"] = versioned_package
-            results.append(result)
-            print(f"  uvx {versioned_package}: {result.duration_ms:.2f}ms")
+    phase([
+        (f"{label} {versioned_package}", functools.partial(
+            measure,
+            [*prefix, versioned_package, "--help"],
+            scenario="B4.3_versioned",
+            tool=tool,
+            metadata={"package": versioned_package},
+            indent="  ",
+            warmup=versioned_warmup,
+            iterations=iterations,
+        ))
+        for tool, label, prefix, _ in tools
+    ], indent="  ")
     
     return results
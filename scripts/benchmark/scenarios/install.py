@@ -12,65 +12,331 @@ Scenarios:
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import os
+import shlex
 import shutil
+import subprocess
+import sys
 import tempfile
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Callable
 
 # These are injected by bench.py when loading this module
-# scenario, BenchResult, find_tool, is_tool_enabled, measure_command
+# scenario, BenchResult, find_tool, is_tool_enabled, measure_command, pin_cpu_for, result_sink, run_phase
 
 
-SIMPLE_REQUIREMENTS = """\
-requests>=2.28.0
-click>=8.0.0
-rich>=13.0.0
-"""
+# Run trees hold whole venvs; a stray unremovable file must not fail the
+# scenario at cleanup. ignore_cleanup_errors requires Python 3.10.
+_TMP_CLEANUP: dict[str, bool] = {"ignore_cleanup_errors": True} if sys.version_info >= (3, 10) else {}
 
-MEDIUM_REQUIREMENTS = """\
-requests>=2.28.0
-click>=8.0.0
-pydantic>=2.0.0
-httpx>=0.24.0
-rich>=13.0.0
-typer>=0.9.0
-python-dotenv>=1.0.0
-aiohttp>=3.8.0
-fastapi>=0.100.0
-uvicorn>=0.23.0
-"""
+# Each tier extends the previous one, so B2.3's prewarm covers every phase.
+SIMPLE_SPECS = (
+    "requests>=2.28.0",
+    "click>=8.0.0",
+    "rich>=13.0.0",
+)
+
+MEDIUM_SPECS = SIMPLE_SPECS + (
+    "pydantic>=2.0.0",
+    "httpx>=0.24.0",
+    "typer>=0.9.0",
+    "python-dotenv>=1.0.0",
+    "aiohttp>=3.8.0",
+    "fastapi>=0.100.0",
+    "uvicorn>=0.23.0",
+)
+
+LARGE_SPECS = MEDIUM_SPECS + (
+    "sqlalchemy>=2.0.0",
+    "alembic>=1.11.0",
+    "celery>=5.3.0",
+    "redis>=4.6.0",
+    "boto3>=1.28.0",
+    "pytest>=7.4.0",
+    "pytest-cov>=4.1.0",
+    "black>=23.7.0",
+    "ruff>=0.0.280",
+    "mypy>=1.4.0",
+    "jinja2>=3.1.0",
+    "pyyaml>=6.0.0",
+    "toml>=0.10.0",
+    "orjson>=3.9.0",
+    "msgpack>=1.0.0",
+    "websockets>=11.0.0",
+    "starlette>=0.27.0",
+    "anyio>=3.7.0",
+    "tenacity>=8.2.0",
+    "structlog>=23.1.0",
+)
+
+SIMPLE_REQUIREMENTS = "\n".join(SIMPLE_SPECS) + "\n"
+MEDIUM_REQUIREMENTS = "\n".join(MEDIUM_SPECS) + "\n"
+LARGE_REQUIREMENTS = "\n".join(LARGE_SPECS) + "\n"
+LARGE_PACKAGE_COUNT = len(LARGE_SPECS)
+
+
+@dataclass(frozen=True)
+class InstallCase:
+    """One B2.x phase: what to install, how many times, and with which flags."""
+    scenario: str
+    title: str
+    mode: str
+    requirements: str
+    # Install from the prewarmed .bench_cache rather than bypassing caches
+    cached: bool
+    # scenario_config flag that can turn the case off (None: always runs)
+    toggle: str | None = None
+    # None means the general warmup/iterations settings
+    warmup: int | None = None
+    iterations: int | None = None
+    uv_args: tuple[str, ...] = ()
+    pip_args: tuple[str, ...] = ()
+    metadata: dict | None = None
+
+
+INSTALL_CASES = (
+    InstallCase(
+        "B2.1_cold_install", "B2.1: Cold Install (no cache)", "cold", SIMPLE_REQUIREMENTS,
+        cached=False, toggle="cold_cache", warmup=0, iterations=1,
+        uv_args=("--no-cache",), pip_args=("--no-cache-dir",),
+    ),
+    InstallCase(
+        "B2.2_warm_install", "B2.2: Warm Install (cached)", "warm", SIMPLE_REQUIREMENTS,
+        cached=True, toggle="warm_cache",
+    ),
+    InstallCase(
+        "B2.3_large_install", "B2.3: Large Project Install", "large", LARGE_REQUIREMENTS,
+        cached=True, warmup=0, iterations=1, metadata={"package_count": LARGE_PACKAGE_COUNT},
+    ),
+)
+
+
+def _requirements_file(root: Path, requirements_text: str) -> Path:
+    """
+    Return a requirements file in root holding requirements_text.
+
+    Files are named by content hash, so each distinct text is written once
+    however many phases and tools install it (and, under .bench_cache, once
+    across benchmark runs).
+    """
+    digest = hashlib.blake2b(requirements_text.encode(), digest_size=8).hexdigest()
+    path = root / f"requirements-{digest}.txt"
+    if not path.exists():
+        # Write under a private name first so a concurrent run never sees a partial file
+        partial = path.with_name(f".{path.name}.{os.getpid()}")
+        partial.write_text(requirements_text)
+        os.replace(partial, path)
+    return path
 
-LARGE_REQUIREMENTS = """\
-requests>=2.28.0
-click>=8.0.0
-pydantic>=2.0.0
-httpx>=0.24.0
-rich>=13.0.0
-typer>=0.9.0
-python-dotenv>=1.0.0
-aiohttp>=3.8.0
-fastapi>=0.100.0
-uvicorn>=0.23.0
-sqlalchemy>=2.0.0
-alembic>=1.11.0
-celery>=5.3.0
-redis>=4.6.0
-boto3>=1.28.0
-pytest>=7.4.0
-pytest-cov>=4.1.0
-black>=23.7.0
-ruff>=0.0.280
-mypy>=1.4.0
-jinja2>=3.1.0
-pyyaml>=6.0.0
-toml>=0.10.0
-orjson>=3.9.0
-msgpack>=1.0.0
-websockets>=11.0.0
-starlette>=0.27.0
-anyio>=3.7.0
-tenacity>=8.2.0
-structlog>=23.1.0
-"""
+
+def _link_requirements(source: Path, tmp: Path) -> Path:
+    """Hard-link source into tmp as requirements.txt (copy across filesystems)."""
+    dest = tmp / "requirements.txt"
+    try:
+        os.link(source, dest)
+    except OSError:
+        shutil.copyfile(source, dest)
+    return dest
+
+
+def _make_pip_template(python_path: str, root: Path) -> Path | None:
+    """
+    Create, once, the venv every pip run is copied from; None if that failed.
+
+    `python -m venv` bootstraps pip and takes seconds; copying the result
+    takes a fraction of that.
+    """
+    template = root / "pip_template_venv"
+    try:
+        subprocess.run([python_path, "-m", "venv", str(template)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except OSError:
+        return None
+    return template if (template / "bin" / "pip").exists() else None
+
+
+def _copy_pip_venv(template: Path, dest: Path) -> list[str]:
+    """Copy the template venv to dest and return the command prefix for its pip."""
+    shutil.copytree(template, dest, symlinks=True)
+    # Console scripts in the copy still carry the template's shebang, so run
+    # pip through the copy's own interpreter.
+    return [str(dest / "bin" / "python"), "-m", "pip"]
+
+
+def _drop_caches(paths: list[Path], helper: str = "") -> str:
+    """
+    Best-effort eviction of paths from the OS page cache before a cold run.
+
+    A configured helper (e.g. a sudo wrapper around drop_caches) or root drops
+    the whole cache; otherwise every file under paths is fadvised away.
+    """
+    if helper:
+        result = subprocess.run(shlex.split(helper), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        return "cleared" if result.returncode == 0 else "error"
+    os.sync()  # dirty pages cannot be dropped
+    if sys.platform == "linux" and os.geteuid() == 0:
+        try:
+            Path("/proc/sys/vm/drop_caches").write_text("3")
+            return "cleared"
+        except OSError:
+            pass  # e.g. read-only /proc in a container; fall back to fadvise
+    if not hasattr(os, "posix_fadvise"):
+        return "unsupported"
+    for root in paths:
+        for dirpath, _dirnames, filenames in os.walk(root):
+            for name in filenames:
+                try:
+                    fd = os.open(os.path.join(dirpath, name), os.O_RDONLY | os.O_NOFOLLOW)
+                except OSError:
+                    continue  # symlinks, sockets, vanished files
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                finally:
+                    os.close(fd)
+    return "fadvised"
+
+
+def _prewarm_caches(
+    uv_path: str | None,
+    pip_template: Path | None,
+    requirements: Path,
+    cache_env: dict[str, str],
+    tmp: Path,
+) -> list[str]:
+    """
+    Install requirements once per tool, in tmp, so the shared caches hold every wheel.
+
+    Returns the tools whose prewarm failed.
+    """
+    env = {**os.environ, **cache_env}
+    quiet = {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL, "env": env, "check": True}
+    failed = []
+    tmp.mkdir()
+    requirements = _link_requirements(requirements, tmp)
+    if uv_path:
+        venv = tmp / "uv_venv"
+        try:
+            subprocess.run([uv_path, "venv", str(venv)], **quiet)
+            subprocess.run([
+                uv_path, "pip", "install",
+                "-r", str(requirements),
+                "--python", str(venv / "bin" / "python"),
+            ], **quiet)
+        except subprocess.CalledProcessError:
+            failed.append("uv")
+    if pip_template:
+        try:
+            pip = _copy_pip_venv(pip_template, tmp / "pip_venv")
+            subprocess.run([*pip, "install", "-r", str(requirements)], **quiet)
+        except (subprocess.CalledProcessError, OSError):
+            failed.append("pip")
+    return failed
+
+
+def _setup_failed(error: str, *, scenario: str, tool: str, metadata: dict | None, **_measure_kwargs):
+    """Failed result for a run whose setup broke, so it is not measured at all."""
+    return BenchResult(
+        scenario=scenario,
+        tool=tool,
+        duration_ms=0.0,
+        success=False,
+        error=error,
+        metadata=dict(metadata or {}),
+    )
+
+
+def _measure_install(
+    cmd: list[str],
+    tmp: Path,
+    *,
+    scenario: str,
+    tool: str,
+    metadata: dict | None,
+    dry_run: bool,
+    verbose: bool,
+    drop_caches: Callable[[Path], str] | None = None,
+    **measure_kwargs,
+):
+    """
+    Measure one install command in tmp, or print it for --dry-run and return None.
+
+    drop_caches, if given, is called with tmp right before measuring.
+    """
+    if dry_run:
+        print(f"  Would run: {' '.join(cmd)}")
+        return None
+    if verbose:
+        print(f"  Running: {' '.join(cmd)}")
+    fs_cache = drop_caches(tmp) if drop_caches else None
+    result = measure_command(cmd, cwd=str(tmp), **measure_kwargs)
+    result.scenario = scenario
+    result.tool = tool
+    if metadata:
+        result.metadata.update(metadata)
+    if fs_cache:
+        result.metadata["fs_cache"] = fs_cache
+    return result
+
+
+def _uv_install(
+    uv_path: str,
+    requirements: Path,
+    tmp: Path,
+    *,
+    install_args: tuple[str, ...] = (),
+    dry_run: bool,
+    **kwargs,
+):
+    """`uv pip install -r` into a fresh venv in the new directory tmp."""
+    tmp.mkdir()
+    requirements = _link_requirements(requirements, tmp)
+    test_venv = tmp / "uv_venv"
+    if not dry_run:
+        try:
+            subprocess.run([uv_path, "venv", str(test_venv)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        except subprocess.CalledProcessError as e:
+            return _setup_failed(f"uv venv exited with {e.returncode}", tool="uv", **kwargs)
+    
+    cmd = [
+        uv_path, "pip", "install",
+        "-r", str(requirements),
+        "--python", str(test_venv / "bin" / "python"),
+        *install_args,
+    ]
+    return _measure_install(cmd, tmp, tool="uv", dry_run=dry_run, **kwargs)
+
+
+def _pip_install(
+    pip_template: Path | None,
+    requirements: Path,
+    tmp: Path,
+    *,
+    install_args: tuple[str, ...] = (),
+    dry_run: bool,
+    **kwargs,
+):
+    """
+    `pip install -r` in a fresh copy of the template venv, in the new directory tmp.
+
+    pip_template is None on dry runs (nothing is set up) and when creating it
+    failed, which is recorded as a failed result rather than skipped.
+    """
+    if dry_run:
+        pip = [str(tmp / "pip_venv" / "bin" / "python"), "-m", "pip"]
+        cmd = [*pip, "install", "-r", str(tmp / "requirements.txt"), *install_args]
+        return _measure_install(cmd, tmp, tool="pip", dry_run=True, **kwargs)
+    if pip_template is None:
+        return _setup_failed("python -m venv did not provide pip (is ensurepip available?)", tool="pip", **kwargs)
+    tmp.mkdir()
+    requirements = _link_requirements(requirements, tmp)
+    try:
+        pip = _copy_pip_venv(pip_template, tmp / "pip_venv")
+    except OSError as e:  # shutil.Error is an OSError
+        return _setup_failed(f"copying the pip template venv failed: {e}", tool="pip", **kwargs)
+    cmd = [*pip, "install", "-r", str(requirements), *install_args]
+    return _measure_install(cmd, tmp, tool="pip", dry_run=dry_run, **kwargs)
 
 
 def install_benchmark(config: dict, scenario_config: dict, base_dir: Path) -> list:
@@ -83,230 +349,90 @@ def install_benchmark(config: dict, scenario_config: dict, base_dir: Path) -> li
     trim_ratio = scenario_config.get("trim_ratio", general.get("trim_ratio", 0.0))
     dry_run = config.get("dry_run", False)
     verbose = config.get("verbose", False)
+    parallel_tools = scenario_config.get("parallel_tools", False)
+    pin_cpu = pin_cpu_for(config, scenario_config, parallel=parallel_tools and not dry_run)
     
     # Find tools
-    pybun_path = find_tool("pybun", config)
     uv_path = find_tool("uv", config) if is_tool_enabled("uv", config) else None
     pip_path = find_tool("pip", config) if is_tool_enabled("pip", config) else None
+    # pip is measured inside copies of one `python -m venv`, so it also needs python
+    python_path = find_tool("python3", config) or find_tool("python", config)
     
-    cold_cache = scenario_config.get("cold_cache", True)
-    warm_cache = scenario_config.get("warm_cache", True)
+    # B2.2 and B2.3 install from one persistent wheel cache per tool, filled
+    # once up front, so they measure installing from cache rather than PyPI
+    # latency. B2.1 passes --no-cache/--no-cache-dir and never touches it.
+    cache_root = base_dir / ".bench_cache"
+    # Optional local PyPI mirror/proxy (devpi, proxpi, ...) so that no phase
+    # measures WAN latency. Nothing is started here; point it at a running one.
+    index_url = scenario_config.get("index_url", general.get("index_url", ""))
+    index_env = {"UV_INDEX_URL": index_url, "PIP_INDEX_URL": index_url} if index_url else {}
+    cache_env = {**index_env, "UV_CACHE_DIR": str(cache_root / "uv"), "PIP_CACHE_DIR": str(cache_root / "pip")}
     
-    # === B2.1: Cold Install ===
-    if cold_cache:
-        print("\n--- B2.1: Cold Install (no cache) ---")
-        
-        with tempfile.TemporaryDirectory(prefix="pybun_install_cold_") as tmpdir:
-            tmp = Path(tmpdir)
-            venv_dir = tmp / "venv"
-            requirements = tmp / "requirements.txt"
-            requirements.write_text(SIMPLE_REQUIREMENTS)
-            
-            # Create fresh venv for each tool
-            python_path = find_tool("python3", config) or find_tool("python", config)
-            
-            # uv (usually fastest)
-            if uv_path:
-                test_venv = tmp / "uv_venv"
-                cmd = [uv_path, "venv", str(test_venv)]
-                if not dry_run:
-                    import subprocess
-                    subprocess.run(cmd, capture_output=True)
-                
-                cmd = [
-                    uv_path, "pip", "install",
-                    "-r", str(requirements),
-                    "--python", str(test_venv / "bin" / "python"),
-                    "--no-cache",
-                ]
-                if dry_run:
-                    print(f"  Would run: {' '.join(cmd)}")
-                else:
-                    if verbose:
-                        print(f"  Running: {' '.join(cmd)}")
-                    result = measure_command(
-                        cmd,
-                        warmup=0,  # No warmup for cold
-                        iterations=1,
-                        trim_ratio=trim_ratio,
-                        cwd=str(tmp),
-                    )
-                    result.scenario = "B2.1_cold_install"
-                    result.tool = "uv"
-                    results.append(result)
-                    print(f"  uv pip install (cold): {result.duration_ms:.2f}ms")
-            
-            # pip
-            if pip_path:
-                test_venv = tmp / "pip_venv"
-                if python_path and not dry_run:
-                    import subprocess
-                    subprocess.run([python_path, "-m", "venv", str(test_venv)], capture_output=True)
-                
-                pip_in_venv = test_venv / "bin" / "pip"
-                if pip_in_venv.exists():
-                    cmd = [str(pip_in_venv), "install", "-r", str(requirements), "--no-cache-dir"]
-                    if dry_run:
-                        print(f"  Would run: {' '.join(cmd)}")
-                    else:
-                        if verbose:
-                            print(f"  Running: {' '.join(cmd)}")
-                        result = measure_command(
-                            cmd,
-                            warmup=0,
-                            iterations=1,
-                            trim_ratio=trim_ratio,
-                            cwd=str(tmp),
-                        )
-                        result.scenario = "B2.1_cold_install"
-                        result.tool = "pip"
-                        results.append(result)
-                        print(f"  pip install (cold): {result.duration_ms:.2f}ms")
+    # --no-cache only bypasses the tools' own caches; without this the page
+    # cache still holds whatever the previous tool read, biasing B2.1.
+    clear_fs_cache = scenario_config.get("clear_fs_cache", True)
+    drop_caches_helper = scenario_config.get("drop_caches_helper", "")
     
-    # === B2.2: Warm Install ===
-    if warm_cache:
-        print("\n--- B2.2: Warm Install (cached) ---")
+    def drop_caches(tmp: Path) -> str:
+        return _drop_caches([tmp, cache_root], drop_caches_helper)
+    
+    # One temp dir for the whole scenario: the pip template venv and the
+    # requirements files shared by all phases, plus one subdirectory per run.
+    with tempfile.TemporaryDirectory(prefix="pybun_install_", **_TMP_CLEANUP) as root_dir, \
+            result_sink(results, scenario_config.get("out_jsonl"), base_dir) as emit:
+        root = Path(root_dir)
+        pip_template = None
+        if pip_path and python_path and not dry_run:
+            pip_template = _make_pip_template(python_path, root)
+            if pip_template is None:
+                print("  Warning: python -m venv did not provide pip; pip results will be recorded as failed")
+        
+        # Canonical requirements files, linked into each run's directory.
+        # They persist in .bench_cache; --dry-run leaves that untouched.
+        reqs_dir = root if dry_run else cache_root / "reqs"
+        reqs_dir.mkdir(parents=True, exist_ok=True)
+        
+        common = {"dry_run": dry_run, "verbose": verbose, "trim_ratio": trim_ratio, "pin_cpu": pin_cpu}
+        phase = functools.partial(run_phase, emit, parallel=parallel_tools)
         
-        with tempfile.TemporaryDirectory(prefix="pybun_install_warm_") as tmpdir:
-            tmp = Path(tmpdir)
-            requirements = tmp / "requirements.txt"
-            requirements.write_text(SIMPLE_REQUIREMENTS)
-            
-            python_path = find_tool("python3", config) or find_tool("python", config)
-            
-            # uv (with cache)
+        def runs_for(case: InstallCase) -> list[tuple[str, Callable]]:
+            requirements = _requirements_file(reqs_dir, case.requirements)
+            measure_kwargs = {
+                **common,
+                "scenario": case.scenario,
+                "metadata": case.metadata,
+                "warmup": warmup if case.warmup is None else case.warmup,
+                "iterations": iterations if case.iterations is None else case.iterations,
+                "env": cache_env if case.cached else index_env,
+                "drop_caches": drop_caches if clear_fs_cache and not case.cached else None,
+            }
+            runs = []
             if uv_path:
-                test_venv = tmp / "uv_venv"
-                if not dry_run:
-                    import subprocess
-                    subprocess.run([uv_path, "venv", str(test_venv)], capture_output=True)
-                    # Prime the cache
-                    subprocess.run([
-                        uv_path, "pip", "install",
-                        "-r", str(requirements),
-                        "--python", str(test_venv / "bin" / "python"),
-                    ], capture_output=True)
-                
-                # Measure warm install
-                test_venv2 = tmp / "uv_venv2"
-                if not dry_run:
-                    subprocess.run([uv_path, "venv", str(test_venv2)], capture_output=True)
-                
-                cmd = [
-                    uv_path, "pip", "install",
-                    "-r", str(requirements),
-                    "--python", str(test_venv2 / "bin" / "python"),
-                ]
-                if dry_run:
-                    print(f"  Would run: {' '.join(cmd)}")
-                else:
-                    if verbose:
-                        print(f"  Running: {' '.join(cmd)}")
-                    result = measure_command(
-                        cmd,
-                        warmup=warmup,
-                        iterations=iterations,
-                        trim_ratio=trim_ratio,
-                        cwd=str(tmp),
-                    )
-                    result.scenario = "B2.2_warm_install"
-                    result.tool = "uv"
-                    results.append(result)
-                    print(f"  uv pip install (warm): {result.duration_ms:.2f}ms")
-            
-            # pip (with cache)
+                runs.append((f"uv pip install ({case.mode})", functools.partial(
+                    _uv_install, uv_path, requirements, root / f"{case.mode}_uv",
+                    install_args=case.uv_args, **measure_kwargs,
+                )))
             if pip_path and python_path:
-                test_venv = tmp / "pip_venv"
-                if not dry_run:
-                    import subprocess
-                    subprocess.run([python_path, "-m", "venv", str(test_venv)], capture_output=True)
-                
-                pip_in_venv = test_venv / "bin" / "pip"
-                if pip_in_venv.exists():
-                    cmd = [str(pip_in_venv), "install", "-r", str(requirements)]
-                    if dry_run:
-                        print(f"  Would run: {' '.join(cmd)}")
-                    else:
-                        if verbose:
-                            print(f"  Running: {' '.join(cmd)}")
-                        result = measure_command(
-                            cmd,
-                            warmup=warmup,
-                            iterations=iterations,
-                            trim_ratio=trim_ratio,
-                            cwd=str(tmp),
-                        )
-                        result.scenario = "B2.2_warm_install"
-                        result.tool = "pip"
-                        results.append(result)
-                        print(f"  pip install (warm): {result.duration_ms:.2f}ms")
-    
-    # === B2.3: Large Project Install ===
-    print("\n--- B2.3: Large Project Install ---")
-    
-    with tempfile.TemporaryDirectory(prefix="pybun_install_large_") as tmpdir:
-        tmp = Path(tmpdir)
-        requirements = tmp / "requirements.txt"
-        requirements.write_text(LARGE_REQUIREMENTS)
-        
-        python_path = find_tool("python3", config) or find_tool("python", config)
+                runs.append((f"pip install ({case.mode})", functools.partial(
+                    _pip_install, pip_template, requirements, root / f"{case.mode}_pip",
+                    install_args=case.pip_args, **measure_kwargs,
+                )))
+            return runs
         
-        # uv
-        if uv_path:
-            test_venv = tmp / "uv_venv"
-            if not dry_run:
-                import subprocess
-                subprocess.run([uv_path, "venv", str(test_venv)], capture_output=True)
-            
-            cmd = [
-                uv_path, "pip", "install",
-                "-r", str(requirements),
-                "--python", str(test_venv / "bin" / "python"),
-            ]
-            if dry_run:
-                print(f"  Would run: {' '.join(cmd)}")
-            else:
-                if verbose:
-                    print(f"  Running: {' '.join(cmd)}")
-                result = measure_command(
-                    cmd,
-                    warmup=0,
-                    iterations=1,  # Large install, single run
-                    trim_ratio=trim_ratio,
-                    cwd=str(tmp),
+        prewarmed = False
+        for case in INSTALL_CASES:
+            if case.toggle and not scenario_config.get(case.toggle, True):
+                continue
+            if case.cached and not prewarmed and not dry_run:
+                cache_root.mkdir(exist_ok=True)
+                # LARGE_SPECS includes every spec used by the cached cases
+                failed = _prewarm_caches(
+                    uv_path, pip_template, _requirements_file(reqs_dir, LARGE_REQUIREMENTS), cache_env, root / "prewarm",
                 )
-                result.scenario = "B2.3_large_install"
-                result.tool = "uv"
-                result.metadata["package_count"] = len(LARGE_REQUIREMENTS.strip().split("\n"))
-                results.append(result)
-                print(f"  uv pip install (large): {result.duration_ms:.2f}ms")
-        
-        # pip
-        if pip_path and python_path:
-            test_venv = tmp / "pip_venv"
-            if not dry_run:
-                import subprocess
-                subprocess.run([python_path, "-m", "venv", str(test_venv)], capture_output=True)
-            
-            pip_in_venv = test_venv / "bin" / "pip"
-            if pip_in_venv.exists():
-                cmd = [str(pip_in_venv), "install", "-r", str(requirements)]
-                if dry_run:
-                    print(f"  Would run: {' '.join(cmd)}")
-                else:
-                    if verbose:
-                        print(f"  Running: {' '.join(cmd)}")
-                    result = measure_command(
-                        cmd,
-                        warmup=0,
-                        iterations=1,
-                        trim_ratio=trim_ratio,
-                        cwd=str(tmp),
-                    )
-                    result.scenario = "B2.3_large_install"
-                    result.tool = "pip"
-                    result.metadata["package_count"] = len(LARGE_REQUIREMENTS.strip().split("\n"))
-                    results.append(result)
-                    print(f"  pip install (large): {result.duration_ms:.2f}ms")
+                for tool in failed:
+                    print(f"  Warning: {tool} cache prewarm failed; its cached results may include downloads")
+                prewarmed = True
+            print(f"\n--- {case.title} ---")
+            phase(runs_for(case))
     
     return results
@@ -8,20 +8,56 @@ Scenarios:
 - B8.2: pybun_run response time
 - B8.3: pybun_resolve response time
 - B8.4: JSON output overhead
+- B8.5: batched pybun_run calls, sequential vs pipelined
 """
 
 from __future__ import annotations
 
+import contextlib
+import functools
 import io
+import itertools
 import json
+import os
 import select
+import statistics
 import subprocess
 import tempfile
 import time
+import traceback
+from array import array
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used when it isn't installed
+    orjson = None
+
+_READ_CHUNK = 64 * 1024
+
 # These are injected by bench.py when loading this module
-# scenario, BenchResult, find_tool, measure_command
+# scenario, BenchResult, compute_stats, find_tool, measure_command, submit_parallel
+
+
+def _dumps(obj: object) -> bytes:
+    """Serialize one JSON-RPC frame to bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the latter
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _elapsed_ms(start_ns: int) -> float:
+    """Milliseconds since a perf_counter_ns() reading; floats only at this boundary."""
+    return (time.perf_counter_ns() - start_ns) / 1e6
+
+
+def _describe(exc: BaseException) -> str:
+    """One-line 'ExcType: message' for result errors (str(exc) can be empty)."""
+    return "".join(traceback.format_exception_only(type(exc), exc)).strip()
 
 
 def _response_key(request_id: object) -> str:
@@ -58,7 +94,7 @@ def tool_response_error(response: dict | None) -> str | None:
         return None
 
     try:
-        payload = json.loads(text)
+        payload = _loads(text)
     except json.JSONDecodeError:
         return None
 
@@ -83,11 +119,16 @@ class McpStdioSession:
             [pybun_path, "mcp", "serve", "--stdio"],
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1,
+            # Nothing reads stderr; a pipe would fill up over a long shared
+            # session and block the server mid-response
+            stderr=subprocess.DEVNULL,
         )
         self._pending: dict[str, dict] = {}
+        self._buffer = bytearray()
+        self._eof = False
+        self._ids = itertools.count(1)
+        self._initialized = False
+        self._init_error: str | None = None
 
     def __enter__(self) -> "McpStdioSession":
         return self
@@ -98,7 +139,11 @@ class McpStdioSession:
     def close(self) -> None:
         stdin_closed = getattr(self._proc.stdin, "closed", False)
         if self._proc.stdin and not stdin_closed:
-            self._proc.stdin.close()
+            try:
+                self._proc.stdin.close()
+            except BrokenPipeError:
+                # The server already exited; a failed write left bytes buffered
+                pass
         try:
             self._proc.wait(timeout=1)
         except subprocess.TimeoutExpired:
@@ -109,25 +154,86 @@ class McpStdioSession:
                 self._proc.kill()
                 self._proc.wait(timeout=1)
 
+    def next_id(self) -> int:
+        """Return a request id not yet used on this session."""
+        return next(self._ids)
+
+    def initialize(self, timeout: int = 30) -> None:
+        """Run the initialize handshake once per session; raise if it failed."""
+        if not self._initialized:
+            self._initialized = True
+            response, _ = self.send_request(_init_request(self.next_id()), timeout=timeout)
+            error = tool_response_error(response)
+            if error is not None:
+                self._init_error = f"initialize failed: {error}"
+        if self._init_error is not None:
+            raise RuntimeError(self._init_error)
+
     def send_request(self, request: dict, timeout: int = 30) -> tuple[dict | None, float]:
         """Send one request and wait for the matching response id."""
-        expected_id = request.get("id")
+        # Serialize before starting the clock so only the round-trip is timed
+        return self.send_frame(request.get("id"), _dumps(request) + b"\n", timeout=timeout)
+
+    def send_frame(self, expected_id: object, frame: bytes, timeout: int = 30) -> tuple[dict | None, float]:
+        """Send one pre-serialized request frame and wait for `expected_id`."""
         key = _response_key(expected_id)
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
 
         if self._proc.stdin is None:
             return None, 0.0
 
-        self._proc.stdin.write(json.dumps(request) + "\n")
+        self._proc.stdin.write(frame)
         self._proc.stdin.flush()
 
         if key in self._pending:
             response = self._pending.pop(key)
-            return response, (time.perf_counter() - start) * 1000
+            return response, _elapsed_ms(start)
 
         response = self._read_response(expected_id, timeout)
-        elapsed_ms = (time.perf_counter() - start) * 1000
-        return response, elapsed_ms
+        return response, _elapsed_ms(start)
+
+    def send_pipelined(self, requests: list[dict], timeout: int = 30) -> tuple[dict[str, tuple[dict, float]], float]:
+        """
+        Write all requests back-to-back, then collect their responses by id.
+
+        Returns ({response_key: (response, latency_ms)}, total_elapsed_ms),
+        where each latency runs from the single batched write to the moment
+        that response was read. Ids that never answered are absent.
+        """
+        return self.send_frames(
+            [(request.get("id"), _dumps(request) + b"\n") for request in requests],
+            timeout=timeout,
+        )
+
+    def send_frames(
+        self, frames: list[tuple[object, bytes]], timeout: int = 30
+    ) -> tuple[dict[str, tuple[dict, float]], float]:
+        """send_pipelined() for pre-serialized (request_id, frame) pairs."""
+        wanted = {_response_key(request_id) for request_id, _ in frames}
+        received: dict[str, tuple[dict, float]] = {}
+        start = time.perf_counter_ns()
+        deadline = time.perf_counter() + timeout
+
+        if self._proc.stdin is None:
+            return received, 0.0
+
+        self._proc.stdin.write(b"".join(frame for _, frame in frames))
+        self._proc.stdin.flush()
+
+        for key in wanted & self._pending.keys():
+            received[key] = (self._pending.pop(key), _elapsed_ms(start))
+
+        while len(received) < len(wanted):
+            response = self._next_response(deadline)
+            if response is None:
+                break
+            response_key = _response_key(response.get("id"))
+            if response_key in wanted:
+                received[response_key] = (response, _elapsed_ms(start))
+            else:
+                self._pending[response_key] = response
+
+        return received, _elapsed_ms(start)
 
     def _read_response(self, expected_id: object, timeout: int) -> dict | None:
         expected_key = _response_key(expected_id)
@@ -136,51 +242,91 @@ class McpStdioSession:
         if expected_key in self._pending:
             return self._pending.pop(expected_key)
 
-        while time.perf_counter() < deadline:
+        while True:
+            response = self._next_response(deadline)
+            if response is None:
+                return None
+
+            response_key = _response_key(response.get("id"))
+            if response_key == expected_key:
+                return response
+            self._pending[response_key] = response
+
+    def _next_response(self, deadline: float) -> dict | None:
+        """Read lines until one JSON-RPC response with an id arrives, skipping noise."""
+        while not self._eof and time.perf_counter() < deadline:
             remaining = deadline - time.perf_counter()
             line = self._readline_with_timeout(remaining)
             if line is None:
                 continue
 
+            # Log noise on stdout is skipped without attempting a JSON parse
             stripped = line.strip()
-            if not stripped:
+            if not stripped.startswith(b"{"):
                 continue
 
             try:
-                response = json.loads(stripped)
+                response = _loads(stripped)
             except json.JSONDecodeError:
                 continue
 
-            if not isinstance(response, dict) or "id" not in response:
-                continue
-
-            response_key = _response_key(response.get("id"))
-            if response_key == expected_key:
+            if isinstance(response, dict) and "id" in response:
                 return response
-            self._pending[response_key] = response
 
         return None
 
-    def _readline_with_timeout(self, timeout: float) -> str | None:
-        if self._proc.stdout is None:
+    def _readline_with_timeout(self, timeout: float) -> bytes | None:
+        """
+        Return the next complete stdout line, or None on timeout/EOF.
+
+        Lines are framed from our own buffer filled with os.read, so a chunk
+        carrying several responses never leaves one stranded in a Python-side
+        buffer that select() cannot see, and logs are never accumulated.
+        """
+        stdout = self._proc.stdout
+        if stdout is None or self._eof:
             return None
 
-        fileno = getattr(self._proc.stdout, "fileno", None)
-        if callable(fileno):
-            try:
-                ready, _, _ = select.select([self._proc.stdout], [], [], timeout)
-            except (OSError, ValueError, io.UnsupportedOperation):
-                ready = None
-            if ready == []:
+        try:
+            fd = stdout.fileno()
+        except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+            fd = None
+        if fd is None:
+            line = stdout.readline()
+            if not line and self._proc.poll() is not None:
+                self._eof = True
+            return line or None
+
+        newline = self._buffer.find(b"\n")
+        if newline < 0:
+            ready, _, _ = select.select([fd], [], [], max(timeout, 0))
+            if not ready:
                 return None
-
-        line = self._proc.stdout.readline()
-        if line == "":
-            if self._proc.poll() is not None:
+            chunk = os.read(fd, _READ_CHUNK)
+            if not chunk:
+                self._eof = True
+                line, self._buffer = bytes(self._buffer), bytearray()
+                return line or None
+            self._buffer += chunk
+            newline = self._buffer.find(b"\n")
+            if newline < 0:
                 return None
+
+        line = bytes(self._buffer[: newline + 1])
+        del self._buffer[: newline + 1]
         return line
 
 
+@contextlib.contextmanager
+def _initialized_session(pybun_path: str, session: McpStdioSession | None, timeout: int):
+    """Yield the shared session if one is given, else a fresh one; initialized either way."""
+    with contextlib.ExitStack() as stack:
+        if session is None:
+            session = stack.enter_context(McpStdioSession(pybun_path))
+        session.initialize(timeout)
+        yield session
+
+
 def send_mcp_request(pybun_path: str, request: dict, timeout: int = 30) -> tuple[dict | None, float]:
     """
     Send a single JSON-RPC request in a fresh MCP stdio session.
@@ -190,7 +336,8 @@ def send_mcp_request(pybun_path: str, request: dict, timeout: int = 30) -> tuple
         with McpStdioSession(pybun_path) as session:
             return session.send_request(request, timeout=timeout)
     except Exception:
-        return None, 0.0
+        # NaN, not 0.0: a failed round-trip must never pass for a fast one
+        return None, float("nan")
 
 
 def measure_mcp_round(
@@ -209,18 +356,10 @@ def measure_mcp_round(
     return init_response, call_response, call_time
 
 
-def measure_mcp_tool(
-    pybun_path: str,
-    tool_name: str,
-    arguments: dict,
-    iterations: int = 5,
-    warmup: int = 1,
-) -> BenchResult:
-    """Measure MCP tool call latency."""
-    # Initialize request
-    init_request = {
+def _init_request(request_id: int = 1) -> dict:
+    return {
         "jsonrpc": "2.0",
-        "id": 1,
+        "id": request_id,
         "method": "initialize",
         "params": {
             "protocolVersion": "2024-11-05",
@@ -228,60 +367,73 @@ def measure_mcp_tool(
             "clientInfo": {"name": "benchmark", "version": "1.0.0"},
         },
     }
-    
-    # Tool call request
-    call_request = {
-        "jsonrpc": "2.0",
-        "id": 2,
-        "method": "tools/call",
-        "params": {
-            "name": tool_name,
-            "arguments": arguments,
-        },
-    }
-    
-    times: list[float] = []
+
+
+class _CallFrames:
+    """tools/call frames for one tool and argument set, serialized once."""
+
+    def __init__(self, tool_name: str, arguments: dict) -> None:
+        body = _dumps({
+            "jsonrpc": "2.0",
+            "method": "tools/call",
+            "params": {
+                "name": tool_name,
+                "arguments": arguments,
+            },
+        })
+        # Only the id differs between calls, so it is spliced onto the end
+        self._prefix = body[:-1] + b',"id":'
+
+    def frame(self, request_id: int) -> bytes:
+        return b"%s%d}\n" % (self._prefix, request_id)
+
+    def next_frame(self, session: McpStdioSession) -> tuple[int, bytes]:
+        request_id = session.next_id()
+        return request_id, self.frame(request_id)
+
+
+def measure_mcp_tool(
+    pybun_path: str,
+    tool_name: str,
+    arguments: dict,
+    iterations: int = 5,
+    warmup: int = 1,
+    timeout: int = 30,
+    session: McpStdioSession | None = None,
+) -> BenchResult:
+    """
+    Measure MCP tool call latency over one persistent server session.
+
+    The server is spawned and initialized once; warmup and timed calls then
+    reuse the same pipe, so each sample is the tool call round-trip alone
+    rather than process startup plus handshake. Pass `session` to reuse a
+    server that is already running (and initialized) across tools.
+    """
+    shared = session is not None
+    call = _CallFrames(tool_name, arguments)
+    times = array("d")
     success = True
     last_error = None
-    
-    # Warmup
-    for _ in range(warmup):
-        try:
-            measure_mcp_round(pybun_path, init_request, call_request)
-        except Exception:
-            pass
 
-    # Timed runs
-    for _ in range(iterations):
-        try:
-            init_response, response, total_time = measure_mcp_round(
-                pybun_path,
-                init_request,
-                call_request,
-            )
-        except Exception as exc:
-            init_response = None
-            response = None
-            total_time = 0.0
-            success = False
-            last_error = str(exc)
-        else:
-            init_error = tool_response_error(init_response)
-            call_error = tool_response_error(response)
-            if init_error is not None:
-                success = False
-                last_error = init_error
-            elif call_error is not None:
-                success = False
-                last_error = call_error
-
-        times.append(total_time)
-    
-    import statistics
-    avg = statistics.mean(times) if times else 0
-    min_t = min(times) if times else 0
-    max_t = max(times) if times else 0
-    stddev = statistics.stdev(times) if len(times) > 1 else 0
+    try:
+        with _initialized_session(pybun_path, session, timeout) as session:
+            for _ in range(warmup):
+                session.send_frame(*call.next_frame(session), timeout=timeout)
+
+            for _ in range(iterations):
+                response, call_time = session.send_frame(*call.next_frame(session), timeout=timeout)
+                call_error = tool_response_error(response)
+                if call_error is not None:
+                    success = False
+                    last_error = call_error
+                # Without a response the elapsed time is a timeout or EOF, not a latency
+                if response is not None:
+                    times.append(call_time)
+    except Exception as exc:
+        success = False
+        last_error = _describe(exc)
+
+    avg, min_t, max_t, stddev, _ = compute_stats(times)
     
     return BenchResult(
         scenario="",
@@ -290,13 +442,200 @@ def measure_mcp_tool(
         min_ms=round(min_t, 2),
         max_ms=round(max_t, 2),
         stddev_ms=round(stddev, 2),
-        iterations=iterations,
+        iterations=len(times),
         success=success,
         error=last_error if not success else None,
-        metadata={"mcp_tool": tool_name},
+        metadata={"mcp_tool": tool_name, "session": "shared" if shared else "persistent"},
     )
 
 
+def measure_mcp_tool_pipelined(
+    pybun_path: str,
+    tool_name: str,
+    arguments: dict,
+    depth: int = 8,
+    iterations: int = 5,
+    warmup: int = 1,
+    timeout: int = 30,
+    session: McpStdioSession | None = None,
+) -> BenchResult:
+    """
+    Measure MCP tool calls with `depth` requests in flight at once.
+
+    Each sample writes `depth` tools/call frames in one go and waits for all
+    of them. duration_ms is the wall time of one such round; metadata adds
+    the median per-call latency and the overall calls/sec throughput.
+    """
+    shared = session is not None
+    # Unboxed doubles: pipelined runs collect iterations * depth latencies
+    latencies = array("d")
+    round_times = array("d")
+    success = True
+    last_error = None
+
+    call = _CallFrames(tool_name, arguments)
+
+    def batch() -> list[tuple[int, bytes]]:
+        return [call.next_frame(session) for _ in range(depth)]
+
+    try:
+        with _initialized_session(pybun_path, session, timeout) as session:
+            for _ in range(warmup):
+                session.send_frames(batch(), timeout=timeout)
+
+            for _ in range(iterations):
+                received, round_time = session.send_frames(batch(), timeout=timeout)
+                if len(received) < depth:
+                    success = False
+                    last_error = f"{depth - len(received)} of {depth} pipelined calls got no response"
+                for response, latency in received.values():
+                    call_error = tool_response_error(response)
+                    if call_error is not None:
+                        success = False
+                        last_error = call_error
+                    latencies.append(latency)
+                if len(received) == depth:
+                    round_times.append(round_time)
+    except Exception as exc:
+        success = False
+        last_error = _describe(exc)
+
+    avg, min_t, max_t, stddev, _ = compute_stats(round_times)
+    total_s = sum(round_times) / 1000
+
+    return BenchResult(
+        scenario="",
+        tool="pybun_mcp",
+        duration_ms=round(avg, 2),
+        min_ms=round(min_t, 2),
+        max_ms=round(max_t, 2),
+        stddev_ms=round(stddev, 2),
+        iterations=len(round_times),
+        success=success,
+        error=last_error if not success else None,
+        metadata={
+            "mcp_tool": tool_name,
+            "session": "shared" if shared else "persistent",
+            "pipeline_depth": depth,
+            "p50_latency_ms": round(statistics.median(latencies), 2) if latencies else None,
+            "ops_per_sec": round(len(latencies) / total_s, 1) if total_s > 0 else None,
+        },
+    )
+
+
+def measure_mcp_batch(
+    pybun_path: str,
+    tool_name: str,
+    arguments_list: list[dict],
+    iterations: int = 5,
+    warmup: int = 1,
+    timeout: int = 30,
+    session: McpStdioSession | None = None,
+) -> tuple[BenchResult, BenchResult]:
+    """
+    Compare one batch of tool calls issued sequentially vs pipelined.
+
+    Both modes share one server session and send the same calls; each sample
+    is the wall time for the whole batch. Returns (sequential, pipelined).
+    """
+    batch_size = len(arguments_list)
+    samples = {"sequential": array("d"), "pipelined": array("d")}
+    errors: dict[str, str | None] = {"sequential": None, "pipelined": None}
+
+    calls = [_CallFrames(tool_name, arguments) for arguments in arguments_list]
+
+    def batch(session: McpStdioSession) -> list[tuple[int, bytes]]:
+        return [call.next_frame(session) for call in calls]
+
+    def run_sequential(session: McpStdioSession) -> tuple[float, str | None]:
+        error = None
+        start = time.perf_counter_ns()
+        for request_id, frame in batch(session):
+            response, _ = session.send_frame(request_id, frame, timeout=timeout)
+            error = tool_response_error(response) or error
+        return _elapsed_ms(start), error
+
+    def run_pipelined(session: McpStdioSession) -> tuple[float, str | None]:
+        received, elapsed_ms = session.send_frames(batch(session), timeout=timeout)
+        error = None
+        if len(received) < batch_size:
+            error = f"{batch_size - len(received)} of {batch_size} pipelined calls got no response"
+        for response, _ in received.values():
+            error = tool_response_error(response) or error
+        return elapsed_ms, error
+
+    runners = {"sequential": run_sequential, "pipelined": run_pipelined}
+
+    try:
+        with _initialized_session(pybun_path, session, timeout) as session:
+            for _ in range(warmup):
+                for runner in runners.values():
+                    runner(session)
+
+            # Alternate modes per iteration so drift hits both equally
+            for _ in range(iterations):
+                for mode, runner in runners.items():
+                    elapsed_ms, error = runner(session)
+                    if error is None:
+                        samples[mode].append(elapsed_ms)
+                    errors[mode] = error or errors[mode]
+    except Exception as exc:
+        errors = {mode: _describe(exc) for mode in runners}
+
+    results = {}
+    for mode, times in samples.items():
+        avg, min_t, max_t, stddev, _ = compute_stats(times)
+        results[mode] = BenchResult(
+            scenario="",
+            tool=f"pybun_mcp_{mode}",
+            duration_ms=round(avg, 2),
+            min_ms=round(min_t, 2),
+            max_ms=round(max_t, 2),
+            stddev_ms=round(stddev, 2),
+            iterations=len(times),
+            success=errors[mode] is None,
+            error=errors[mode],
+            metadata={
+                "mcp_tool": tool_name,
+                "mode": mode,
+                "batch_size": batch_size,
+                "per_call_ms": round(avg / batch_size, 3) if batch_size else 0,
+            },
+        )
+
+    sequential, pipelined = results["sequential"], results["pipelined"]
+    if pipelined.duration_ms > 0:
+        pipelined.metadata["speedup"] = round(sequential.duration_ms / pipelined.duration_ms, 2)
+    return sequential, pipelined
+
+
+def measure_json_parse(cmd: list[str], rounds: int = 50, timeout: int = 60) -> tuple[float | None, int]:
+    """
+    Run `cmd` once untimed and time parsing its JSON stdout in-process.
+
+    Returns (median parse ms over `rounds`, output size in bytes); the parse
+    time is None if the command failed or did not print a JSON document.
+    """
+    try:
+        stdout = subprocess.run(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=timeout,
+            check=True,
+        ).stdout
+        _loads(stdout)
+    except (OSError, subprocess.SubprocessError, ValueError):
+        return None, 0
+
+    samples = array("d")
+    for _ in range(rounds):
+        start = time.perf_counter_ns()
+        _loads(stdout)
+        samples.append(_elapsed_ms(start))
+    return round(statistics.median(samples), 4), len(stdout)
+
+
 def mcp_benchmark(config: dict, scenario_config: dict, base_dir: Path) -> list:
     """Run MCP/JSON output benchmarks."""
     results: list[BenchResult] = []
@@ -313,90 +652,93 @@ def mcp_benchmark(config: dict, scenario_config: dict, base_dir: Path) -> list:
         print("  pybun not found, skipping MCP benchmarks")
         return results
     
+    # B8.5 ("batch") makes hundreds of pybun_run calls, so it is opt-in
     tools = scenario_config.get("tools", ["doctor", "run", "resolve", "gc"])
+    pipeline_depth = scenario_config.get("pipeline_depth", 0)
+    parallel = scenario_config.get("parallel", False)
     
-    with tempfile.TemporaryDirectory(prefix="pybun_mcp_bench_") as tmpdir:
+    with tempfile.TemporaryDirectory(prefix="pybun_mcp_bench_") as tmpdir, contextlib.ExitStack() as stack:
         tmp = Path(tmpdir)
         
+        # One server session serves every MCP call below, so the spawn and
+        # initialize handshake are paid once rather than once per tool
+        # (B8.5 only when B8.1-B8.3 run in parallel on their own sessions)
+        session = None
+        shared_tools = {"batch"} if parallel else {"doctor", "run", "resolve", "batch"}
+        if not dry_run and shared_tools & set(tools):
+            session = stack.enter_context(McpStdioSession(pybun_path))
+        
         # Create a simple script for run tests
         test_script = tmp / "test.py"
         test_script.write_text('print("Hello from MCP!")')
         
-        # === B8.1: pybun_doctor Response Time ===
+        # === B8.1-B8.3: Tool Response Times ===
+        # (header, scenario, label, measure, extra metadata) in report order
+        tool_runs = []
+        
+        def tool_run(tool_name: str, arguments: dict, **kwargs) -> functools.partial:
+            return functools.partial(
+                measure_mcp_tool, pybun_path, tool_name, arguments,
+                iterations=iterations, warmup=warmup, **kwargs,
+            )
+        
         if "doctor" in tools:
-            print("\n--- B8.1: pybun_doctor Response Time ---")
-            
-            if dry_run:
-                print(f"  Would call MCP tool: pybun_doctor")
-            else:
-                if verbose:
-                    print(f"  Calling MCP tool: pybun_doctor")
-                result = measure_mcp_tool(
-                    pybun_path,
-                    "pybun_doctor",
+            header = "B8.1: pybun_doctor Response Time"
+            tool_runs.append((header, "B8.1_doctor", "pybun_doctor", tool_run("pybun_doctor", {}), {}))
+            if pipeline_depth > 1:
+                tool_runs.append((
+                    header, "B8.1_doctor_pipelined", f"pybun_doctor (pipelined x{pipeline_depth})",
+                    functools.partial(
+                        measure_mcp_tool_pipelined, pybun_path, "pybun_doctor", {},
+                        depth=pipeline_depth, iterations=iterations, warmup=warmup,
+                    ),
                     {},
-                    iterations=iterations,
-                    warmup=warmup,
-                )
-                result.scenario = "B8.1_doctor"
-                results.append(result)
-                print(f"  pybun_doctor: {result.duration_ms:.2f}ms")
-        
-        # === B8.2: pybun_run Response Time ===
+                ))
         if "run" in tools:
-            print("\n--- B8.2: pybun_run Response Time ---")
-            
-            if dry_run:
-                print(f"  Would call MCP tool: pybun_run")
-            else:
-                if verbose:
-                    print(f"  Calling MCP tool: pybun_run")
-                
-                # Test with inline code
-                result = measure_mcp_tool(
-                    pybun_path,
-                    "pybun_run",
-                    {"code": "print('Hello')"},
-                    iterations=iterations,
-                    warmup=warmup,
-                )
-                result.scenario = "B8.2_run_inline"
-                result.metadata["mode"] = "inline"
-                results.append(result)
-                print(f"  pybun_run (inline): {result.duration_ms:.2f}ms")
-                
-                # Test with script file
-                result = measure_mcp_tool(
-                    pybun_path,
-                    "pybun_run",
-                    {"script": str(test_script)},
-                    iterations=iterations,
-                    warmup=warmup,
-                )
-                result.scenario = "B8.2_run_script"
-                result.metadata["mode"] = "script"
-                results.append(result)
-                print(f"  pybun_run (script): {result.duration_ms:.2f}ms")
-        
-        # === B8.3: pybun_resolve Response Time ===
+            header = "B8.2: pybun_run Response Time"
+            tool_runs.append((
+                header, "B8.2_run_inline", "pybun_run (inline)",
+                tool_run("pybun_run", {"code": "print('Hello')"}), {"mode": "inline"},
+            ))
+            tool_runs.append((
+                header, "B8.2_run_script", "pybun_run (script)",
+                tool_run("pybun_run", {"script": str(test_script)}), {"mode": "script"},
+            ))
         if "resolve" in tools:
-            print("\n--- B8.3: pybun_resolve Response Time ---")
-            
+            tool_runs.append((
+                "B8.3: pybun_resolve Response Time", "B8.3_resolve", "pybun_resolve",
+                tool_run("pybun_resolve", {"requirements": ["requests>=2.28.0"]}), {},
+            ))
+        
+        # In parallel each run starts its own server session
+        futures = submit_parallel(
+            stack, [measure for _, _, _, measure, _ in tool_runs], parallel=parallel and not dry_run,
+        )
+        
+        current_header = None
+        for i, (header, scenario_name, label, measure, extra) in enumerate(tool_runs):
+            if header != current_header:
+                print(f"\n--- {header} ---")
+                current_header = header
             if dry_run:
-                print(f"  Would call MCP tool: pybun_resolve")
-            else:
-                if verbose:
-                    print(f"  Calling MCP tool: pybun_resolve")
-                result = measure_mcp_tool(
-                    pybun_path,
-                    "pybun_resolve",
-                    {"requirements": ["requests>=2.28.0"]},
-                    iterations=iterations,
-                    warmup=warmup,
+                print(f"  Would call MCP tool: {label}")
+                continue
+            if verbose:
+                print(f"  Calling MCP tool: {label}")
+            result = futures[i].result() if futures else measure(session=session)
+            result.scenario = scenario_name
+            result.metadata.update(extra)
+            results.append(result)
+            if not result.success:
+                print(f"  {label}: failed ({result.error})")
+            elif "pipeline_depth" in result.metadata:
+                print(
+                    f"  {label}: "
+                    f"p50 {result.metadata['p50_latency_ms']}ms, "
+                    f"{result.metadata['ops_per_sec']} calls/s"
                 )
-                result.scenario = "B8.3_resolve"
-                results.append(result)
-                print(f"  pybun_resolve: {result.duration_ms:.2f}ms")
+            else:
+                print(f"  {label}: {result.duration_ms:.2f}ms")
         
         # === B8.4: JSON Output Overhead ===
         print("\n--- B8.4: JSON Output Overhead ---")
@@ -443,10 +785,47 @@ def mcp_benchmark(config: dict, scenario_config: dict, base_dir: Path) -> list:
             result.metadata["format"] = "json"
             results.append(result)
             json_time = result.duration_ms
+            # Split the overhead: pybun-side cost shows in the wall-time delta,
+            # client-side cost is parsing the document it printed
+            parse_ms, output_bytes = measure_json_parse(cmd)
+            result.metadata["serialize_ms"] = round(json_time - text_time, 2)
+            result.metadata["parse_ms"] = parse_ms
+            result.metadata["output_bytes"] = output_bytes
             print(f"  pybun run (json): {result.duration_ms:.2f}ms")
             
             if text_time > 0:
                 overhead = ((json_time - text_time) / text_time) * 100
                 print(f"  JSON overhead: {overhead:.1f}%")
+            if parse_ms is not None:
+                print(f"  JSON parse ({output_bytes} bytes): {parse_ms:.4f}ms")
+
+        # === B8.5: Batched Calls ===
+        if "batch" in tools:
+            print("\n--- B8.5: Batched pybun_run Calls ---")
+
+            for batch_size in scenario_config.get("batch_sizes", [1, 4, 16, 64]):
+                if dry_run:
+                    print(f"  Would call MCP tool: pybun_run x{batch_size} (sequential, pipelined)")
+                    continue
+                if verbose:
+                    print(f"  Calling MCP tool: pybun_run x{batch_size}")
+                batch_results = measure_mcp_batch(
+                    pybun_path,
+                    "pybun_run",
+                    [{"code": f"print({i})"} for i in range(batch_size)],
+                    iterations=iterations,
+                    warmup=warmup,
+                    session=session,
+                )
+                for result in batch_results:
+                    # One scenario per size, so reports compare like with like
+                    result.scenario = f"B8.5_batch_x{batch_size}"
+                    results.append(result)
+                sequential, pipelined = batch_results
+                print(
+                    f"  x{batch_size}: sequential {sequential.duration_ms:.2f}ms, "
+                    f"pipelined {pipelined.duration_ms:.2f}ms "
+                    f"({pipelined.metadata.get('speedup', 0)}x)"
+                )
     
     return results
@@ -12,34 +12,18 @@ Scenarios:
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import json
+import subprocess
 import tempfile
+from array import array
 from pathlib import Path
 
 # These are injected by bench.py when loading this module
-# scenario, BenchResult, find_tool, measure_command
+# scenario, BenchResult, compute_stats, find_tool, measure_command, submit_parallel
 
 
-# Python script to measure import time
-IMPORT_TIMER_SCRIPT = '''\
-#!/usr/bin/env python3
-"""Measure import time for a module."""
-import sys
-import time
-
-module_name = sys.argv[1] if len(sys.argv) > 1 else "os"
-
-start = time.perf_counter_ns()
-try:
-    __import__(module_name)
-    success = True
-except ImportError:
-    success = False
-end = time.perf_counter_ns()
-
-elapsed_us = (end - start) / 1000  # Convert to microseconds
-print(f"{elapsed_us:.2f}")
-'''
-
 # Python script to scan and import multiple modules
 BATCH_IMPORT_SCRIPT = '''\
 #!/usr/bin/env python3
@@ -54,9 +38,9 @@ for module_name in modules:
     start = time.perf_counter_ns()
     try:
         __import__(module_name)
-        success = True
     except ImportError:
-        success = False
+        results.append(f"{module_name}:-")
+        continue
     end = time.perf_counter_ns()
     elapsed_us = (end - start) / 1000
     results.append(f"{module_name}:{elapsed_us:.2f}")
@@ -65,6 +49,115 @@ print(",".join(results))
 '''
 
 
+def parse_batch_imports(stdout: str) -> dict[str, float | None]:
+    """Parse BATCH_IMPORT_SCRIPT output into {module: ms}, None for failed imports."""
+    lines = stdout.strip().splitlines()
+    if not lines:
+        return {}
+    parsed: dict[str, float | None] = {}
+    for item in lines[-1].split(","):
+        module, sep, elapsed_us = item.rpartition(":")
+        if not sep:
+            continue
+        try:
+            parsed[module] = float(elapsed_us) / 1000
+        except ValueError:
+            parsed[module] = None
+    return parsed
+
+
+def measure_batch_imports(
+    cmd: list[str],
+    modules: list[str],
+    warmup: int = 1,
+    iterations: int = 5,
+    timeout: int = 60,
+) -> dict[str, BenchResult]:
+    """
+    Time every module's import inside one interpreter per iteration.
+
+    Each run of BATCH_IMPORT_SCRIPT pays interpreter startup once for all
+    modules, and the per-module times exclude it. Modules are imported in
+    order, so dependencies shared with an earlier module are already loaded.
+    """
+    samples = {module: array("d") for module in modules}
+    errors: dict[str, str] = {}
+
+    for i in range(warmup + iterations):
+        try:
+            proc = subprocess.run(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                timeout=timeout,
+                check=True,
+            )
+        except (OSError, subprocess.SubprocessError) as exc:
+            errors = {module: str(exc) for module in modules}
+            break
+        if i < warmup:
+            continue
+        parsed = parse_batch_imports(proc.stdout)
+        for module in modules:
+            ms = parsed.get(module)
+            if ms is None:
+                errors[module] = f"import {module} failed"
+            else:
+                samples[module].append(ms)
+
+    results = {}
+    for module, times in samples.items():
+        avg, min_t, max_t, stddev, _ = compute_stats(times)
+        results[module] = BenchResult(
+            scenario="",
+            tool="python_import",
+            duration_ms=round(avg, 3),
+            min_ms=round(min_t, 3),
+            max_ms=round(max_t, 3),
+            stddev_ms=round(stddev, 3),
+            iterations=len(times),
+            success=module not in errors,
+            error=errors.get(module),
+            metadata={"measure": "in_process_import", "batch_size": len(modules)},
+        )
+    return results
+
+
+def measure_find_in_process(cmd: list[str], timeout: int = 60) -> BenchResult:
+    """Run one `pybun --format=json module-find` and report its own duration_us."""
+    error = None
+    duration_us = None
+    try:
+        proc = subprocess.run(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=timeout,
+            check=True,
+        )
+        payload = json.loads(proc.stdout)
+        detail = payload.get("detail", payload) if isinstance(payload, dict) else {}
+        duration_us = detail.get("duration_us") if isinstance(detail, dict) else None
+        if not isinstance(duration_us, (int, float)):
+            error = "no duration_us in module-find JSON output"
+    except (OSError, subprocess.SubprocessError, ValueError) as exc:
+        error = str(exc)
+
+    ms = duration_us / 1000 if error is None else 0.0
+    return BenchResult(
+        scenario="",
+        tool="pybun",
+        duration_ms=round(ms, 3),
+        min_ms=round(ms, 3),
+        max_ms=round(ms, 3),
+        iterations=0 if error else 1,
+        success=error is None,
+        error=error,
+        metadata={"measure": "in_process_find"},
+    )
+
+
 def module_find_benchmark(config: dict, scenario_config: dict, base_dir: Path) -> list:
     """Run module finding benchmarks."""
     results: list[BenchResult] = []
@@ -75,6 +168,7 @@ def module_find_benchmark(config: dict, scenario_config: dict, base_dir: Path) -
     trim_ratio = scenario_config.get("trim_ratio", general.get("trim_ratio", 0.0))
     dry_run = config.get("dry_run", False)
     verbose = config.get("verbose", False)
+    parallel = scenario_config.get("parallel", False)
     
     # Find tools
     pybun_path = find_tool("pybun", config)
@@ -85,85 +179,88 @@ def module_find_benchmark(config: dict, scenario_config: dict, base_dir: Path) -
     with tempfile.TemporaryDirectory(prefix="pybun_module_bench_") as tmpdir:
         tmp = Path(tmpdir)
         
-        # Create timer script
-        timer_script = tmp / "import_timer.py"
-        timer_script.write_text(IMPORT_TIMER_SCRIPT)
-        
         batch_script = tmp / "batch_import.py"
         batch_script.write_text(BATCH_IMPORT_SCRIPT)
         
-        # === B5.1: Standard Library Module Search ===
-        print("\n--- B5.1: Standard Library Module Search ---")
-        
+        # === B5.1 / B5.2: Module Search ===
         stdlib_modules = ["os", "sys", "json", "re", "pathlib", "collections", "functools"]
+        third_party = ["requests", "numpy", "pandas", "flask", "django"]
         
+        # (header, module, type, tool, label, cmd) in report order
+        find_runs = []
+        # Python times every stdlib import in one interpreter per iteration
+        batch_cmd = [python_path, str(batch_script), ",".join(stdlib_modules)] if python_path else None
+        batch_results = None
         for module in stdlib_modules:
-            # Python import
             if python_path:
-                if dry_run:
-                    print(f"  Would run: {python_path} {timer_script} {module}")
-                else:
-                    if verbose:
-                        print(f"  Running: {python_path} {timer_script} {module}")
-                    result = measure_command(
-                        [python_path, str(timer_script), module],
-                        warmup=warmup,
-                        iterations=iterations,
-                        trim_ratio=trim_ratio,
-                    )
-                    result.scenario = f"B5.1_stdlib_{module}"
-                    result.tool = "python_import"
-                    result.metadata["module"] = module
-                    result.metadata["type"] = "stdlib"
-                    results.append(result)
-                    print(f"  python import {module}: {result.duration_ms:.2f}ms")
-            
-            # PyBun module-find
+                find_runs.append((
+                    "B5.1: Standard Library Module Search", module, "stdlib", "python_import",
+                    f"python import {module}", batch_cmd,
+                ))
             if pybun_path:
-                if dry_run:
-                    print(f"  Would run: {pybun_path} module-find {module}")
-                else:
-                    if verbose:
-                        print(f"  Running: {pybun_path} module-find {module}")
-                    result = measure_command(
-                        [pybun_path, "module-find", module],
-                        warmup=warmup,
-                        iterations=iterations,
-                        trim_ratio=trim_ratio,
-                    )
-                    result.scenario = f"B5.1_stdlib_{module}"
-                    result.tool = "pybun"
-                    result.metadata["module"] = module
-                    result.metadata["type"] = "stdlib"
-                    results.append(result)
-                    print(f"  pybun module-find {module}: {result.duration_ms:.2f}ms")
-        
-        # === B5.2: Third-party Package Search ===
-        print("\n--- B5.2: Third-party Package Search ---")
+                find_runs.append((
+                    "B5.1: Standard Library Module Search", module, "stdlib", "pybun",
+                    f"pybun module-find {module}", [pybun_path, "module-find", module],
+                ))
+        # Only pybun is measured here: the modules might not be installed
+        if pybun_path:
+            for module in third_party:
+                find_runs.append((
+                    "B5.2: Third-party Package Search", module, "third_party", "pybun",
+                    f"pybun module-find {module}", [pybun_path, "module-find", module],
+                ))
         
-        third_party = ["requests", "numpy", "pandas", "flask", "django"]
+        def measure_find(cmd: list[str]) -> BenchResult:
+            return measure_command(
+                cmd,
+                warmup=warmup,
+                iterations=iterations,
+                trim_ratio=trim_ratio,
+            )
         
-        for module in third_party:
-            # Only test if module might be installed
-            if pybun_path:
-                if dry_run:
-                    print(f"  Would run: {pybun_path} module-find {module}")
+        with contextlib.ExitStack() as stack:
+            futures = submit_parallel(stack, [
+                functools.partial(measure_find, run[-1]) if run[3] != "python_import" else None
+                for run in find_runs
+            ], parallel=parallel and not dry_run)
+            
+            current_header = None
+            for i, (header, module, module_type, tool, label, cmd) in enumerate(find_runs):
+                if header != current_header:
+                    print(f"\n--- {header} ---")
+                    current_header = header
+                if tool == "python_import":
+                    if batch_results is None:
+                        if dry_run:
+                            print(f"  Would run: {' '.join(cmd)}")
+                            batch_results = {}
+                            continue
+                        if verbose:
+                            print(f"  Running: {' '.join(cmd)}")
+                        batch_results = measure_batch_imports(
+                            cmd, stdlib_modules, warmup=warmup, iterations=iterations
+                        )
+                    if dry_run:
+                        continue
+                    result = batch_results[module]
                 else:
+                    if dry_run:
+                        print(f"  Would run: {' '.join(cmd)}")
+                        continue
                     if verbose:
-                        print(f"  Running: {pybun_path} module-find {module}")
-                    result = measure_command(
-                        [pybun_path, "module-find", module],
-                        warmup=warmup,
-                        iterations=iterations,
-                        trim_ratio=trim_ratio,
-                    )
-                    result.scenario = f"B5.2_thirdparty_{module}"
-                    result.tool = "pybun"
-                    result.metadata["module"] = module
-                    result.metadata["type"] = "third_party"
-                    results.append(result)
+                        print(f"  Running: {' '.join(cmd)}")
+                    result = futures[i].result() if futures else measure_find(cmd)
+                prefix = "B5.1_stdlib" if module_type == "stdlib" else "B5.2_thirdparty"
+                result.scenario = f"{prefix}_{module}"
+                result.tool = tool
+                result.metadata["module"] = module
+                result.metadata["type"] = module_type
+                results.append(result)
+                if module_type == "stdlib":
+                    print(f"  {label}: {result.duration_ms:.2f}ms")
+                else:
                     status = "✓" if result.success else "✗ (not found)"
-                    print(f"  pybun module-find {module}: {result.duration_ms:.2f}ms {status}")
+                    print(f"  {label}: {result.duration_ms:.2f}ms {status}")
         
         # === B5.3: Large Directory Scan ===
         if scenario_config.get("benchmark_parallel", True):
@@ -199,11 +296,21 @@ def module_find_benchmark(config: dict, scenario_config: dict, base_dir: Path) -
             # Compare with Python glob
             if python_path:
                 scan_script = tmp / "glob_scan.py"
+                # scandir walk rather than glob: reuses the dirent type, no
+                # per-entry stat or pattern matching, so the baseline is fair
                 scan_script.write_text(f'''\
-import glob
+import os
 import time
 start = time.perf_counter_ns()
-files = glob.glob("{fake_pkg}/**/*.py", recursive=True)
+files = []
+pending = [{str(fake_pkg)!r}]
+while pending:
+    with os.scandir(pending.pop()) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                pending.append(entry.path)
+            elif entry.name.endswith(".py") and entry.is_file():
+                files.append(entry.path)
 end = time.perf_counter_ns()
 print(f"{{len(files)}} files in {{(end-start)/1e6:.2f}}ms")
 ''')
@@ -219,8 +326,9 @@ print(f"{{len(files)}} files in {{(end-start)/1e6:.2f}}ms")
                     result.scenario = "B5.3_large_scan"
                     result.tool = "python_glob"
                     result.metadata["file_count"] = 101
+                    result.metadata["method"] = "scandir"
                     results.append(result)
-                    print(f"  python glob (100 files): {result.duration_ms:.2f}ms")
+                    print(f"  python scandir (100 files): {result.duration_ms:.2f}ms")
         
         # === B5.4: Cache Hit Rate ===
         print("\n--- B5.4: Cache Hit Rate ---")
@@ -258,12 +366,17 @@ print(f"{{len(files)}} files in {{(end-start)/1e6:.2f}}ms")
                 results.append(result)
                 print(f"  pybun module-find os (warm): {result.duration_ms:.2f}ms")
             
-            # With --benchmark flag
-            if dry_run:
-                print(f"  Would run: {pybun_path} module-find --benchmark os")
+            # Benchmark mode: pybun's own in-process lookup time. The warm run
+            # above already covers wall time, so one JSON call is enough.
+            if scenario_config.get("legacy_cache_probe", False):
+                cmd = [pybun_path, "module-find", "--benchmark", "os"]
             else:
+                cmd = [pybun_path, "--format=json", "module-find", "os"]
+            if dry_run:
+                print(f"  Would run: {' '.join(cmd)}")
+            elif scenario_config.get("legacy_cache_probe", False):
                 result = measure_command(
-                    [pybun_path, "module-find", "--benchmark", "os"],
+                    cmd,
                     warmup=warmup,
                     iterations=iterations,
                     trim_ratio=trim_ratio,
@@ -273,5 +386,11 @@ print(f"{{len(files)}} files in {{(end-start)/1e6:.2f}}ms")
                 result.metadata["mode"] = "benchmark"
                 results.append(result)
                 print(f"  pybun module-find --benchmark os: {result.duration_ms:.2f}ms")
+            else:
+                result = measure_find_in_process(cmd)
+                result.scenario = "B5.4_benchmark_mode"
+                result.metadata["mode"] = "benchmark"
+                results.append(result)
+                print(f"  pybun module-find os (in-process): {result.duration_ms:.3f}ms")
     
     return results
@@ -173,7 +173,7 @@ def _collect_samples(
     for _ in range(n):
         t0 = time.perf_counter()
         try:
-            subprocess.run(cmd, capture_output=True, timeout=timeout, cwd=cwd)
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=timeout, cwd=cwd)
         except Exception:
             pass
         samples.append((time.perf_counter() - t0) * 1000.0)
@@ -240,7 +240,7 @@ def uv_comparison_benchmark(config: dict, scenario_config: dict, base_dir: Path)
             print(f"  pybun cmd: {cmd}")
         # Warmup
         for _ in range(warmup):
-            subprocess.run(cmd, capture_output=True, timeout=timeout)
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=timeout)
         pybun_startup_samples = _collect_samples(cmd, iterations, timeout)
         pybun_p50 = compute_median(pybun_startup_samples)
         pybun_p95 = compute_percentile(pybun_startup_samples, 95)
@@ -270,7 +270,7 @@ def uv_comparison_benchmark(config: dict, scenario_config: dict, base_dir: Path)
         if verbose:
             print(f"  uv cmd: {cmd}")
         for _ in range(warmup):
-            subprocess.run(cmd, capture_output=True, timeout=timeout)
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=timeout)
         uv_startup_samples = _collect_samples(cmd, iterations, timeout)
         uv_p50 = compute_median(uv_startup_samples)
         uv_p95 = compute_percentile(uv_startup_samples, 95)
@@ -320,7 +320,7 @@ def uv_comparison_benchmark(config: dict, scenario_config: dict, base_dir: Path)
             cmd_pybun = [pybun_path, "run", str(pep723_fixture)]
             # Warmup to populate pybun env-cache
             for _ in range(max(1, warmup)):
-                subprocess.run(cmd_pybun, capture_output=True, timeout=timeout)
+                subprocess.run(cmd_pybun, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=timeout)
             pybun_warm_samples = _collect_samples(cmd_pybun, iterations, timeout)
             pybun_p50 = compute_median(pybun_warm_samples)
             pybun_p95 = compute_percentile(pybun_warm_samples, 95)
@@ -345,7 +345,7 @@ def uv_comparison_benchmark(config: dict, scenario_config: dict, base_dir: Path)
             # uv run --with resolves deps inline (no separate install step)
             cmd_uv = [uv_path, "run", "--with", "requests", str(pep723_fixture)]
             for _ in range(max(1, warmup)):
-                subprocess.run(cmd_uv, capture_output=True, timeout=timeout)
+                subprocess.run(cmd_uv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=timeout)
             uv_warm_samples = _collect_samples(cmd_uv, iterations, timeout)
             uv_p50 = compute_median(uv_warm_samples)
             uv_p95 = compute_percentile(uv_warm_samples, 95)
@@ -429,7 +429,9 @@ def uv_comparison_benchmark(config: dict, scenario_config: dict, base_dir: Path)
                 run_env.update(env_cold)
                 import time
                 t0 = time.perf_counter()
-                subprocess.run(cmd_uv, capture_output=True, env=run_env, timeout=timeout)
+                subprocess.run(
+                    cmd_uv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=run_env, timeout=timeout,
+                )
                 uv_cold_samples = [(time.perf_counter() - t0) * 1000.0]
             uv_p50 = compute_median(uv_cold_samples)
             uv_p95 = compute_percentile(uv_cold_samples, 95)
@@ -547,7 +549,7 @@ def uv_comparison_benchmark(config: dict, scenario_config: dict, base_dir: Path)
     if pybun_path and not dry_run:
         cmd = [pybun_path, "x", adhoc_pkg] + adhoc_args
         for _ in range(max(1, warmup)):
-            subprocess.run(cmd, capture_output=True, timeout=timeout)
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=timeout)
         pybun_adhoc_samples = _collect_samples(cmd, min(5, iterations), timeout)
         p50 = compute_median(pybun_adhoc_samples)
         r = BenchResult(  # noqa: F821
@@ -576,7 +578,7 @@ def uv_comparison_benchmark(config: dict, scenario_config: dict, base_dir: Path)
         else:
             cmd = [uvx_path, adhoc_pkg] + adhoc_args
         for _ in range(max(1, warmup)):
-            subprocess.run(cmd, capture_output=True, timeout=timeout)
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=timeout)
         uvx_adhoc_samples = _collect_samples(cmd, min(5, iterations), timeout)
         p50 = compute_median(uvx_adhoc_samples)
         r = BenchResult(  # noqa: F821
@@ -27,6 +27,436 @@ class TestComputeStats(unittest.TestCase):
         self.assertAlmostEqual(stats[0], 5.5, places=2)
         self.assertEqual(stats[4], 8)
 
+    def test_compute_stats_min_max_stddev_match_statistics(self) -> None:
+        import statistics
+
+        samples = [9.0, 1.0, 4.0, 7.0, 3.0, 100.0, 5.0, 2.0, 6.0, 8.0]
+        avg, min_t, max_t, stddev, count = bench.compute_stats(samples, trim_ratio=0.1)
+        trimmed = bench.trim_samples(samples, trim_ratio=0.1)
+        self.assertAlmostEqual(avg, statistics.mean(trimmed))
+        self.assertEqual((min_t, max_t), (2.0, 9.0))
+        self.assertAlmostEqual(stddev, statistics.stdev(trimmed))
+        self.assertEqual(count, 8)
+
+    def test_compute_stats_single_sample(self) -> None:
+        self.assertEqual(bench.compute_stats([4.0]), (4.0, 4.0, 4.0, 0.0, 1))
+
+
+class TestSystemInfo(unittest.TestCase):
+    def test_collect_uses_injected_timestamp(self) -> None:
+        from datetime import datetime, timezone
+
+        now = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        info = bench.SystemInfo.collect(now=now)
+        self.assertEqual(info.timestamp, "2025-01-02T03:04:05+00:00")
+        self.assertGreaterEqual(info.cpu_count, 1)
+
+
+class TestMeasureCommand(unittest.TestCase):
+    def test_successful_command(self) -> None:
+        result = bench.measure_command(["true"], warmup=1, iterations=3)
+        self.assertTrue(result.success)
+        self.assertIsNone(result.error)
+        self.assertEqual(result.iterations, 3)
+        self.assertGreater(result.duration_ms, 0.0)
+
+    def test_failure_reports_stderr(self) -> None:
+        cmd = [sys.executable, "-c", "import sys; sys.exit('boom')"]
+        result = bench.measure_command(cmd, warmup=0, iterations=1)
+        self.assertFalse(result.success)
+        self.assertIn("boom", result.error)
+
+    def test_failing_command_is_not_rerun(self) -> None:
+        import tempfile
+
+        for use_cwd in (False, True):
+            with tempfile.TemporaryDirectory() as tmpdir:
+                counter = Path(tmpdir) / "runs"
+                script = f"import sys; open({str(counter)!r}, 'a').write('x'); sys.exit('failed run')"
+                result = bench.measure_command(
+                    [sys.executable, "-c", script],
+                    warmup=0,
+                    iterations=2,
+                    cwd=tmpdir if use_cwd else None,
+                )
+                self.assertEqual(counter.read_text(), "xx")
+            self.assertFalse(result.success)
+            self.assertEqual(result.error.strip(), "failed run")
+
+    def test_env_overrides_and_inherits(self) -> None:
+        from unittest import mock
+
+        script = "import os, sys; sys.exit(0 if os.environ.get('BENCH_A') == '1' and os.environ.get('BENCH_B') == '2' else 1)"
+        with mock.patch.dict(os.environ, {"BENCH_A": "1"}):
+            with_override = bench.measure_command([sys.executable, "-c", script], warmup=0, iterations=1, env={"BENCH_B": "2"})
+            inherited_only = bench.measure_command([sys.executable, "-c", script], warmup=0, iterations=1)
+        self.assertTrue(with_override.success, with_override.error)
+        self.assertFalse(inherited_only.success)
+
+    def test_cwd_is_honored(self) -> None:
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            marker = Path(tmpdir) / "marker"
+            marker.write_text("")
+            cmd = [sys.executable, "-c", "import os, sys; sys.exit(0 if os.path.exists('marker') else 1)"]
+            result = bench.measure_command(cmd, warmup=0, iterations=1, cwd=tmpdir)
+        self.assertTrue(result.success, result.error)
+
+    def test_launcher_is_recorded(self) -> None:
+        import tempfile
+
+        spawned = bench.measure_command(["true"], warmup=0, iterations=1)
+        expected = "posix_spawn" if bench._HAS_SPAWN else "subprocess"
+        self.assertEqual(spawned.metadata["launcher"], expected)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with_cwd = bench.measure_command(["true"], warmup=0, iterations=1, cwd=tmpdir)
+        self.assertEqual(with_cwd.metadata["launcher"], "subprocess")
+
+    def test_pre_iter_hook_runs_before_each_timed_run_only(self) -> None:
+        calls: list[int] = []
+        result = bench.measure_command(["true"], warmup=2, iterations=3, pre_iter_hook=lambda: calls.append(1))
+        self.assertTrue(result.success, result.error)
+        self.assertEqual(len(calls), 3)
+
+    @unittest.skipUnless(hasattr(os, "sched_setaffinity"), "requires sched_setaffinity")
+    def test_pin_cpu_restricts_children_and_restores_mask(self) -> None:
+        before = os.sched_getaffinity(0)
+        cpu = min(before)
+        script = f"import os, sys; sys.exit(0 if os.sched_getaffinity(0) == {{{cpu}}} else 1)"
+        result = bench.measure_command([sys.executable, "-c", script], warmup=0, iterations=1, pin_cpu=cpu)
+        self.assertTrue(result.success, result.error)
+        self.assertEqual(result.metadata["pinned_cpu"], cpu)
+        self.assertEqual(os.sched_getaffinity(0), before)
+
+    def test_timeout_is_reported(self) -> None:
+        result = bench.measure_command(["sleep", "5"], warmup=0, iterations=1, timeout=0.2)
+        self.assertFalse(result.success)
+        self.assertIn("Timeout", result.error)
+
+
+def _ordering_scenario(name: str):
+    def run(config: dict, scenario_config: dict, base_dir: Path) -> list:
+        return [bench.BenchResult(scenario=name, tool="pybun", duration_ms=1.0)]
+    return run
+
+
+def _pin_reporting_scenario(config: dict, scenario_config: dict, base_dir: Path) -> list:
+    pinned = bench.pin_cpu_for({"general": {"pin_cpu": 0}}, scenario_config, parallel=False)
+    return [bench.BenchResult(scenario="pin", tool="pybun", duration_ms=1.0, metadata={"pin_cpu": pinned})]
+
+
+def _failing_scenario(config: dict, scenario_config: dict, base_dir: Path) -> list:
+    raise RuntimeError("scenario exploded")
+
+
+class TestRunPhase(unittest.TestCase):
+    def test_emits_in_list_order_and_skips_none(self) -> None:
+        import contextlib
+        import io
+        import time
+
+        def slow(name: str, delay: float):
+            def measure() -> bench.BenchResult:
+                time.sleep(delay)
+                return bench.BenchResult(scenario="s", tool=name, duration_ms=1.0)
+            return measure
+
+        runs = [("a", slow("a", 0.05)), ("skipped", lambda: None), ("b", slow("b", 0.0))]
+        for parallel in (False, True):
+            emitted: list[bench.BenchResult] = []
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                bench.run_phase(emitted.append, runs, parallel=parallel, indent="    ")
+            self.assertEqual([r.tool for r in emitted], ["a", "b"])
+            self.assertEqual(out.getvalue(), "    a: 1.00ms\n    b: 1.00ms\n")
+
+
+class TestSubmitParallel(unittest.TestCase):
+    def test_returns_none_unless_parallel_with_two_calls(self) -> None:
+        import contextlib
+
+        calls = [lambda: 1, None, lambda: 2]
+        with contextlib.ExitStack() as stack:
+            self.assertIsNone(bench.submit_parallel(stack, calls, parallel=False))
+            self.assertIsNone(bench.submit_parallel(stack, [lambda: 1, None], parallel=True))
+            futures = bench.submit_parallel(stack, calls, parallel=True)
+            self.assertIsNone(futures[1])
+            self.assertEqual([futures[0].result(), futures[2].result()], [1, 2])
+
+
+class TestPinCpuFor(unittest.TestCase):
+    def _pin(self, scenario_config: dict, *, parallel: bool = False) -> int | None:
+        import contextlib
+        import io
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            return bench.pin_cpu_for({"general": {"pin_cpu": 1}}, scenario_config, parallel=parallel)
+
+    def test_scenario_setting_overrides_general(self) -> None:
+        self.assertEqual(self._pin({}), 1)
+        self.assertEqual(self._pin({"pin_cpu": 3}), 3)
+        self.assertIsNone(bench.pin_cpu_for({}, {}, parallel=True))
+
+    def test_ignored_for_parallel_runs_and_in_j_workers(self) -> None:
+        from unittest import mock
+
+        self.assertIsNone(self._pin({}, parallel=True))
+        with mock.patch.object(bench, "_WORKER_CPU", 2):
+            self.assertIsNone(self._pin({}))
+
+
+class TestRunScenariosParallel(unittest.TestCase):
+    def setUp(self) -> None:
+        import multiprocessing
+
+        if multiprocessing.get_start_method() != "fork":
+            self.skipTest("test scenarios are only visible to forked workers")
+        self._saved = dict(bench.SCENARIOS)
+        for name in ("alpha", "beta", "gamma"):
+            bench.SCENARIOS[name] = _ordering_scenario(name)
+
+    def tearDown(self) -> None:
+        bench.SCENARIOS.clear()
+        bench.SCENARIOS.update(self._saved)
+
+    def test_results_follow_requested_order(self) -> None:
+        names = ["gamma", "alpha", "beta"]
+        results = bench.run_scenarios_parallel(names, {}, Path("."), jobs=2)
+        self.assertEqual([r.scenario for r in results], names)
+
+    def test_appends_each_scenario_as_it_completes(self) -> None:
+        import io
+        import json
+
+        class InterruptAfterFirst(io.BytesIO):
+            def flush(self) -> None:
+                super().flush()
+                raise KeyboardInterrupt
+
+        jsonl = InterruptAfterFirst()
+        with self.assertRaises(KeyboardInterrupt):
+            bench.run_scenarios_parallel(["gamma", "alpha", "beta"], {}, Path("."), jobs=2, jsonl=jsonl)
+        # The first scenario to finish was on disk before the interrupt
+        lines = jsonl.getvalue().splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertIn(bench.BenchResult(**json.loads(lines[0])).scenario, {"gamma", "alpha", "beta"})
+
+    def test_pin_cpu_does_not_replace_the_worker_cpu(self) -> None:
+        import contextlib
+        import io
+
+        if not hasattr(os, "sched_setaffinity"):
+            self.skipTest("workers are only pinned on Linux")
+        bench.SCENARIOS["pin"] = _pin_reporting_scenario
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = bench.run_scenarios_parallel(["alpha", "pin"], {}, Path("."), jobs=2)
+        self.assertIsNone(results[-1].metadata["pin_cpu"])
+
+    def test_verbose_prints_worker_traceback(self) -> None:
+        import contextlib
+        import io
+
+        bench.SCENARIOS["broken"] = _failing_scenario
+        for verbose in (False, True):
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                results = bench.run_scenarios_parallel(["alpha", "broken"], {}, Path("."), jobs=2, verbose=verbose)
+            self.assertEqual([r.scenario for r in results], ["alpha"])
+            self.assertIn("Error running scenario 'broken': scenario exploded", out.getvalue())
+            # The worker-side frame only shows up in the verbose traceback
+            self.assertEqual("in _failing_scenario" in out.getvalue(), verbose)
+
+
+class TestOneCpuPerCore(unittest.TestCase):
+    def test_parse_cpu_list(self) -> None:
+        self.assertEqual(bench._parse_cpu_list("0-2,8\n"), {0, 1, 2, 8})
+        self.assertEqual(bench._parse_cpu_list("5"), {5})
+
+    def _sysfs(self, root: Path, siblings: dict[int, str]) -> Path:
+        for cpu, text in siblings.items():
+            topology = root / f"cpu{cpu}" / "topology"
+            topology.mkdir(parents=True)
+            (topology / "thread_siblings_list").write_text(text + "\n")
+        return root
+
+    def test_reads_siblings_instead_of_assuming_adjacency(self) -> None:
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Intel-style numbering: cpu N and N+4 share a core
+            sysfs = self._sysfs(Path(tmpdir), {cpu: f"{cpu % 4},{cpu % 4 + 4}" for cpu in range(8)})
+            self.assertEqual(bench._one_cpu_per_core(list(range(8)), sysfs), [0, 1, 2, 3])
+            # Only the CPUs this process may use are considered
+            self.assertEqual(bench._one_cpu_per_core([1, 4, 5], sysfs), [1, 4])
+
+    def test_unreadable_topology_keeps_every_cpu(self) -> None:
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.assertEqual(bench._one_cpu_per_core([0, 1, 2], Path(tmpdir)), [0, 1, 2])
+
+
+class TestMeasureWithHyperfine(unittest.TestCase):
+    def _fake_hyperfine(self, tmp: Path, exit_code: int = 0) -> Path:
+        fake = tmp / "hyperfine"
+        fake.write_text(
+            f"#!{sys.executable}\n"
+            "import json, sys\n"
+            "args = sys.argv[1:]\n"
+            "path = args[args.index('--export-json') + 1]\n"
+            "print('Benchmark 1: progress noise')\n"
+            "stats = {'mean': 0.002, 'min': 0.001, 'max': 0.003, 'stddev': 0.0005}\n"
+            "open(path, 'w').write(json.dumps({'results': [stats]}))\n"
+            f"sys.exit({exit_code})\n"
+        )
+        fake.chmod(0o755)
+        return fake
+
+    def test_reads_exported_json_file(self) -> None:
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fake = self._fake_hyperfine(Path(tmpdir))
+            result = bench.measure_with_hyperfine(["pybun", "--version"], iterations=3, hyperfine_path=str(fake))
+
+        self.assertIsNotNone(result)
+        self.assertAlmostEqual(result.duration_ms, 2.0)
+        self.assertAlmostEqual(result.stddev_ms, 0.5)
+        self.assertEqual(result.iterations, 3)
+
+    def test_failed_run_returns_none(self) -> None:
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fake = self._fake_hyperfine(Path(tmpdir), exit_code=1)
+            result = bench.measure_with_hyperfine(["pybun"], hyperfine_path=str(fake))
+
+        self.assertIsNone(result)
+
+
+class TestLoadScenarios(unittest.TestCase):
+    def test_registers_scenarios_and_injects_bench_api(self) -> None:
+        saved = dict(bench.SCENARIOS)
+        try:
+            bench.load_scenarios(Path(bench.__file__).resolve().parent)
+            self.assertIn("run", bench.SCENARIOS)
+            module = sys.modules["scenarios.run"]
+            self.assertIs(bench.SCENARIOS["run"], module.run_benchmark)
+            self.assertIs(module.measure_command, bench.measure_command)
+            self.assertIs(module.BenchResult, bench.BenchResult)
+        finally:
+            bench.SCENARIOS.clear()
+            bench.SCENARIOS.update(saved)
+
+
+class TestGenerateSummary(unittest.TestCase):
+    def _result(self, scenario: str, tool: str, duration_ms: float, success: bool = True) -> bench.BenchResult:
+        return bench.BenchResult(scenario=scenario, tool=tool, duration_ms=duration_ms, success=success)
+
+    def test_counts_wins_losses_and_failures(self) -> None:
+        summary = bench.generate_summary([
+            self._result("B1", "pybun", 10.0),
+            self._result("B1", "uv", 20.0),
+            self._result("B1", "pip", 5.0),
+            self._result("B1", "poetry", 1.0, success=False),
+            self._result("B2", "uv", 3.0),
+        ])
+        self.assertEqual(summary["total_scenarios"], 2)
+        self.assertEqual(summary["total_benchmarks"], 5)
+        self.assertEqual((summary["pybun_wins"], summary["pybun_losses"]), (1, 1))
+        self.assertEqual(summary["average_speedup"], 1.25)
+        self.assertEqual((summary["successful"], summary["failed"]), (4, 1))
+
+    def test_zero_duration_pybun_result_does_not_divide_by_zero(self) -> None:
+        summary = bench.generate_summary([
+            self._result("B1", "pybun", 0.0),
+            self._result("B1", "uv", 2.0),
+        ])
+        self.assertEqual(summary["pybun_wins"], 1)
+        self.assertEqual(summary["average_speedup"], 1.0)
+
+
+class TestMarkdownReport(unittest.TestCase):
+    def test_rows_sorted_by_duration_within_scenario(self) -> None:
+        import tempfile
+
+        results = [
+            bench.BenchResult(scenario="B1", tool="uv", duration_ms=2.0, min_ms=1.5, max_ms=2.5, stddev_ms=0.25),
+            bench.BenchResult(scenario="B1", tool="pybun", duration_ms=1.0, success=False),
+        ]
+        report = bench.BenchReport(meta={"timestamp": "now"}, results=results, summary={})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "report.md"
+            bench.save_markdown_report(report, path)
+            text = path.read_text()
+
+        self.assertIn("### B1\n", text)
+        self.assertLess(text.index("| pybun | 1.00 |"), text.index("| uv | 2.00 |"))
+        self.assertIn("| uv | 2.00 | 1.50 | 2.50 | 0.25 | ✅ |", text)
+        self.assertIn("| ❌ |", text)
+        self.assertTrue(text.endswith("|\n"))
+
+
+class TestJsonReport(unittest.TestCase):
+    def test_result_dict_has_every_field(self) -> None:
+        import dataclasses
+
+        result = bench.BenchResult(scenario="B1", tool="pybun", duration_ms=1.0, metadata={"k": "v"})
+        self.assertEqual(result.to_dict(), dataclasses.asdict(result))
+
+    def test_round_trips_through_json(self) -> None:
+        import json
+        import tempfile
+
+        result = bench.BenchResult(scenario="B1", tool="pybun", duration_ms=1.5, metadata={"k": "v"})
+        report = bench.BenchReport(meta={"timestamp": "now"}, results=[result], summary={"failed": 0})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "report.json"
+            bench.save_json_report(report, path)
+            data = json.loads(path.read_text())
+
+        self.assertEqual(data, report.to_dict())
+
+
+class TestJsonlResults(unittest.TestCase):
+    def test_appended_results_read_back_in_order(self) -> None:
+        import tempfile
+
+        first = [
+            bench.BenchResult(scenario="B1", tool="pybun", duration_ms=1.5, metadata={"k": "v"}),
+            bench.BenchResult(scenario="B1", tool="uv", duration_ms=2.0, success=False, error="boom"),
+        ]
+        second = [bench.BenchResult(scenario="B2", tool="pybun", duration_ms=3.0)]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "results.jsonl"
+            with open(path, "wb") as f:
+                bench.append_jsonl_results(f, first)
+                bench.append_jsonl_results(f, [])
+                bench.append_jsonl_results(f, second)
+            loaded = list(bench.iter_jsonl_results(path))
+
+        self.assertEqual(loaded, first + second)
+
+    def test_result_sink_writes_each_result_immediately(self) -> None:
+        import tempfile
+
+        result = bench.BenchResult(scenario="B2", tool="uv", duration_ms=4.0)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_dir = Path(tmpdir)
+            results: list[bench.BenchResult] = []
+            with bench.result_sink(results, "partial.jsonl", base_dir) as emit:
+                emit(result)
+                # Readable before the sink is closed
+                self.assertEqual(list(bench.iter_jsonl_results(base_dir / "partial.jsonl")), [result])
+            self.assertEqual(results, [result])
+
+    def test_result_sink_without_file_only_collects(self) -> None:
+        results: list[bench.BenchResult] = []
+        with bench.result_sink(results, None, Path("/nonexistent")) as emit:
+            emit(bench.BenchResult(scenario="B2", tool="uv", duration_ms=4.0))
+        self.assertEqual(len(results), 1)
+
 
 class TestFindToolRelativePath(unittest.TestCase):
     """find_tool must resolve relative paths against _base_dir, not cwd."""
@@ -81,5 +511,22 @@ class TestFindToolRelativePath(unittest.TestCase):
             self.assertEqual(result, str(fake_pybun))
 
 
+class TestFindToolCache(unittest.TestCase):
+    def test_path_lookup_is_memoized(self) -> None:
+        from unittest import mock
+
+        bench._which.cache_clear()
+        bench._resolve_tool.cache_clear()
+        with mock.patch("shutil.which", return_value="/usr/bin/fake") as which:
+            first = bench.find_tool("fake_tool_xyz", {})
+            second = bench.find_tool("fake_tool_xyz", {"paths": {}})
+        bench._which.cache_clear()
+        bench._resolve_tool.cache_clear()
+
+        self.assertEqual(first, "/usr/bin/fake")
+        self.assertEqual(second, "/usr/bin/fake")
+        which.assert_called_once_with("fake_tool_xyz")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -85,5 +85,137 @@ class TestGenerateHtmlReportEscaping(unittest.TestCase):
         self.assertIn("&lt;script&gt;", html_out)
 
 
+class TestGeneratedAt(unittest.TestCase):
+    def test_footer_uses_given_timestamp(self) -> None:
+        results = [{"meta": {}, "summary": {}, "results": []}]
+        stamp = "2024-01-02T03:04:05"
+        md = generate.generate_markdown_report(results, generated_at=stamp)
+        html_out = generate.generate_html_report(results, generated_at=stamp)
+        self.assertTrue(md.endswith(f"*Report generated at {stamp}*"))
+        self.assertIn(f"Report generated at {stamp}</em>", html_out)
+
+
+class TestLoadResults(unittest.TestCase):
+    def test_directory_results_are_sorted_and_tagged(self) -> None:
+        import json
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp = Path(tmpdir)
+            for stamp in ("20240103", "20240101", "20240102"):
+                (tmp / f"benchmark_{stamp}.json").write_text(json.dumps({"meta": {"timestamp": stamp}}))
+            (tmp / "other.json").write_text("{}")
+            results = generate.load_results(tmp)
+
+        self.assertEqual(
+            [r["_source_file"] for r in results],
+            ["benchmark_20240101.json", "benchmark_20240102.json", "benchmark_20240103.json"],
+        )
+        self.assertEqual([r["meta"]["timestamp"] for r in results], ["20240101", "20240102", "20240103"])
+
+    def test_single_file_is_not_tagged(self) -> None:
+        import json
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "result.json"
+            path.write_text(json.dumps({"results": []}))
+            self.assertEqual(generate.load_results(path), [{"results": []}])
+
+
+    def test_latest_result_parses_only_the_last_file(self) -> None:
+        import json
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp = Path(tmpdir)
+            (tmp / "benchmark_20240101.json").write_text("not json")
+            (tmp / "benchmark_20240102.json").write_text(json.dumps({"results": []}))
+            latest = generate.load_latest_result(tmp)
+            self.assertIsNone(generate.load_latest_result(tmp / "missing"))
+
+        self.assertEqual(latest, {"results": [], "_source_file": "benchmark_20240102.json"})
+
+
+class TestMarkdownDetailedResults(unittest.TestCase):
+    def test_scenarios_sorted_and_rows_fastest_first(self) -> None:
+        rows = [
+            {"scenario": "B2", "tool": "slow", "duration_ms": 9.0},
+            {"scenario": "B1", "tool": "uv", "duration_ms": 5.0},
+            {"scenario": "B2", "tool": "fast", "duration_ms": 1.0},
+            {"scenario": "B1", "tool": "pybun", "duration_ms": 2.0},
+        ]
+        md = generate.generate_markdown_report([{"meta": {}, "summary": {}, "results": rows}])
+        order = ("### B1", "| pybun", "| uv", "### B2", "| fast", "| slow")
+        positions = [md.index(word) for word in order]
+        self.assertEqual(positions, sorted(positions))
+
+
+class TestCalculateComparison(unittest.TestCase):
+    def test_buckets_by_threshold(self) -> None:
+        def results(**durations: float) -> dict:
+            return {"results": [{"scenario": k, "tool": "pybun", "duration_ms": v} for k, v in durations.items()]}
+
+        current = results(faster=90.0, slower=120.0, same=104.0, zero=5.0, new=1.0)
+        baseline = results(faster=100.0, slower=100.0, same=100.0, zero=0.0)
+        comparison = generate.calculate_comparison(current, baseline)
+
+        self.assertEqual([i["scenario"] for i in comparison["improvements"]], ["faster"])
+        self.assertEqual([i["scenario"] for i in comparison["regressions"]], ["slower"])
+        self.assertEqual([i["scenario"] for i in comparison["unchanged"]], ["same"])
+        self.assertEqual(comparison["improvements"][0]["change_pct"], -10.0)
+
+
+class TestMainOutput(unittest.TestCase):
+    def test_html_report_is_written_to_output_file(self) -> None:
+        import contextlib
+        import io
+        import json
+        import tempfile
+        from unittest import mock
+
+        data = {"meta": {}, "summary": {}, "results": [{"scenario": "B1", "tool": "pybun", "duration_ms": 1.0}]}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp = Path(tmpdir)
+            (tmp / "in.json").write_text(json.dumps(data))
+            argv = ["generate.py", str(tmp / "in.json"), "--format", "html", "-o", str(tmp / "out" / "report")]
+            with mock.patch.object(sys, "argv", argv), contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(generate.main(), 0)
+            html_out = (tmp / "out" / "report.html").read_text(encoding="utf-8")
+
+        self.assertTrue(html_out.startswith("<!DOCTYPE html>"))
+        self.assertIn("<td>pybun</td>", html_out)
+        self.assertTrue(html_out.endswith("</html>\n"))
+
+
+    def test_unchanged_inputs_are_not_re_rendered(self) -> None:
+        import contextlib
+        import io
+        import json
+        import os
+        import tempfile
+        from unittest import mock
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp = Path(tmpdir)
+            src = tmp / "in.json"
+            src.write_text(json.dumps({"meta": {}, "summary": {}, "results": []}))
+            out = tmp / "report.md"
+            argv = ["generate.py", str(src), "-o", str(out)]
+
+            def run(*extra: str) -> str:
+                stdout = io.StringIO()
+                with mock.patch.object(sys, "argv", argv + list(extra)), contextlib.redirect_stdout(stdout):
+                    self.assertEqual(generate.main(), 0)
+                return stdout.getvalue()
+
+            self.assertIn("Report saved", run())
+            self.assertIn("Report unchanged", run())
+            self.assertIn("Report saved", run("--force"))
+            self.assertIn("Report saved", run("--title", "Other"))
+            os.utime(src, ns=(0, 0))
+            self.assertIn("Report saved", run("--title", "Other"))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,166 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import bench
+from scenarios import install
+
+# Names bench.load_scenarios injects after import
+install.BenchResult = bench.BenchResult
+install.find_tool = bench.find_tool
+install.is_tool_enabled = bench.is_tool_enabled
+install.measure_command = bench.measure_command
+install.pin_cpu_for = bench.pin_cpu_for
+install.result_sink = bench.result_sink
+install.run_phase = bench.run_phase
+
+# `python -m venv DIR` creates a venv holding pip and a copy of this script;
+# everything else (uv, pip installs) just succeeds.
+_FAKE_PYTHON = """#!/bin/sh
+if [ "$1" = "-m" ] && [ "$2" = "venv" ]; then
+    mkdir -p "$3/bin" && cp "$0" "$3/bin/python" && touch "$3/bin/pip"
+fi
+exit 0
+"""
+
+INDEX_URL = "http://127.0.0.1:3141/simple"
+
+
+class TestRequirementsFile(unittest.TestCase):
+    def test_writes_once_per_content_without_leftovers(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            first = install._requirements_file(root, install.SIMPLE_REQUIREMENTS)
+            self.assertEqual(first.read_text(), install.SIMPLE_REQUIREMENTS)
+            self.assertEqual(install._requirements_file(root, install.SIMPLE_REQUIREMENTS), first)
+            self.assertNotEqual(install._requirements_file(root, install.LARGE_REQUIREMENTS), first)
+            # Only the two final files; no partial temp files left behind
+            self.assertEqual(len(list(root.iterdir())), 2)
+
+
+class TestInstallBenchmark(unittest.TestCase):
+    def setUp(self) -> None:
+        self._bindir = tempfile.TemporaryDirectory()
+        self._basedir = tempfile.TemporaryDirectory()
+        self.base_dir = Path(self._basedir.name)
+        bindir = Path(self._bindir.name)
+        paths = {}
+        for name, body in (("uv", "#!/bin/sh\nexit 0\n"), ("pip", "#!/bin/sh\nexit 0\n"), ("python3", _FAKE_PYTHON)):
+            tool = bindir / name
+            tool.write_text(body)
+            tool.chmod(0o755)
+            paths[name] = str(tool)
+        self.config: dict[str, Any] = {
+            "paths": paths,
+            "tools": {"uv": True, "pip": True},
+            "general": {"iterations": 3, "warmup": 1},
+        }
+        # (event, payload) in call order: ("drop", tmp) or ("measure", kwargs)
+        self.events: list[tuple[str, Any]] = []
+        self._originals = (install.measure_command, install._drop_caches)
+        install.measure_command = self._fake_measure
+        install._drop_caches = self._fake_drop_caches
+
+    def tearDown(self) -> None:
+        install.measure_command, install._drop_caches = self._originals
+        self._bindir.cleanup()
+        self._basedir.cleanup()
+
+    def _fake_measure(self, cmd: list[str], **kwargs: Any) -> bench.BenchResult:
+        self.events.append(("measure", {"cmd": list(cmd), **kwargs}))
+        return bench.BenchResult(scenario="", tool="", duration_ms=1.0)
+
+    def _fake_drop_caches(self, paths: list[Path], helper: str = "") -> str:
+        self.events.append(("drop", paths[0]))
+        return "fadvised"
+
+    def _run(self, scenario_config: dict[str, Any] | None = None) -> dict[tuple[str, str], bench.BenchResult]:
+        results = install.install_benchmark(self.config, {"index_url": INDEX_URL, **(scenario_config or {})}, self.base_dir)
+        return {(r.scenario, r.tool): r for r in results}
+
+    def _measured(self) -> dict[str, dict[str, Any]]:
+        """Measure calls keyed by the run directory (e.g. "cold_uv")."""
+        return {Path(kwargs["cwd"]).name: kwargs for event, kwargs in self.events if event == "measure"}
+
+    def test_commands_and_flags_per_phase(self) -> None:
+        results = self._run()
+        self.assertEqual(sorted(results), sorted(
+            (case.scenario, tool) for case in install.INSTALL_CASES for tool in ("uv", "pip")
+        ))
+        measured = self._measured()
+        for case in install.INSTALL_CASES:
+            uv = measured[f"{case.mode}_uv"]["cmd"]
+            self.assertEqual(uv[:4], [self.config["paths"]["uv"], "pip", "install", "-r"])
+            self.assertEqual(Path(uv[4]).name, "requirements.txt")
+            self.assertEqual(uv[5], "--python")
+            self.assertTrue(uv[6].endswith(f"{case.mode}_uv/uv_venv/bin/python"))
+            self.assertEqual(tuple(uv[7:]), case.uv_args)
+            pip = measured[f"{case.mode}_pip"]["cmd"]
+            self.assertTrue(pip[0].endswith(f"{case.mode}_pip/pip_venv/bin/python"))
+            self.assertEqual(pip[1:5], ["-m", "pip", "install", "-r"])
+            self.assertEqual(tuple(pip[6:]), case.pip_args)
+            self.assertEqual(Path(pip[5]).name, "requirements.txt")
+        self.assertEqual(install.INSTALL_CASES[0].uv_args, ("--no-cache",))
+        self.assertEqual(install.INSTALL_CASES[0].pip_args, ("--no-cache-dir",))
+        cold = measured["cold_uv"]
+        self.assertEqual((cold["warmup"], cold["iterations"]), (0, 1))
+        warm = measured["warm_uv"]
+        self.assertEqual((warm["warmup"], warm["iterations"]), (1, 3))
+
+    def test_cache_env_only_for_cached_cases(self) -> None:
+        self._run()
+        cache_root = self.base_dir / ".bench_cache"
+        cache_env = {
+            "UV_INDEX_URL": INDEX_URL, "PIP_INDEX_URL": INDEX_URL,
+            "UV_CACHE_DIR": str(cache_root / "uv"), "PIP_CACHE_DIR": str(cache_root / "pip"),
+        }
+        index_env = {"UV_INDEX_URL": INDEX_URL, "PIP_INDEX_URL": INDEX_URL}
+        for run_dir, kwargs in self._measured().items():
+            expected = index_env if run_dir.startswith("cold_") else cache_env
+            self.assertEqual(kwargs["env"], expected, run_dir)
+
+    def test_only_cold_install_drops_caches(self) -> None:
+        results = self._run()
+        dropped = [tmp.name for event, tmp in self.events if event == "drop"]
+        self.assertEqual(sorted(dropped), ["cold_pip", "cold_uv"])
+        # Each drop happens right before its own measurement
+        for i, (event, payload) in enumerate(self.events):
+            if event == "drop":
+                self.assertEqual(Path(self.events[i + 1][1]["cwd"]), payload)
+        for (scenario, _tool), result in results.items():
+            expected = "fadvised" if scenario == "B2.1_cold_install" else None
+            self.assertEqual(result.metadata.get("fs_cache"), expected)
+
+        self.events.clear()
+        self._run({"clear_fs_cache": False})
+        self.assertFalse([event for event, _ in self.events if event == "drop"])
+
+    def test_pin_cpu_is_ignored_when_tools_run_in_parallel(self) -> None:
+        import contextlib
+        import io
+
+        self.config["general"]["pin_cpu"] = 0
+        self._run()
+        self.assertEqual({kwargs["pin_cpu"] for kwargs in self._measured().values()}, {0})
+
+        self.events.clear()
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            self._run({"parallel_tools": True})
+        # Concurrent uv and pip runs must not share the one pinned CPU
+        self.assertEqual({kwargs["pin_cpu"] for kwargs in self._measured().values()}, {None})
+        self.assertIn("pin_cpu = 0 ignored", out.getvalue())
+
+    def test_dry_run_leaves_bench_cache_untouched(self) -> None:
+        self.config["dry_run"] = True
+        self.assertEqual(self._run(), {})
+        self.assertEqual(self.events, [])
+        self.assertFalse((self.base_dir / ".bench_cache").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import bench
+
+# Load lazy_import module with injected bench exports (mirrors bench.load_scenarios)
+lazy_spec = importlib.util.spec_from_file_location(
+    "scenarios.lazy_import",
+    Path(__file__).resolve().parents[1] / "scenarios" / "lazy_import.py",
+)
+lazy_import = importlib.util.module_from_spec(lazy_spec)  # type: ignore[arg-type]
+lazy_import.scenario = lambda name: (lambda fn: fn)  # noqa: E731
+lazy_import.BenchResult = bench.BenchResult
+lazy_import.find_tool = bench.find_tool
+lazy_import.submit_parallel = bench.submit_parallel
+lazy_import.measure_command = bench.measure_command
+lazy_import.pin_cpu_for = bench.pin_cpu_for
+lazy_spec.loader.exec_module(lazy_import)  # type: ignore[union-attr]
+
+
+IMPORTTIME_STDERR = """\
+import time: self [us] | cumulative [us] | imported package
+import time:       150 |        150 |   _io
+import time:       900 |       1200 | site
+import time:       201 |       7031 | json
+import time:       177 |        177 |       math
+import time:       880 |       1312 |     datetime
+import time:       396 |       6800 | sqlite3
+import time:        50 |         50 | unrelated
+"""
+
+
+class TestParseImporttime(unittest.TestCase):
+    def test_sums_top_level_cumulative_times_of_requested_modules(self) -> None:
+        ms = lazy_import.parse_importtime(IMPORTTIME_STDERR, ["json", "sqlite3", "math"])
+        # math is nested under another import, so it is already in sqlite3's total
+        self.assertAlmostEqual(ms, (7031 + 6800) / 1000)
+
+    def test_counts_parent_packages_of_dotted_modules(self) -> None:
+        stderr = (
+            "import time:       100 |        100 | xml\n"
+            "import time:       200 |        300 | xml.etree\n"
+            "import time:       400 |       1000 | xml.etree.ElementTree\n"
+        )
+        self.assertAlmostEqual(lazy_import.parse_importtime(stderr, ["xml.etree.ElementTree"]), 1.4)
+
+    def test_returns_none_when_nothing_matches(self) -> None:
+        self.assertIsNone(lazy_import.parse_importtime(IMPORTTIME_STDERR, ["os"]))
+        self.assertIsNone(lazy_import.parse_importtime("", ["json"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
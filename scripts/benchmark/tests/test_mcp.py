@@ -1,5 +1,7 @@
 import json
+import os
 import sys
+import time
 import unittest
 from pathlib import Path
 from unittest import mock
@@ -11,33 +13,35 @@ from scenarios import mcp as mcp_scenario
 
 
 mcp_scenario.BenchResult = bench.BenchResult
+mcp_scenario.compute_stats = bench.compute_stats
+mcp_scenario.submit_parallel = bench.submit_parallel
 
 
 class FakeStdout:
     def __init__(self) -> None:
-        self._lines: list[str] = []
+        self._lines: list[bytes] = []
 
     def push(self, line: str) -> None:
         if not line.endswith("\n"):
             line = f"{line}\n"
-        self._lines.append(line)
+        self._lines.append(line.encode())
 
-    def readline(self) -> str:
+    def readline(self) -> bytes:
         if self._lines:
             return self._lines.pop(0)
-        return ""
+        return b""
 
 
 class FakeStdin:
     def __init__(self, process: "FakeProcess") -> None:
         self._process = process
-        self._buffer = ""
+        self._buffer = b""
         self.closed = False
 
-    def write(self, data: str) -> int:
+    def write(self, data: bytes) -> int:
         self._buffer += data
-        while "\n" in self._buffer:
-            line, self._buffer = self._buffer.split("\n", 1)
+        while b"\n" in self._buffer:
+            line, self._buffer = self._buffer.split(b"\n", 1)
             if line.strip():
                 self._process.handle_request(line)
         return len(data)
@@ -60,7 +64,7 @@ class FakeProcess:
         self.closed = False
         self.returncode: int | None = None
 
-    def handle_request(self, line: str) -> None:
+    def handle_request(self, line: bytes) -> None:
         request = json.loads(line)
         self.requests.append(request)
         for response_line in self._response_builder(request):
@@ -102,7 +106,7 @@ class TestMcpScenario(unittest.TestCase):
         self.assertEqual(call_response["id"], 2)
         self.assertEqual([req["method"] for req in fake_process.requests], ["initialize", "tools/call"])
 
-    def test_measure_mcp_tool_uses_one_session_per_sample(self) -> None:
+    def test_measure_mcp_tool_reuses_one_session_across_samples(self) -> None:
         launched_processes: list[FakeProcess] = []
 
         def fake_popen(*args, **kwargs):
@@ -140,12 +144,93 @@ class TestMcpScenario(unittest.TestCase):
             )
 
         self.assertTrue(result.success)
-        self.assertEqual(len(launched_processes), 3)
-        for process in launched_processes:
-            self.assertEqual(
-                [request["method"] for request in process.requests],
-                ["initialize", "tools/call"],
-            )
+        self.assertEqual(result.iterations, 2)
+        self.assertEqual(len(launched_processes), 1)
+        requests = launched_processes[0].requests
+        self.assertEqual(
+            [request["method"] for request in requests],
+            ["initialize", "tools/call", "tools/call", "tools/call"],
+        )
+        self.assertEqual(len({request["id"] for request in requests}), 4)
+
+    def test_measure_mcp_tool_shares_a_session_and_initializes_once(self) -> None:
+        def build_response(request: dict) -> list[str]:
+            result = {"protocolVersion": "2024-11-05"} if request["method"] == "initialize" else {"content": []}
+            return [json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": result})]
+
+        fake_process = FakeProcess(build_response)
+
+        with mock.patch.object(mcp_scenario.subprocess, "Popen", return_value=fake_process) as popen:
+            with mcp_scenario.McpStdioSession("pybun") as session:
+                doctor = mcp_scenario.measure_mcp_tool(
+                    "pybun", "pybun_doctor", {}, iterations=2, warmup=0, session=session
+                )
+                resolve = mcp_scenario.measure_mcp_tool(
+                    "pybun", "pybun_resolve", {}, iterations=2, warmup=0, session=session
+                )
+
+        self.assertEqual(popen.call_count, 1)
+        self.assertTrue(doctor.success and resolve.success)
+        self.assertEqual(doctor.metadata["session"], "shared")
+        methods = [request["method"] for request in fake_process.requests]
+        self.assertEqual(methods, ["initialize"] + ["tools/call"] * 4)
+        self.assertEqual(len({request["id"] for request in fake_process.requests}), 5)
+
+    def test_calls_without_a_response_are_not_timed(self) -> None:
+        fake_process = None
+
+        def build_response(request: dict) -> list[str]:
+            if request["method"] == "initialize":
+                return [json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": {}})]
+            fake_process.returncode = 1  # server dies on the first tool call
+            return []
+
+        fake_process = FakeProcess(build_response)
+
+        with mock.patch.object(mcp_scenario.subprocess, "Popen", return_value=fake_process):
+            result = mcp_scenario.measure_mcp_tool("pybun", "pybun_doctor", {}, iterations=3, warmup=0)
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.iterations, 0)
+        self.assertEqual(result.duration_ms, 0)
+        self.assertEqual(result.error, "No response from MCP server")
+
+    def test_measure_json_parse_times_the_printed_document(self) -> None:
+        script = 'import json; print(json.dumps({"status": "ok", "detail": {"stdout": "test"}}))'
+        parse_ms, output_bytes = mcp_scenario.measure_json_parse([sys.executable, "-c", script], rounds=3)
+        self.assertIsNotNone(parse_ms)
+        self.assertGreater(output_bytes, 0)
+
+        parse_ms, output_bytes = mcp_scenario.measure_json_parse([sys.executable, "-c", "print('plain text')"])
+        self.assertIsNone(parse_ms)
+        self.assertEqual(output_bytes, 0)
+
+    def test_close_tolerates_a_server_that_already_exited(self) -> None:
+        fake_process = FakeProcess(lambda request: [])
+
+        def broken_close() -> None:
+            raise BrokenPipeError(32, "Broken pipe")
+
+        fake_process.stdin.close = broken_close  # type: ignore[method-assign]
+
+        with mock.patch.object(mcp_scenario.subprocess, "Popen", return_value=fake_process):
+            session = mcp_scenario.McpStdioSession("pybun")
+            session.close()
+
+        self.assertEqual(fake_process.returncode, 0)
+
+    def test_call_frames_match_a_serialized_request(self) -> None:
+        call = mcp_scenario._CallFrames("pybun_run", {"code": "print('hi')"})
+        self.assertEqual(
+            json.loads(call.frame(42)),
+            {
+                "jsonrpc": "2.0",
+                "id": 42,
+                "method": "tools/call",
+                "params": {"name": "pybun_run", "arguments": {"code": "print('hi')"}},
+            },
+        )
+        self.assertTrue(call.frame(7).endswith(b"}\n"))
 
     def test_measure_mcp_round_reports_only_tool_call_latency(self) -> None:
         init_response = {"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2024-11-05"}}
@@ -203,6 +288,110 @@ class TestMcpScenario(unittest.TestCase):
         self.assertFalse(result.success)
         self.assertIn("boom", result.error)
 
+    def test_measure_mcp_tool_stops_when_initialize_fails(self) -> None:
+        def build_response(request: dict) -> list[str]:
+            return [json.dumps({"jsonrpc": "2.0", "id": request["id"], "error": {"message": "bad init"}})]
+
+        fake_process = FakeProcess(build_response)
+
+        with mock.patch.object(mcp_scenario.subprocess, "Popen", return_value=fake_process):
+            result = mcp_scenario.measure_mcp_tool("pybun", "pybun_doctor", {}, iterations=3, warmup=1)
+
+        self.assertFalse(result.success)
+        self.assertIn("bad init", result.error)
+        self.assertEqual([request["method"] for request in fake_process.requests], ["initialize"])
+
+    def test_send_pipelined_writes_all_frames_before_reading(self) -> None:
+        def build_response(request: dict) -> list[str]:
+            return [json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": {"content": []}})]
+
+        fake_process = FakeProcess(build_response)
+        writes: list[bytes] = []
+        original_write = fake_process.stdin.write
+
+        def record_write(data: bytes) -> int:
+            writes.append(data)
+            return original_write(data)
+
+        fake_process.stdin.write = record_write  # type: ignore[method-assign]
+
+        with mock.patch.object(mcp_scenario.subprocess, "Popen", return_value=fake_process):
+            with mcp_scenario.McpStdioSession("pybun") as session:
+                requests = [{"jsonrpc": "2.0", "id": i, "method": "tools/call"} for i in range(2, 6)]
+                received, elapsed_ms = session.send_pipelined(requests)
+
+        self.assertEqual(len(writes), 1)
+        self.assertEqual(sorted(received), sorted(mcp_scenario._response_key(i) for i in range(2, 6)))
+        self.assertGreaterEqual(elapsed_ms, 0.0)
+
+    def test_measure_mcp_tool_pipelined_reports_latency_and_throughput(self) -> None:
+        def build_response(request: dict) -> list[str]:
+            result = {"protocolVersion": "2024-11-05"} if request["method"] == "initialize" else {"content": []}
+            return [json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": result})]
+
+        fake_process = FakeProcess(build_response)
+
+        with mock.patch.object(mcp_scenario.subprocess, "Popen", return_value=fake_process):
+            result = mcp_scenario.measure_mcp_tool_pipelined(
+                "pybun", "pybun_doctor", {}, depth=4, iterations=2, warmup=1
+            )
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.iterations, 2)
+        self.assertEqual(len(fake_process.requests), 1 + 4 * 3)
+        self.assertEqual(result.metadata["pipeline_depth"], 4)
+        self.assertIsNotNone(result.metadata["p50_latency_ms"])
+
+    def test_measure_mcp_batch_sends_each_batch_both_ways_over_one_session(self) -> None:
+        launched_processes: list[FakeProcess] = []
+
+        def fake_popen(*args, **kwargs):
+            def build_response(request: dict) -> list[str]:
+                result = {"protocolVersion": "2024-11-05"} if request["method"] == "initialize" else {"content": []}
+                return [json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": result})]
+
+            process = FakeProcess(build_response)
+            launched_processes.append(process)
+            return process
+
+        with mock.patch.object(mcp_scenario.subprocess, "Popen", side_effect=fake_popen):
+            sequential, pipelined = mcp_scenario.measure_mcp_batch(
+                "pybun",
+                "pybun_run",
+                [{"code": f"print({i})"} for i in range(3)],
+                iterations=2,
+                warmup=0,
+            )
+
+        self.assertEqual(len(launched_processes), 1)
+        self.assertEqual(len(launched_processes[0].requests), 1 + 3 * 2 * 2)
+        self.assertTrue(sequential.success)
+        self.assertTrue(pipelined.success)
+        self.assertEqual(sequential.metadata["batch_size"], 3)
+        self.assertEqual(pipelined.metadata["mode"], "pipelined")
+
+    def test_session_frames_lines_split_across_pipe_reads(self) -> None:
+        read_fd, write_fd = os.pipe()
+        fake_process = FakeProcess(lambda request: [])
+        fake_process.stdout = open(read_fd, "rb")  # type: ignore[assignment]
+        self.addCleanup(fake_process.stdout.close)
+
+        with mock.patch.object(mcp_scenario.subprocess, "Popen", return_value=fake_process):
+            session = mcp_scenario.McpStdioSession("pybun")
+            # Noise, one whole response and half of another arrive in one chunk
+            os.write(write_fd, b'server log line\n{"jsonrpc": "2.0", "id": 2, "result": {}}\n{"jsonrpc": "2.0", "id"')
+            os.write(write_fd, b': 1, "result": {}}\n')
+            started = time.perf_counter()
+            first = session._read_response(1, timeout=5)
+            second = session._read_response(2, timeout=5)
+            os.close(write_fd)
+            self.assertIsNone(session._read_response(3, timeout=5))
+            elapsed = time.perf_counter() - started
+
+        self.assertEqual(first["id"], 1)
+        self.assertEqual(second["id"], 2)
+        self.assertLess(elapsed, 1.0)
+
 
 if __name__ == "__main__":
     unittest.main()
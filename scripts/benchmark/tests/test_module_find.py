@@ -0,0 +1,59 @@
+import importlib.util
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import bench
+
+# Load module_find module with injected bench exports (mirrors bench.load_scenarios)
+module_find_spec = importlib.util.spec_from_file_location(
+    "scenarios.module_find",
+    Path(__file__).resolve().parents[1] / "scenarios" / "module_find.py",
+)
+module_find = importlib.util.module_from_spec(module_find_spec)  # type: ignore[arg-type]
+module_find.scenario = lambda name: (lambda fn: fn)  # noqa: E731
+module_find.BenchResult = bench.BenchResult
+module_find.compute_stats = bench.compute_stats
+module_find.find_tool = bench.find_tool
+module_find.submit_parallel = bench.submit_parallel
+module_find.measure_command = bench.measure_command
+module_find_spec.loader.exec_module(module_find)  # type: ignore[union-attr]
+
+
+class TestBatchImports(unittest.TestCase):
+    def test_parse_batch_imports(self) -> None:
+        parsed = module_find.parse_batch_imports("noise\nos:1.50,json:2500.00,missing_mod:-\n")
+        self.assertEqual(parsed, {"os": 0.0015, "json": 2.5, "missing_mod": None})
+        self.assertEqual(module_find.parse_batch_imports(""), {})
+
+    def test_measure_batch_imports_returns_one_result_per_module(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            script = Path(tmp) / "batch_import.py"
+            script.write_text(module_find.BATCH_IMPORT_SCRIPT)
+            modules = ["json", "no_such_module_xyz"]
+            results = module_find.measure_batch_imports(
+                [sys.executable, str(script), ",".join(modules)], modules, warmup=0, iterations=2
+            )
+
+        self.assertTrue(results["json"].success)
+        self.assertEqual(results["json"].iterations, 2)
+        self.assertFalse(results["no_such_module_xyz"].success)
+
+class TestFindInProcess(unittest.TestCase):
+    def test_reads_duration_us_from_json_envelope(self) -> None:
+        script = 'import json; print(json.dumps({"status": "ok", "detail": {"found": True, "duration_us": 250}}))'
+        result = module_find.measure_find_in_process([sys.executable, "-c", script])
+        self.assertTrue(result.success, result.error)
+        self.assertAlmostEqual(result.duration_ms, 0.25)
+
+    def test_missing_duration_is_a_failure(self) -> None:
+        result = module_find.measure_find_in_process([sys.executable, "-c", "print('{}')"])
+        self.assertFalse(result.success)
+        self.assertIn("duration_us", result.error)
+
+
+if __name__ == "__main__":
+    unittest.main()
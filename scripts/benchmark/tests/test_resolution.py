@@ -0,0 +1,104 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import bench
+from scenarios import resolution
+
+# Names bench.load_scenarios injects after import
+resolution.BenchResult = bench.BenchResult
+resolution.find_tool = bench.find_tool
+resolution.is_tool_enabled = bench.is_tool_enabled
+resolution.measure_command = bench.measure_command
+resolution.run_phase = bench.run_phase
+
+
+class TestFixtureDependencies(unittest.TestCase):
+    def test_fixtures_are_parsed_at_import(self) -> None:
+        self.assertEqual(
+            resolution._DEPENDENCIES["conflict"],
+            ["requests>=2.28.0,<2.30.0", "urllib3>=1.26.0,<2.0.0"],
+        )
+        self.assertEqual(len(resolution._DEPENDENCIES["medium"]), 10)
+        self.assertEqual(
+            resolution._REQ_IN_TEXT["conflict"],
+            "requests>=2.28.0,<2.30.0\nurllib3>=1.26.0,<2.0.0",
+        )
+
+
+class TestPoetryPyproject(unittest.TestCase):
+    def test_converts_project_table_to_poetry_dependencies(self) -> None:
+        poetry = resolution.tomllib.loads(resolution._POETRY_PYPROJECT["conflict"])["tool"]["poetry"]
+        self.assertEqual(poetry["name"], "bench-conflict")
+        self.assertEqual(
+            poetry["dependencies"],
+            {"python": ">=3.9", "requests": ">=2.28.0,<2.30.0", "urllib3": ">=1.26.0,<2.0.0"},
+        )
+
+    def test_every_fixture_dependency_is_kept(self) -> None:
+        large = resolution.tomllib.loads(resolution._POETRY_PYPROJECT["large"])
+        self.assertEqual(len(large["tool"]["poetry"]["dependencies"]), len(resolution._DEPENDENCIES["large"]) + 1)
+
+
+class TestResolutionCommand(unittest.TestCase):
+    def test_fills_placeholders_after_tool_path(self) -> None:
+        self.assertEqual(
+            resolution.resolution_command("uv", "/bin/uv", req_in="/tmp/r.in"),
+            ["/bin/uv", "pip", "compile", "/tmp/r.in", "-o", "/dev/null", "--quiet"],
+        )
+        self.assertEqual(
+            resolution.resolution_command("pybun", "pybun", script="s.py"),
+            ["pybun", "lock", "--script", "s.py", "--format=json"],
+        )
+
+
+class TestCachedReResolution(unittest.TestCase):
+    def setUp(self) -> None:
+        self._bindir = tempfile.TemporaryDirectory()
+        pybun = Path(self._bindir.name) / "pybun"
+        pybun.write_text("#!/bin/sh\nexit 0")
+        pybun.chmod(0o755)
+        self.config: dict[str, Any] = {
+            "paths": {"pybun": str(pybun)},
+            "tools": {"uv": False, "pip": False, "poetry": False},
+            "general": {"iterations": 1, "warmup": 0},
+        }
+        self.calls: list[list[str]] = []
+        self._original = resolution.measure_command
+        resolution.measure_command = self._fake_measure
+
+    def tearDown(self) -> None:
+        resolution.measure_command = self._original
+        self._bindir.cleanup()
+
+    def _fake_measure(self, cmd: list[str], **_kwargs: Any) -> bench.BenchResult:
+        self.calls.append(list(cmd))
+        return bench.BenchResult(scenario="", tool="", duration_ms=float(len(self.calls)))
+
+    def _run(self, scenario_config: dict[str, Any]) -> dict[str, bench.BenchResult]:
+        results = resolution.resolution_benchmark(self.config, scenario_config, Path("."))
+        return {r.scenario: r for r in results if r.tool == "pybun"}
+
+    def test_warm_pass_reuses_medium_fixture_result(self) -> None:
+        by_scenario = self._run({"fixtures": ["medium"]})
+        # B1.2, B1.4 and the B1.5 cold pass; the warm pass is not re-run
+        self.assertEqual(len(self.calls), 3)
+        warm = by_scenario["B1.5_cached_warm"]
+        self.assertEqual(warm.duration_ms, by_scenario["B1.2_resolution"].duration_ms)
+        self.assertEqual(warm.metadata["reused_from"], "B1.2_resolution")
+        self.assertNotIn("reused_from", by_scenario["B1.2_resolution"].metadata)
+
+    def test_warm_pass_runs_without_medium_fixture_or_when_disabled(self) -> None:
+        for scenario_config in ({"fixtures": ["small"]}, {"fixtures": ["medium"], "reuse_medium_warm": False}):
+            self.calls.clear()
+            by_scenario = self._run(scenario_config)
+            self.assertEqual(len(self.calls), 4)
+            self.assertNotIn("reused_from", by_scenario["B1.5_cached_warm"].metadata)
+
+
+if __name__ == "__main__":
+    unittest.main()
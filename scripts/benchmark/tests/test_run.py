@@ -36,6 +36,44 @@ class TestRunScenario(unittest.TestCase):
         self.assertTrue(str(script).endswith("fixtures/pep723.py"))
 
 
+class TestClearDir(unittest.TestCase):
+    def test_clears_tree_and_reports_missing(self) -> None:
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            envs = run_scenario.pep723_envs_dir_for(Path(tmpdir))
+            (envs / "env1" / "lib").mkdir(parents=True)
+            (envs / "env1" / "lib" / "mod.pyc").write_bytes(b"")
+            self.assertEqual(run_scenario.clear_pep723_envs(Path(tmpdir)), "cleared")
+            self.assertFalse(envs.exists())
+            self.assertEqual(run_scenario.clear_pep723_envs(Path(tmpdir)), "missing")
+
+
+class TestCachedScript(unittest.TestCase):
+    def test_writes_once_per_content(self) -> None:
+        import tempfile
+        from unittest import mock
+
+        with tempfile.TemporaryDirectory() as tmpdir, mock.patch.dict(os.environ, {"PYBUN_HOME": tmpdir}):
+            first = run_scenario.cached_script("print(1)\n", "simple")
+            self.assertEqual(first.parent, Path(tmpdir) / "bench-scripts")
+            self.assertEqual(first.read_text(), "print(1)\n")
+            mtime = first.stat().st_mtime_ns
+            self.assertEqual(run_scenario.cached_script("print(1)\n", "simple"), first)
+            self.assertEqual(first.stat().st_mtime_ns, mtime)
+            self.assertNotEqual(run_scenario.cached_script("print(2)\n", "simple"), first)
+            self.assertEqual(len(list(first.parent.iterdir())), 2)
+
+    def test_dry_run_writes_nothing(self) -> None:
+        import tempfile
+        from unittest import mock
+
+        with tempfile.TemporaryDirectory() as tmpdir, mock.patch.dict(os.environ, {"PYBUN_HOME": tmpdir}):
+            path = run_scenario.cached_script("print(1)\n", "simple", dry_run=True)
+            self.assertEqual(path.parent, Path(tmpdir) / "bench-scripts")
+            self.assertFalse(path.parent.exists())
+
+
 def _make_fake_binary(path: Path) -> Path:
     path.write_text("#!/bin/sh\nexit 0")
     path.chmod(0o755)
@@ -47,7 +85,8 @@ def _collect_calls(config: dict[str, Any], scenario_config: dict[str, Any], base
     calls: list[dict[str, Any]] = []
 
     def fake_measure(cmd: list[str], warmup: int = 1, iterations: int = 5, timeout: int = 300,
-                     env: dict | None = None, cwd: str | None = None, trim_ratio: float = 0.0) -> bench.BenchResult:
+                     env: dict | None = None, cwd: str | None = None, trim_ratio: float = 0.0,
+                     pre_iter_hook: Any = None) -> bench.BenchResult:
         calls.append({"cmd": list(cmd), "cwd": cwd})
         return bench.BenchResult(
             scenario="",
@@ -56,12 +95,17 @@ def _collect_calls(config: dict[str, Any], scenario_config: dict[str, Any], base
             success=True,
         )
 
+    import tempfile
+    from unittest import mock
+
     original = run_scenario.measure_command
     run_scenario.measure_command = fake_measure
-    try:
-        run_scenario.run_benchmark(config, scenario_config, base_dir)
-    finally:
-        run_scenario.measure_command = original
+    # Keep cached_script's bench-scripts out of the real PyBun cache
+    with tempfile.TemporaryDirectory() as pybun_home, mock.patch.dict(os.environ, {"PYBUN_HOME": pybun_home}):
+        try:
+            run_scenario.run_benchmark(config, scenario_config, base_dir)
+        finally:
+            run_scenario.measure_command = original
 
     return calls
 